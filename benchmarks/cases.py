@@ -0,0 +1,101 @@
+"""
+Benchmark cases for the pipeline scripts and the dashboard's hot paths.
+
+Cases run against the roster workspace in the current directory: the
+pipeline cases read and write its data/, visualizations/ and reports/
+folders, and the dashboard cases load the cleaned roster the pipeline left
+there. Dashboard code is imported from the dashboard package and called
+directly, without a browser or a Streamlit server.
+"""
+
+import os
+import sys
+from collections import namedtuple
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+from age_bins import age_bin_edges, age_histogram
+from filter_index import FilterIndex
+from group_stats import comparison_statistics, country_statistics, position_statistics
+from name_index import NameIndex
+from pipeline import load_stage_function, topological_order
+from player_records import PlayerDirectory
+from roster_summary import RosterSummary
+from similar_players import SimilarPlayers
+from synthetic_stats import generate_stats_batch, generate_synthetic_stats
+
+Case = namedtuple('Case', ['name', 'function', 'repeat'])
+
+QUERY_COUNT = 20
+SINGLE_STATS_PLAYERS = 100
+COMPARE_COUNTRIES = 3
+
+def pipeline_cases():
+    """One case per pipeline stage script, in dependency order.
+
+    Each runs once, since the stages write their outputs.
+    """
+    from run_analysis import PIPELINE_STAGES
+    return [Case(f"scripts.{stage.name}", load_stage_function(stage), 1)
+            for stage in topological_order(PIPELINE_STAGES)]
+
+def dashboard_cases(repeat=3):
+    """Cases for the dashboard's data loading, lookups, tables and chart builders."""
+    from dashboard import country_comparison, data, overview, player_details, player_search
+
+    df, _ = data.build_roster()
+    summary = RosterSummary.from_frame(df)
+    rng = np.random.default_rng(0)
+    sample = rng.choice(len(df), size=min(QUERY_COUNT, len(df)), replace=False)
+    names = df['fullname'].to_numpy()[sample]
+    queries = [name.split()[-1] for name in names]
+    typos = [name[:-2] + name[-1] if len(name) > 3 else name for name in names]
+    countries = summary.counts('country_name').head(COMPARE_COUNTRIES).index.tolist()
+
+    name_index = NameIndex(df['fullname'])
+    name_index.fuzzy_search(typos[0])  # Builds the fuzzy trigram index
+    filter_index = FilterIndex(df, sort_columns=data.RESULT_COLUMNS)
+    directory = PlayerDirectory(df)
+    players = [directory.record(position) for position in sample[:SINGLE_STATS_PLAYERS]]
+    player, stats = players[0], generate_synthetic_stats(players[0])
+    edges = age_bin_edges(*data.AGE_HISTOGRAM_RANGE, data.AGE_HISTOGRAM_BINS)
+    counts = age_histogram(df['age'], edges)
+
+    def advanced_filters():
+        selection = filter_index.select({'country_name': countries, 'gender': ['m']}, {'age': (20, 40)})
+        page_size = player_search.RESULT_PAGE_SIZES[0]
+        page_ids = filter_index.sorted_row_ids(selection, 'age', descending=True)[:page_size]
+        return df.iloc[page_ids][data.RESULT_COLUMNS]
+
+    return [
+        Case("dashboard.load_data", data.build_roster, 1),
+        Case("dashboard.roster_summary", lambda: RosterSummary.from_frame(df), repeat),
+        Case("stats.generate_synthetic_stats", lambda: [generate_synthetic_stats(p) for p in players], repeat),
+        Case("stats.generate_stats_batch", lambda: generate_stats_batch(df), repeat),
+        Case("search.name_index_build", lambda: NameIndex(df['fullname']), 1),
+        Case("search.name_search", lambda: [name_index.search(query) for query in queries], repeat),
+        Case("search.fuzzy_search", lambda: [name_index.fuzzy_search(typo) for typo in typos], repeat),
+        Case("filters.index_build", lambda: FilterIndex(df, sort_columns=data.RESULT_COLUMNS), 1),
+        Case("filters.select_page", advanced_filters, repeat),
+        Case("similar.index_build", lambda: SimilarPlayers(df, generate_stats_batch(df)), 1),
+        Case("tables.country_statistics", lambda: country_statistics(df), repeat),
+        Case("tables.position_statistics", lambda: position_statistics(df), repeat),
+        Case("tables.comparison_statistics", lambda: comparison_statistics(df, countries), repeat),
+        Case("charts.create_overview_stats", lambda: overview.create_overview_stats(df, summary), repeat),
+        Case("charts.create_country_chart", lambda: overview.create_country_chart(summary), repeat),
+        Case("charts.create_continent_pie_chart", lambda: overview.create_continent_pie_chart(summary), repeat),
+        Case("charts.create_age_distribution", lambda: overview.create_age_distribution(counts, edges), repeat),
+        Case("charts.create_batting_style_chart", lambda: overview.create_batting_style_chart(summary), repeat),
+        Case("charts.create_batting_strokes_chart",
+             lambda: player_details.create_batting_strokes_chart(player, stats), repeat),
+        Case("charts.create_stroke_preference_bar_chart",
+             lambda: player_details.create_stroke_preference_bar_chart(player, stats), repeat),
+        Case("charts.create_player_performance_charts",
+             lambda: player_details.create_player_performance_charts(player, stats), repeat),
+        Case("charts.create_comparison_chart",
+             lambda: country_comparison.create_comparison_chart(df, countries), repeat),
+    ]
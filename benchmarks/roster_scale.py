@@ -0,0 +1,30 @@
+"""
+Scale the real roster to benchmark sizes.
+
+A scaled roster stacks copies of the raw roster. Each copy gets fresh ids and
+a numbered suffix on every full name, so the copies stay distinct to the
+cleaning step's duplicate check. The real schema, value distributions,
+missing values and duplicate rate are kept. Copies are appended to the CSV
+one at a time, so memory stays at one roster's worth at any scale.
+"""
+
+import os
+
+from data_store import read_raw_players
+
+def scaled_copy(df, copy, id_step):
+    """The copy-th copy of a raw roster, with shifted ids and suffixed names."""
+    part = df.copy()
+    part['id'] = part['id'] + copy * id_step
+    if copy:
+        part['fullname'] = part['fullname'] + f" {copy}"
+    return part
+
+def write_scaled_roster(path, factor, source=None):
+    """Write the raw roster repeated factor times to a CSV; returns its row count."""
+    df = read_raw_players(source)
+    id_step = int(df['id'].max()) + 1
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    for copy in range(factor):
+        scaled_copy(df, copy, id_step).to_csv(path, mode='w' if copy == 0 else 'a', header=copy == 0, index=False)
+    return len(df) * factor
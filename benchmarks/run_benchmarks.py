@@ -0,0 +1,206 @@
+"""
+Headless benchmark suite for the pipeline scripts and the dashboard.
+
+For every scale a roster that many times the size of the real one is written
+into a temporary workspace, either the real roster stacked that many times
+(see roster_scale.py) or a synthetic roster sampled from its distributions
+(see scripts/synthetic_roster.py). The pipeline stages run there in order, and
+the dashboard's hot paths are timed against the cleaned result. Timings are
+written as JSON and compared with a stored baseline; cases that got slower
+than the threshold allows are reported as regressions and make the run exit
+with status 1. A case that raises is recorded as failed, with its error, and
+the suite carries on with the next one; failed cases also make the run exit
+with status 1. So does a missing baseline, unless --save-baseline is given,
+so a run never passes without having been compared. Timings depend on the
+machine, so each machine that runs the suite saves its own baseline.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+import config
+from cases import dashboard_cases, pipeline_cases
+from data_store import read_raw_players
+from roster_scale import write_scaled_roster
+from synthetic_roster import RosterProfile, write_synthetic_roster
+
+SCALES = [1, 10, 100]
+SUITES = ['all', 'pipeline', 'dashboard']
+ROSTERS = ['scaled', 'synthetic']
+RESULTS_PATH = os.path.join(ROOT, 'benchmarks', 'results.json')
+BASELINE_PATH = os.path.join(ROOT, 'benchmarks', 'baseline.json')
+REGRESSION_THRESHOLD = 0.25  # fraction slower than the baseline that counts as a regression
+MIN_REGRESSION_SECONDS = 0.005  # differences below this are treated as timer noise
+
+def best_time(function, repeat):
+    """Fastest of several runs, in seconds, with the function's output silenced."""
+    times = []
+    for _ in range(repeat):
+        with contextlib.redirect_stdout(io.StringIO()):
+            start_time = time.perf_counter()
+            function()
+            times.append(time.perf_counter() - start_time)
+    return min(times)
+
+def write_roster(path, scale, roster):
+    """Write a roster scale times the size of the real one; returns its row count."""
+    source = os.path.join(ROOT, config.DATA_PATH)
+    if roster == 'synthetic':
+        profile = RosterProfile(read_raw_players(source))
+        return write_synthetic_roster(path, profile.rows * scale, profile)
+    return write_scaled_roster(path, scale, source)
+
+def run_scale(scale, suite, roster='scaled', keep=False):
+    """Build a workspace with a roster scale times the real size and time every case in it."""
+    workspace = tempfile.mkdtemp(prefix=f"benchmark-{scale}x-")
+    rows = write_roster(os.path.join(workspace, config.DATA_PATH), scale, roster)
+    print(f"\n=== {scale}x roster: {rows:,} rows ({workspace}) ===")
+
+    results = []
+    previous_directory = os.getcwd()
+    os.chdir(workspace)
+    try:
+        cases = pipeline_cases()
+        if suite == 'dashboard':
+            # The dashboard reads the cleaned roster, so cleaning always runs
+            cases = cases[:1]
+        for case in cases:
+            results.append(time_case(case, scale, rows, report=suite != 'dashboard'))
+        if suite != 'pipeline':
+            try:
+                cases = dashboard_cases()
+            except Exception as e:
+                # Without the dashboard's fixtures none of its cases can run
+                print(f"{'dashboard cases':<44}{'FAILED':>15}  {type(e).__name__}: {e}")
+                results.append({'name': 'dashboard.setup', 'scale': scale, 'rows': rows, 'seconds': None,
+                                'repeat': 1, 'error': f"{type(e).__name__}: {e}"})
+                cases = []
+            for case in cases:
+                results.append(time_case(case, scale, rows))
+    finally:
+        os.chdir(previous_directory)
+        if not keep:
+            shutil.rmtree(workspace, ignore_errors=True)
+    return [result for result in results if result is not None]
+
+def time_case(case, scale, rows, report=True):
+    """Time one case and print its result; returns None when the result is not reported.
+
+    A case that raises is returned as failed, with seconds set to None and
+    the exception under 'error'.
+    """
+    result = {'name': case.name, 'scale': scale, 'rows': rows, 'seconds': None, 'repeat': case.repeat}
+    try:
+        result['seconds'] = best_time(case.function, case.repeat)
+    except Exception as e:
+        result['error'] = f"{type(e).__name__}: {e}"
+        print(f"{case.name:<44}{'FAILED':>15}  {result['error']}")
+        traceback.print_exc(limit=-3)
+        return result
+    if not report:
+        return None
+    print(f"{case.name:<44}{result['seconds'] * 1000:>12.1f} ms")
+    return result
+
+def failed(result):
+    """True if the case raised instead of completing."""
+    return result['seconds'] is None
+
+def compare(results, baseline, threshold):
+    """Print each case against its baseline timing; returns the regressed cases.
+
+    Failed cases, here or in the baseline, are skipped.
+    """
+    reference = {
+        (entry['name'], entry['scale']): entry['seconds'] for entry in baseline['results'] if not failed(entry)
+    }
+    regressions = []
+    print(f"\n{'Case':<44}{'Scale':>7}{'Time (ms)':>12}{'Baseline (ms)':>15}{'Change':>9}")
+    for result in results:
+        key = (result['name'], result['scale'])
+        if failed(result):
+            print(f"{result['name']:<44}{result['scale']:>6}x{'FAILED':>12}")
+            continue
+        if key not in reference:
+            print(f"{result['name']:<44}{result['scale']:>6}x{result['seconds'] * 1000:>12.1f}{'-':>15}{'new':>9}")
+            continue
+        before, after = reference[key], result['seconds']
+        change = after / before - 1 if before > 0 else 0.0
+        regressed = change > threshold and after - before > MIN_REGRESSION_SECONDS
+        flag = "  REGRESSION" if regressed else ""
+        print(f"{result['name']:<44}{result['scale']:>6}x{after * 1000:>12.1f}{before * 1000:>15.1f}"
+              f"{change:>+9.0%}{flag}")
+        if regressed:
+            regressions.append(result)
+    return regressions
+
+def save_json(data, path):
+    """Write results as indented JSON."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+
+def main():
+    parser = argparse.ArgumentParser(description="Time the pipeline scripts and dashboard hot paths on scaled rosters")
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES,
+                        help=f"roster multiples to benchmark (default: {' '.join(map(str, SCALES))})")
+    parser.add_argument('--suite', choices=SUITES, default='all', help="which cases to run (default: all)")
+    parser.add_argument('--roster', choices=ROSTERS, default='scaled',
+                        help="stack copies of the real roster or sample a synthetic one (default: scaled)")
+    parser.add_argument('--output', default=RESULTS_PATH, help="where to write the JSON results")
+    parser.add_argument('--baseline', default=BASELINE_PATH, help="baseline JSON to compare against")
+    parser.add_argument('--save-baseline', action='store_true', help="store these results as the new baseline")
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f"slowdown that counts as a regression (default: {REGRESSION_THRESHOLD:.0%})")
+    parser.add_argument('--keep', action='store_true', help="keep the scaled workspaces")
+    args = parser.parse_args()
+
+    results = []
+    for scale in args.scales:
+        results.extend(run_scale(scale, args.suite, roster=args.roster, keep=args.keep))
+
+    data = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'roster': args.roster,
+        'results': results
+    }
+    save_json(data, args.output)
+    print(f"\nResults saved to {args.output}")
+    failures = [result for result in results if failed(result)]
+    for result in failures:
+        print(f"FAILED {result['name']} at {result['scale']}x: {result['error']}")
+
+    if args.save_baseline:
+        save_json(data, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 1 if failures else 0
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline} to compare against; run with --save-baseline to create one")
+        return 1
+
+    with open(args.baseline, encoding='utf-8') as f:
+        regressions = compare(results, json.load(f), args.threshold)
+    if regressions:
+        print(f"\n{len(regressions)} case(s) regressed by more than {args.threshold:.0%}")
+    elif not failures:
+        print("\nNo regressions")
+    return 1 if regressions or failures else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+Cold-start benchmark for the dashboard.
+
+Each run starts a fresh interpreter and renders app.py headlessly with
+Streamlit's AppTest. That run opens the Overview page, the default, with
+empty caches, so its duration is the time to first paint of a new server
+process. A second run in the same process shows the warm rerun cost for
+comparison.
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP_PATH = os.path.join(ROOT, 'app.py')
+RUNS = 5
+TIMEOUT_SECONDS = 120
+
+# Runs in the child interpreter; prints its timings as one JSON line
+CHILD = r'''
+import json, sys, time
+start = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+imported = time.perf_counter()
+app = AppTest.from_file(sys.argv[1], default_timeout=float(sys.argv[2]))
+app.run()
+painted = time.perf_counter()
+app.run()
+rerun = time.perf_counter()
+print(json.dumps({
+    'streamlit_import': imported - start,
+    'first_paint': painted - imported,
+    'rerun': rerun - painted,
+    'errors': [str(error.value) for error in app.exception]
+}))
+'''
+
+PHASES = ['process', 'streamlit_import', 'first_paint', 'rerun']
+
+def measure_startup():
+    """Start one fresh interpreter, render the Overview page twice and return the phase timings."""
+    start_time = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, '-c', CHILD, APP_PATH, str(TIMEOUT_SECONDS)],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    timings = json.loads(completed.stdout.strip().splitlines()[-1])
+    timings['process'] = time.perf_counter() - start_time
+    return timings
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the dashboard's cold-start time to first paint")
+    parser.add_argument('--runs', type=int, default=RUNS, help=f"fresh processes to start (default: {RUNS})")
+    parser.add_argument('--output', help="also write the timings of every run as JSON")
+    args = parser.parse_args()
+
+    runs = []
+    print(f"{'Run':<6}" + ''.join(f"{phase:>18}" for phase in PHASES))
+    for number in range(1, args.runs + 1):
+        timings = measure_startup()
+        runs.append(timings)
+        print(f"{number:<6}" + ''.join(f"{timings[phase] * 1000:>15.0f} ms" for phase in PHASES))
+        for error in timings['errors']:
+            print(f"       app raised: {error}")
+
+    medians = {phase: statistics.median(run[phase] for run in runs) for phase in PHASES}
+    print(f"{'median':<6}" + ''.join(f"{medians[phase] * 1000:>15.0f} ms" for phase in PHASES))
+    print(f"\nOverview time to first paint (interpreter start to first render): "
+          f"{(medians['process'] - medians['rerun']) * 1000:.0f} ms")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({'created': datetime.now().isoformat(timespec='seconds'), 'runs': runs, 'median': medians},
+                      f, indent=2)
+        print(f"Timings saved to {args.output}")
+
+if __name__ == "__main__":
+    main()
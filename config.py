@@ -3,13 +3,23 @@
 # Data Settings
 DATA_PATH = "data/all_players.csv"
 CLEANED_DATA_PATH = "data/cleaned_all_players.csv"
+CLEANED_PARQUET_PATH = "data/cleaned_all_players.parquet"
+STATS_TABLE_PATH = "data/synthetic_stats.parquet"
+SUMMARY_PATH = "data/roster_summary.json"
+BUILD_CACHE_PATH = "data/build_cache.json"
 OUTPUT_DIR = "visualizations"
 REPORTS_DIR = "reports"
 
+# Cleaning Settings
+CLEAN_CHUNK_SIZE = 0  # rows per chunk when streaming the raw roster (0 = load it whole)
+CLEAN_DEDUP_MAX_KEYS = 5_000_000  # duplicate keys kept in memory before spilling to disk
+CLEAN_DEDUP_PARTITIONS = 64  # on-disk hash partitions used after spilling
+
 # Analysis Settings
 TOP_N_COUNTRIES = 10
 MIN_AGE = 10
 MAX_AGE = 50
+AGE_BINS = 30  # fixed-width bins between MIN_AGE and MAX_AGE in age histograms
 
 # Visualization Settings
 FIGURE_SIZE_LARGE = (12, 8)
@@ -17,6 +27,11 @@ FIGURE_SIZE_MEDIUM = (10, 6)
 FIGURE_SIZE_SMALL = (8, 6)
 DPI = 300
 COLOR_PALETTE = ['dodgerblue', 'green', 'red', 'orange', 'purple']
+RENDER_WORKERS = 0  # processes used to render charts (0 = one per CPU, 1 = render serially)
+
+# Dashboard Settings
+APP_TIMING = False  # record span timings per rerun (also enabled by CRICKET_TIMING=1)
+TIMING_LOG_PATH = "data/timing_log.jsonl"
 
 # Report Settings
 REPORT_TITLE = "Cricket Players Data Analysis Report"
@@ -0,0 +1,11 @@
+"""
+Pages and shared code of the Streamlit dashboard (app.py).
+
+app.py only imports a page module when its page is first opened, so the
+plotting libraries and the data layer are not loaded before the first paint.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'scripts'))
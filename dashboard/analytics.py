@@ -0,0 +1,416 @@
+"""
+Analytics page: country, age, style, position, stroke, simulation and gender analyses.
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from synthetic_stats import BATTING_STROKES, STROKE_COLUMNS
+
+from dashboard.data import (
+    current_version, get_stats_batch, load_age_quartiles, load_country_statistics, load_position_statistics
+)
+from dashboard.theme import is_dark_theme
+
+def render(df, summary):
+    """Draw the Analytics page."""
+    st.markdown("## 📊 Advanced Analytics")
+    
+    # Analytics options
+    analysis_type = st.selectbox(
+        "Select Analysis:",
+        ["Country Analysis", "Age Analysis", "Playing Style Analysis", "Position Analysis", "Batting Stroke Analysis", "Gameplay Simulation", "Gender Analysis"]
+    )
+    
+    if analysis_type == "Country Analysis":
+        st.markdown("### 🌍 Country Analysis")
+        
+        # Top countries
+        top_n = st.slider("Show top N countries:", 5, 20, 10)
+        top_countries = summary.counts('country_name').head(top_n)
+        
+        fig = px.bar(
+            x=top_countries.index,
+            y=top_countries.values,
+            title=f"Top {top_n} Countries by Player Count",
+            labels={'x': 'Country', 'y': 'Number of Players'}
+        )
+        fig.update_xaxes(tickangle=45)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        # Country details table
+        st.markdown("### 📋 Country Statistics")
+        country_stats = load_country_statistics(current_version())
+        
+        st.dataframe(country_stats.head(20), use_container_width=True)
+    
+    elif analysis_type == "Age Analysis":
+        st.markdown("### 📅 Age Analysis")
+        
+        valid_ages = df[df['age'] > 10]
+        
+        if not valid_ages.empty:
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                st.metric("Youngest Player", f"{valid_ages['age'].min():.1f} years")
+                st.metric("Average Age", f"{valid_ages['age'].mean():.1f} years")
+            
+            with col2:
+                st.metric("Oldest Player", f"{valid_ages['age'].max():.1f} years")
+                st.metric("Median Age", f"{valid_ages['age'].median():.1f} years")
+            
+            # Age distribution by continent, drawn from precomputed quartiles
+            quartiles = load_age_quartiles(current_version())
+            fig = go.Figure([
+                go.Box(
+                    name=str(continent),
+                    q1=[row['q1']], median=[row['median']], q3=[row['q3']], mean=[row['mean']],
+                    lowerfence=[row['lowerfence']], upperfence=[row['upperfence']],
+                    showlegend=False
+                )
+                for continent, row in quartiles.iterrows()
+            ])
+            fig.update_layout(
+                title="Age Distribution by Continent",
+                xaxis_title='continent_name',
+                yaxis_title='age'
+            )
+            st.plotly_chart(fig, use_container_width=True)
+    
+    elif analysis_type == "Playing Style Analysis":
+        st.markdown("### 🏏 Playing Style Analysis")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Batting style distribution
+            batting_counts = summary.counts('battingstyle', missing='Unknown')
+            fig1 = px.pie(
+                values=batting_counts.values,
+                names=batting_counts.index,
+                title="Batting Style Distribution"
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # Bowling style distribution
+            bowling_counts = summary.counts('bowlingstyle', missing='Unknown').head(10)
+            fig2 = px.bar(
+                x=bowling_counts.values,
+                y=bowling_counts.index,
+                orientation='h',
+                title="Top 10 Bowling Styles"
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+    
+    elif analysis_type == "Position Analysis":
+        st.markdown("### 🏏 Position Analysis")
+        
+        # Position distribution
+        position_counts = summary.counts('position')
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig1 = px.pie(
+                values=position_counts.values,
+                names=position_counts.index,
+                title="Player Position Distribution"
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # Position by continent
+            position_continent = summary.crosstab('continent_name', 'position')
+            fig2 = px.bar(
+                position_continent,
+                title="Position Distribution by Continent",
+                labels={'value': 'Number of Players', 'index': 'Continent'}
+            )
+            st.plotly_chart(fig2, use_container_width=True)
+        
+        # Detailed position analysis
+        st.markdown("### 📋 Position Statistics")
+        position_stats = load_position_statistics(current_version())
+        
+        st.dataframe(position_stats, use_container_width=True)
+    
+    elif analysis_type == "Batting Stroke Analysis":
+        st.markdown("### 🏏 Batting Stroke Analysis")
+        st.markdown("*Analysis of preferred batting strokes across different player types*")
+        
+        # Sample analysis across different batting styles
+        batting_styles = summary.counts('battingstyle', missing='Unknown').head(5).index.tolist()
+        
+        if len(batting_styles) > 0:
+            selected_style = st.selectbox(
+                "Select batting style to analyze:",
+                batting_styles
+            )
+            
+            # Get players with selected batting style
+            style_players = df[df['battingstyle'] == selected_style].sample(min(10, len(df[df['battingstyle'] == selected_style])))
+            
+            # Generate stroke analysis data
+            style_stats = get_stats_batch(style_players)
+            stroke_usage = style_stats[[STROKE_COLUMNS[stroke] for stroke in BATTING_STROKES]]
+            stroke_usage.columns = BATTING_STROKES
+            
+            # Calculate average stroke usage for this batting style
+            avg_strokes = stroke_usage.mean().to_dict()
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                # Polar chart for batting style average
+                fig_avg = go.Figure()
+                
+                stroke_names = list(avg_strokes.keys())
+                stroke_values = list(avg_strokes.values())
+                angles = np.linspace(0, 2*np.pi, len(stroke_names), endpoint=False)
+                
+                fig_avg.add_trace(go.Barpolar(
+                    r=stroke_values,
+                    theta=np.degrees(angles),
+                    name=f'{selected_style} Strokes',
+                    marker_color='rgb(34, 139, 34)',
+                    marker_line_color='white',
+                    marker_line_width=2,
+                    opacity=0.8
+                ))
+                
+                fig_avg.update_layout(
+                    title=dict(
+                        text=f"Average Stroke Usage - {selected_style}",
+                        font=dict(size=16, color='#fafafa' if is_dark_theme() else '#262730')
+                    ),
+                    polar=dict(
+                        radialaxis=dict(
+                            visible=True,
+                            range=[0, max(stroke_values) * 1.1],
+                            ticksuffix='%',
+                            tickfont=dict(color='white', size=10, family="Arial Black")  # White text on dark green
+                        ),
+                        angularaxis=dict(
+                            tickfont=dict(size=10, color='white', family="Arial Black"),  # White text on dark green
+                            rotation=90,
+                            direction="clockwise"
+                        ),
+                        bgcolor='rgb(34, 139, 34)'  # Dark green background
+                    ),
+                    showlegend=False,
+                    height=400,
+                    plot_bgcolor='#0e1117' if is_dark_theme() else 'white',
+                    paper_bgcolor='#0e1117' if is_dark_theme() else 'white'
+                )
+                
+                st.plotly_chart(fig_avg, use_container_width=True)
+            
+            with col2:
+                # Bar chart comparison
+                sorted_avg_strokes = dict(sorted(avg_strokes.items(), key=lambda x: x[1], reverse=True))
+                
+                fig_bar = px.bar(
+                    x=list(sorted_avg_strokes.values()),
+                    y=list(sorted_avg_strokes.keys()),
+                    orientation='h',
+                    title=f"Stroke Preferences - {selected_style}",
+                    labels={'x': 'Average Usage (%)', 'y': 'Batting Strokes'},
+                    color=list(sorted_avg_strokes.values()),
+                    color_continuous_scale='Greens'
+                )
+                
+                fig_bar.update_layout(
+                    showlegend=False,
+                    height=400,
+                    title=dict(font=dict(size=16, color='#fafafa' if is_dark_theme() else '#262730')),
+                    xaxis=dict(
+                        title=dict(font=dict(color='#fafafa' if is_dark_theme() else '#262730')), 
+                        tickfont=dict(color='#fafafa' if is_dark_theme() else '#262730')
+                    ),
+                    yaxis=dict(
+                        categoryorder='total ascending',
+                        title=dict(font=dict(color='#fafafa' if is_dark_theme() else '#262730')), 
+                        tickfont=dict(color='#fafafa' if is_dark_theme() else '#262730')
+                    ),
+                    plot_bgcolor='#0e1117' if is_dark_theme() else 'white',
+                    paper_bgcolor='#0e1117' if is_dark_theme() else 'white'
+                )
+                
+                st.plotly_chart(fig_bar, use_container_width=True)
+            
+            # Stroke usage statistics table
+            st.markdown("### 📊 Stroke Usage Statistics")
+            
+            stroke_stats_df = pd.DataFrame({
+                'Stroke': list(avg_strokes.keys()),
+                'Average Usage (%)': [round(val, 1) for val in avg_strokes.values()],
+                'Min Usage (%)': [round(stroke_usage[stroke].min(), 1) for stroke in avg_strokes.keys()],
+                'Max Usage (%)': [round(stroke_usage[stroke].max(), 1) for stroke in avg_strokes.keys()]
+            })
+            
+            stroke_stats_df = stroke_stats_df.sort_values('Average Usage (%)', ascending=False)
+            st.dataframe(stroke_stats_df, use_container_width=True)
+            
+            # Top signature shots for this batting style
+            top_3_strokes = list(sorted_avg_strokes.keys())[:3]
+            
+            st.markdown(f"### 🎯 Signature Shots for {selected_style}")
+            cols = st.columns(3)
+            
+            for i, stroke in enumerate(top_3_strokes):
+                with cols[i]:
+                    st.metric(
+                        label=f"#{i+1} Most Used",
+                        value=stroke,
+                        delta=f"{sorted_avg_strokes[stroke]:.1f}% avg usage"
+                    )
+        
+        else:
+            st.info("No batting style data available for analysis.")
+    
+    elif analysis_type == "Gameplay Simulation":
+        st.markdown("### 🎮 Gameplay Simulation & Performance Analysis")
+        st.info("📊 **Demo Feature:** This section demonstrates sports analytics capabilities using synthetically generated performance data for educational purposes.")
+        st.markdown("*This section uses synthetic data to demonstrate gameplay analytics*")
+        
+        # Select a random sample of players for simulation
+        sample_size = st.slider("Number of players to simulate:", 5, 2000, 20)
+        sample_players = df.sample(n=min(sample_size, len(df)))
+        
+        # Generate performance data for sample
+        stats = get_stats_batch(sample_players)
+        performance_df = pd.DataFrame({
+            'Player': sample_players['fullname'],
+            'Country': sample_players['country_name'],
+            'Position': sample_players['position'],
+            'Matches': stats['matches'],
+            'Runs': stats['runs'],
+            'Batting_Avg': stats['batting_avg'],
+            'Strike_Rate': stats['strike_rate'],
+            'Wickets': stats['wickets'],
+            'Bowling_Avg': stats['bowling_avg'],
+            'Economy_Rate': stats['economy_rate'],
+            'Catches': stats['catches']
+        }).reset_index(drop=True)
+        
+        # Performance analysis charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Batting performance scatter
+            fig1 = px.scatter(
+                performance_df,
+                x='Batting_Avg',
+                y='Strike_Rate',
+                size='Runs',
+                color='Position',
+                hover_name='Player',
+                title="Batting Performance Analysis",
+                labels={'Batting_Avg': 'Batting Average', 'Strike_Rate': 'Strike Rate'}
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # Bowling performance scatter
+            bowling_players = performance_df[performance_df['Wickets'] > 0]
+            if not bowling_players.empty:
+                fig2 = px.scatter(
+                    bowling_players,
+                    x='Bowling_Avg',
+                    y='Economy_Rate',
+                    size='Wickets',
+                    color='Position',
+                    hover_name='Player',
+                    title="Bowling Performance Analysis",
+                    labels={'Bowling_Avg': 'Bowling Average', 'Economy_Rate': 'Economy Rate'}
+                )
+                st.plotly_chart(fig2, use_container_width=True)
+            else:
+                st.info("No bowling data available for selected players")
+        
+        # Performance leaderboards
+        st.markdown("### 🏆 Performance Leaderboards")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            st.markdown("#### Top Batsmen (by Runs)")
+            top_batsmen = performance_df.nlargest(5, 'Runs')[['Player', 'Runs', 'Batting_Avg']]
+            st.dataframe(top_batsmen, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### Top Bowlers (by Wickets)")
+            top_bowlers = performance_df.nlargest(5, 'Wickets')[['Player', 'Wickets', 'Bowling_Avg']]
+            st.dataframe(top_bowlers, use_container_width=True)
+        
+        with col3:
+            st.markdown("#### Most Experienced")
+            top_experienced = performance_df.nlargest(5, 'Matches')[['Player', 'Matches', 'Position']]
+            st.dataframe(top_experienced, use_container_width=True)
+        
+        # Team formation simulator
+        st.markdown("---")
+        st.markdown("### 🏏 Dream Team Simulator")
+        
+        if st.button("Generate Random Dream Team"):
+            # Select balanced team
+            batsmen = performance_df[performance_df['Position'].str.contains('Batsman', na=False)].nlargest(4, 'Batting_Avg')
+            bowlers = performance_df[performance_df['Position'].str.contains('Bowler', na=False)].nlargest(4, 'Wickets')
+            allrounders = performance_df[performance_df['Position'].str.contains('Allrounder', na=False)].nlargest(2, 'Runs')
+            wicketkeeper = performance_df[performance_df['Position'].str.contains('Wicketkeeper', na=False)].nlargest(1, 'Catches')
+            
+            dream_team = pd.concat([batsmen, bowlers, allrounders, wicketkeeper]).head(11)
+            
+            if not dream_team.empty:
+                st.markdown("#### 🌟 Your Dream Team")
+                team_display = dream_team[['Player', 'Country', 'Position', 'Runs', 'Wickets']].reset_index(drop=True)
+                team_display.index = team_display.index + 1
+                st.dataframe(team_display, use_container_width=True)
+                
+                # Team stats
+                col1, col2, col3 = st.columns(3)
+                with col1:
+                    st.metric("Total Team Runs", f"{dream_team['Runs'].sum():,}")
+                with col2:
+                    st.metric("Total Team Wickets", f"{dream_team['Wickets'].sum()}")
+                with col3:
+                    st.metric("Countries Represented", f"{dream_team['Country'].nunique()}")
+    
+    elif analysis_type == "Gender Analysis":
+        st.markdown("### ⚧ Gender Analysis")
+        
+        gender_counts = summary.counts('gender')
+        total_players = summary.rows
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            male_count = gender_counts.get('m', 0)
+            st.metric("Male Players", f"{male_count:,}")
+            st.metric("Male %", f"{male_count/total_players*100:.1f}%")
+        
+        with col2:
+            female_count = gender_counts.get('f', 0)
+            st.metric("Female Players", f"{female_count:,}")
+            st.metric("Female %", f"{female_count/total_players*100:.1f}%")
+        
+        with col3:
+            st.metric("Total Players", f"{total_players:,}")
+            ratio = male_count / female_count if female_count > 0 else 0
+            st.metric("Male:Female Ratio", f"{ratio:.1f}:1")
+        
+        # Gender by continent
+        gender_continent = summary.crosstab('continent_name', 'gender')
+        gender_continent_pct = gender_continent.div(gender_continent.sum(axis=1), axis=0) * 100
+        
+        fig = px.bar(
+            gender_continent_pct,
+            title="Gender Distribution by Continent (%)",
+            labels={'value': 'Percentage', 'index': 'Continent'}
+        )
+        st.plotly_chart(fig, use_container_width=True)
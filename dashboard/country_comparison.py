@@ -0,0 +1,74 @@
+"""
+Country Comparison page: side-by-side statistics of selected countries.
+"""
+
+import plotly.express as px
+import streamlit as st
+
+from timing import timed
+
+from dashboard.data import current_version, load_comparison_statistics
+
+@timed
+def create_comparison_chart(df, selected_countries):
+    """Create comparison chart for selected countries."""
+    if len(selected_countries) < 2:
+        return None
+    
+    country_data = df[df['country_name'].isin(selected_countries)]
+    
+    # Gender distribution by country
+    gender_data = country_data.groupby(['country_name', 'gender'], observed=True).size().unstack(fill_value=0)
+    
+    fig = px.bar(
+        gender_data,
+        title=f"Gender Distribution Comparison: {', '.join(selected_countries)}",
+        labels={'value': 'Number of Players', 'index': 'Country'},
+        color_discrete_map={'m': '#1f77b4', 'f': '#ff7f0e'}
+    )
+    
+    return fig
+
+def render(df, summary):
+    """Draw the Country Comparison page."""
+    st.markdown("## 🔍 Country Comparison")
+    
+    # Select countries to compare
+    countries_to_compare = st.multiselect(
+        "Select countries to compare:",
+        sorted(df['country_name'].unique()),
+        default=['India', 'England', 'Australia'][:min(3, summary.nunique('country_name'))]
+    )
+    
+    if len(countries_to_compare) >= 2:
+        comparison_data = df[df['country_name'].isin(countries_to_compare)]
+        
+        # Summary stats
+        st.markdown("### 📊 Comparison Summary")
+        summary_stats = load_comparison_statistics(current_version(), tuple(countries_to_compare))
+        
+        st.dataframe(summary_stats, use_container_width=True)
+        
+        # Comparison charts
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            # Player count comparison
+            player_counts = comparison_data['country_name'].value_counts()
+            player_counts = player_counts[player_counts > 0]
+            fig1 = px.bar(
+                x=player_counts.index,
+                y=player_counts.values,
+                title="Player Count Comparison",
+                labels={'x': 'Country', 'y': 'Number of Players'}
+            )
+            st.plotly_chart(fig1, use_container_width=True)
+        
+        with col2:
+            # Gender comparison
+            fig2 = create_comparison_chart(df, countries_to_compare)
+            if fig2:
+                st.plotly_chart(fig2, use_container_width=True)
+    
+    else:
+        st.info("Please select at least 2 countries to compare.")
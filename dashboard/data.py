@@ -0,0 +1,235 @@
+"""
+Data loading and cached lookups shared by the dashboard's pages.
+
+Everything here is cached per data version (see data_store.data_version), so
+a page that needs the roster, its summary, an index or a statistics table
+pays for it at most once per version. Only the VERSIONS_KEPT most recent
+versions stay cached.
+"""
+
+import hashlib
+from collections import namedtuple
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from synthetic_stats import generate_stats_batch, generate_synthetic_stats
+from stats_table import MISSING_LABEL, lookup_player_stats, lookup_stats, read_stats_table
+from data_store import compact_frame, data_version, fill_missing, load_players
+from roster_summary import load_summary
+from name_index import NameIndex
+from filter_index import FilterIndex
+from similar_players import SimilarPlayers
+from group_stats import comparison_statistics, country_statistics, position_statistics
+from figure_cache import FigureCache
+from player_records import PlayerDirectory
+from timing import timed
+from age_bins import age_bin_edges, age_histogram, age_quartiles
+
+from dashboard.theme import is_dark_theme
+
+# Data versions whose roster and indexes stay cached, so reruns that started
+# before a new version was published can finish on the old one
+VERSIONS_KEPT = 2
+
+# Country selections whose comparison table stays cached per data version
+COMPARISONS_PER_VERSION = 16
+
+# Number of serialized figures kept by the figure cache
+FIGURE_CACHE_SIZE = 32
+
+# Age range and number of fixed-width bins of the age distribution chart
+AGE_HISTOGRAM_RANGE = (10, 60)
+AGE_HISTOGRAM_BINS = 25
+
+# Columns of the Advanced Filters results table
+RESULT_COLUMNS = ['fullname', 'country_name', 'continent_name', 'gender', 'age', 'position', 'battingstyle', 'bowlingstyle']
+
+@timed
+def build_roster():
+    """Load the cricket players data in compact dtypes.
+    
+    Returns the frame and its memory usage in bytes before and after
+    compaction.
+    """
+    try:
+        df = load_players()
+        loaded_bytes = int(df.memory_usage(deep=True).sum())
+        
+        # Calculate age from the pre-parsed date of birth, which is then dropped
+        current_date = datetime.now()
+        df['age'] = ((current_date - df['dateofbirth_clean']).dt.days / 365.25).round(1)
+        df = df.drop(columns=['dateofbirth_clean'])
+        
+        # Clean up missing values
+        df['battingstyle'] = fill_missing(df['battingstyle'], MISSING_LABEL)
+        df['bowlingstyle'] = fill_missing(df['bowlingstyle'], MISSING_LABEL)
+        df['age'] = df['age'].fillna(0).astype(np.float32)
+        
+        df = compact_frame(df)
+        return df, {'loaded': loaded_bytes, 'compact': int(df.memory_usage(deep=True).sum())}
+    except Exception as e:
+        st.error(f"Error loading data: {e}")
+        return pd.DataFrame(), {'loaded': 0, 'compact': 0}
+
+# A loaded roster: the frame, the data version it was read from, when it was
+# loaded and its memory usage in bytes before and after compaction
+Roster = namedtuple('Roster', ['frame', 'version', 'loaded_at', 'memory'])
+
+def pin_data_version():
+    """Fix the data version for the rest of this rerun and return it.
+    
+    A rerun keeps reading the version it started with, so a roster published
+    by the pipeline mid-rerun is only picked up, whole, by the next rerun.
+    """
+    version = data_version()
+    st.session_state['data_version'] = version
+    return version
+
+def current_version():
+    """The data version pinned for this rerun, or the one on disk outside a rerun."""
+    return st.session_state.get('data_version') or data_version()
+
+def version_label(version):
+    """Short identifier of a data version for display."""
+    return hashlib.sha1(version.encode('utf-8')).hexdigest()[:8]
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_roster(version):
+    """Load the roster of one data version, shared by every session.
+    
+    Callers must treat the frame as read-only.
+    """
+    df, memory = build_roster()
+    return Roster(df, version, datetime.now(), memory)
+
+def current_roster():
+    """The shared roster of this rerun's data version."""
+    return load_roster(current_version())
+
+@timed
+def load_data():
+    """Load and cache the cricket players data."""
+    return current_roster().frame
+
+@st.cache_resource
+def load_figure_cache():
+    """Figure cache shared by every session."""
+    return FigureCache(FIGURE_CACHE_SIZE)
+
+def cached_figure(name, build, *params):
+    """Build a chart once per data version, theme and chart parameters."""
+    key = (name, current_version(), is_dark_theme()) + params
+    return load_figure_cache().get(key, build)
+
+@st.cache_data(max_entries=VERSIONS_KEPT)
+def load_roster_summary(version):
+    """Load the roster's summary tables, computed at most once per data version."""
+    return load_summary(load_data())
+
+@st.cache_data(max_entries=VERSIONS_KEPT)
+def load_country_statistics(version):
+    """Country Statistics table, computed once per data version."""
+    return country_statistics(load_data())
+
+@st.cache_data(max_entries=VERSIONS_KEPT)
+def load_position_statistics(version):
+    """Position Statistics table, computed once per data version."""
+    return position_statistics(load_data())
+
+@st.cache_data(max_entries=VERSIONS_KEPT * COMPARISONS_PER_VERSION)
+def load_comparison_statistics(version, countries):
+    """Country Comparison table, computed once per data version and country selection."""
+    return comparison_statistics(load_data(), list(countries))
+
+@st.cache_data(max_entries=VERSIONS_KEPT)
+def load_age_histogram(version):
+    """Player counts per age bin and the bin edges, computed once per data version."""
+    low, high = AGE_HISTOGRAM_RANGE
+    ages = load_data()['age']
+    edges = age_bin_edges(low, high, AGE_HISTOGRAM_BINS)
+    return age_histogram(ages[(ages > low) & (ages < high)], edges), edges
+
+@st.cache_data(max_entries=VERSIONS_KEPT)
+def load_age_quartiles(version):
+    """Box plot statistics of known ages per continent, computed once per data version."""
+    df = load_data()
+    valid_ages = df[df['age'] > 10]
+    return age_quartiles(valid_ages['age'], valid_ages['continent_name'])
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_name_index(version):
+    """Build the player name search index once per data version.
+    
+    Positions refer to the rows of load_data(). Cached as a shared resource,
+    so callers must treat it as read-only.
+    """
+    return NameIndex(load_data()['fullname'])
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_player_directory(version):
+    """Build the id -> player record lookup once per data version.
+    
+    Row positions refer to the rows of load_data(). Cached as a shared
+    resource, so callers must treat it as read-only.
+    """
+    return PlayerDirectory(load_data())
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_country_player_ids(version):
+    """Partition the player ids by country once per data version.
+    
+    Cached as a shared resource, so callers must treat it as read-only.
+    """
+    df = load_data()
+    ids = df['id'].to_numpy()
+    groups = df.groupby('country_name', observed=True).indices
+    return {country: ids[positions] for country, positions in groups.items()}
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_filter_index(version):
+    """Build the Advanced Filters bitmap index once per data version.
+    
+    Row ids refer to the rows of load_data(). Cached as a shared resource,
+    so callers must treat it as read-only.
+    """
+    return FilterIndex(load_data(), sort_columns=RESULT_COLUMNS)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_similarity_index(version):
+    """Build the similar-player index once per data version.
+    
+    Row positions refer to the rows of load_data(). Cached as a shared
+    resource, so callers must treat it as read-only.
+    """
+    df = load_data()
+    return SimilarPlayers(df, get_stats_batch(df))
+
+@st.cache_resource(max_entries=VERSIONS_KEPT)
+def load_stats_table(version):
+    """Load the precomputed synthetic stats table indexed by player id, once per data version.
+    
+    Cached as a shared resource, so callers must treat it as read-only.
+    """
+    table = read_stats_table()
+    if table is None:
+        return None
+    return table.set_index('id')
+
+@timed
+def get_player_stats(player_data):
+    """Look up a player's synthetic stats, generating them if the table is unavailable."""
+    table = load_stats_table(current_version())
+    if table is None:
+        return generate_synthetic_stats(player_data)
+    return lookup_player_stats(table, player_data)
+
+@timed
+def get_stats_batch(players):
+    """Look up synthetic stats for many players, generating them if the table is unavailable."""
+    table = load_stats_table(current_version())
+    if table is None:
+        return generate_stats_batch(players)
+    return lookup_stats(table, players)
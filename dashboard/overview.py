@@ -0,0 +1,133 @@
+"""
+Overview page: headline numbers and the roster's distribution charts.
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from timing import timed
+
+from dashboard.data import cached_figure, current_version, load_age_histogram
+from dashboard.theme import apply_chart_styling, apply_dark_theme_to_chart
+
+@timed
+def create_overview_stats(df, summary):
+    """Create overview statistics."""
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("📊 Total Players", f"{summary.rows:,}")
+    
+    with col2:
+        st.metric("🌍 Countries", summary.nunique('country_name'))
+    
+    with col3:
+        st.metric("🏏 Continents", summary.nunique('continent_name'))
+    
+    with col4:
+        avg_age = df[df['age'] > 0]['age'].mean()
+        st.metric("📅 Average Age", f"{avg_age:.1f}" if not pd.isna(avg_age) else "N/A")
+
+@timed
+def create_country_chart(summary):
+    """Create interactive country distribution chart."""
+    country_counts = summary.counts('country_name').head(15)
+    
+    fig = px.bar(
+        x=country_counts.values,
+        y=country_counts.index,
+        orientation='h',
+        title="Top 15 Countries by Player Count",
+        labels={'x': 'Number of Players', 'y': 'Country'},
+        color=country_counts.values,
+        color_continuous_scale='viridis'
+    )
+    fig.update_layout(height=500, showlegend=False)
+    fig = apply_chart_styling(fig)
+    return fig
+
+@timed
+def create_continent_pie_chart(summary):
+    """Create continent distribution pie chart."""
+    continent_counts = summary.counts('continent_name')
+    
+    fig = px.pie(
+        values=continent_counts.values,
+        names=continent_counts.index,
+        title="Player Distribution by Continent",
+        color_discrete_sequence=['#238636', '#1f77b4', '#ff7f0e', '#d62728', '#9467bd', '#8c564b']
+    )
+    fig.update_traces(textposition='inside', textinfo='percent+label')
+    fig = apply_dark_theme_to_chart(fig)
+    return fig
+
+@timed
+def create_age_distribution(counts, edges):
+    """Create age distribution histogram from pre-binned counts."""
+    if counts.sum() > 0:
+        fig = go.Figure(go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
+            marker_color='#238636'
+        ))
+        fig.update_layout(
+            title="Age Distribution of Players",
+            xaxis_title='Age (years)',
+            yaxis_title='Number of Players',
+            bargap=0,
+            showlegend=False
+        )
+        fig = apply_dark_theme_to_chart(fig)
+        return fig
+    return None
+
+@timed
+def create_batting_style_chart(summary):
+    """Create batting style distribution chart."""
+    batting_counts = summary.counts('battingstyle', missing='Unknown')
+    
+    fig = px.bar(
+        x=batting_counts.index,
+        y=batting_counts.values,
+        title="Batting Style Distribution",
+        labels={'x': 'Batting Style', 'y': 'Number of Players'},
+        color=batting_counts.values,
+        color_continuous_scale='blues'
+    )
+    fig.update_layout(showlegend=False)
+    return fig
+
+def render(df, summary):
+    """Draw the Overview page."""
+    st.markdown("## 📈 Dataset Overview")
+    
+    # Overview stats
+    create_overview_stats(df, summary)
+    st.markdown("---")
+    
+    # Charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        fig1 = cached_figure('country_chart', lambda: create_country_chart(summary))
+        st.plotly_chart(fig1, use_container_width=True)
+    
+    with col2:
+        fig2 = cached_figure('continent_pie_chart', lambda: create_continent_pie_chart(summary))
+        st.plotly_chart(fig2, use_container_width=True)
+    
+    # Additional charts
+    col3, col4 = st.columns(2)
+    
+    with col3:
+        fig3 = cached_figure('age_distribution', lambda: create_age_distribution(*load_age_histogram(current_version())))
+        if fig3:
+            st.plotly_chart(fig3, use_container_width=True)
+    
+    with col4:
+        fig4 = cached_figure('batting_style_chart', lambda: create_batting_style_chart(summary))
+        st.plotly_chart(fig4, use_container_width=True)
@@ -0,0 +1,380 @@
+"""
+Player detail view: profile, synthetic stats, stroke charts and similar players.
+"""
+
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from timing import timed
+
+from dashboard.data import current_version, get_player_stats, get_stats_batch, load_data, load_similarity_index
+from dashboard.theme import is_dark_theme
+
+# Number of nearest players shown in the player comparison
+SIMILAR_PLAYERS = 5
+
+@timed
+def create_batting_strokes_chart(player_data, stats):
+    """Create batting strokes analysis chart similar to cricket field diagram."""
+    
+    strokes = stats['batting_strokes']
+    stroke_names = list(strokes.keys())
+    stroke_percentages = list(strokes.values())
+    
+    # Create a polar bar chart to simulate the cricket field diagram
+    fig = go.Figure()
+    
+    # Calculate angles for each stroke (360 degrees divided by number of strokes)
+    angles = np.linspace(0, 2*np.pi, len(stroke_names), endpoint=False)
+    
+    # Add the polar bar chart
+    fig.add_trace(go.Barpolar(
+        r=stroke_percentages,
+        theta=np.degrees(angles),
+        name='Batting Strokes',
+        marker_color='rgb(34, 139, 34)',  # Forest green like cricket field
+        marker_line_color='white',
+        marker_line_width=2,
+        opacity=0.8
+    ))
+    
+    # Customize the layout to look like cricket field
+    title_color = '#fafafa' if is_dark_theme() else '#262730'
+    bg_color = '#0e1117' if is_dark_theme() else '#ffffff'
+    
+    fig.update_layout(
+        title=dict(
+            text=f"🏏 Batting Stroke Analysis - {player_data.fullname}",
+            font=dict(size=16, color=title_color, family="Arial Black")
+        ),
+        font=dict(size=12, color=title_color),
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, max(stroke_percentages) * 1.1],
+                ticksuffix='%',
+                gridcolor='white',
+                gridwidth=2,
+                tickfont=dict(color='white', size=10, family="Arial Black")  # White text on dark green
+            ),
+            angularaxis=dict(
+                tickfont=dict(size=11, color='white', family="Arial Black"),  # White text on dark green
+                rotation=90,  # Rotate to match cricket field orientation
+                direction="clockwise"
+            ),
+            bgcolor='rgb(34, 139, 34)',  # Dark green background like cricket field
+        ),
+        showlegend=False,
+        height=500,
+        plot_bgcolor=bg_color,  # Theme-aware background
+        paper_bgcolor=bg_color  # Theme-aware background
+    )
+    
+    # Add text annotations for stroke names
+    for i, (stroke, percentage) in enumerate(strokes.items()):
+        angle_deg = np.degrees(angles[i])
+        fig.add_annotation(
+            x=0.5 + 0.35 * np.cos(angles[i]),
+            y=0.5 + 0.35 * np.sin(angles[i]),
+            text=f"<b>{stroke}</b><br>{percentage}%",
+            showarrow=False,
+            font=dict(size=10, color='white', family="Arial Black"),  # White text
+            bgcolor='rgba(0,0,0,0.9)',  # Very dark background for high contrast
+            bordercolor='white',
+            borderwidth=2,
+            xref="paper",
+            yref="paper",
+            borderpad=4
+        )
+    
+    return fig
+
+@timed
+def create_stroke_preference_bar_chart(player_data, stats):
+    """Create a horizontal bar chart for stroke preferences."""
+    
+    strokes = stats['batting_strokes']
+    sorted_strokes = dict(sorted(strokes.items(), key=lambda x: x[1], reverse=True))
+    
+    fig = px.bar(
+        x=list(sorted_strokes.values()),
+        y=list(sorted_strokes.keys()),
+        orientation='h',
+        title=f"Favorite Batting Strokes - {player_data.fullname}",
+        labels={'x': 'Usage Percentage (%)', 'y': 'Batting Strokes'},
+        color=list(sorted_strokes.values()),
+        color_continuous_scale='Greens'
+    )
+    
+    fig.update_layout(
+        showlegend=False,
+        height=400,
+        title=dict(font=dict(size=16, color='#fafafa' if is_dark_theme() else '#262730')),
+        xaxis=dict(
+            title=dict(font=dict(color='#fafafa' if is_dark_theme() else '#262730')), 
+            tickfont=dict(color='#fafafa' if is_dark_theme() else '#262730')
+        ),
+        yaxis=dict(
+            categoryorder='total ascending',
+            title=dict(font=dict(color='#fafafa' if is_dark_theme() else '#262730')), 
+            tickfont=dict(color='#fafafa' if is_dark_theme() else '#262730')
+        ),
+        plot_bgcolor='#0e1117' if is_dark_theme() else 'white',
+        paper_bgcolor='#0e1117' if is_dark_theme() else 'white'
+    )
+    
+    return fig
+
+@timed
+def create_player_performance_charts(player_data, stats):
+    """Create interactive charts for player performance."""
+    
+    # Performance radar chart
+    categories = ['Batting Avg', 'Strike Rate', 'Bowling Avg', 'Economy Rate', 'Catches']
+    
+    # Normalize values for radar chart (0-100 scale)
+    batting_avg_norm = min(stats['batting_avg'] * 2, 100)
+    strike_rate_norm = min(stats['strike_rate'] * 0.8, 100)
+    bowling_avg_norm = max(100 - stats['bowling_avg'] * 2, 0)  # Lower is better
+    economy_norm = max(100 - stats['economy_rate'] * 10, 0)  # Lower is better
+    catches_norm = min(stats['catches'] * 2, 100)
+    
+    values = [batting_avg_norm, strike_rate_norm, bowling_avg_norm, economy_norm, catches_norm]
+    
+    fig_radar = go.Figure()
+    fig_radar.add_trace(go.Scatterpolar(
+        r=values,
+        theta=categories,
+        fill='toself',
+        name=player_data.fullname,
+        line_color='rgb(31, 119, 180)',
+        fillcolor='rgba(31, 119, 180, 0.3)'
+    ))
+    
+    fig_radar.update_layout(
+        polar=dict(
+            radialaxis=dict(
+                visible=True,
+                range=[0, 100]
+            )),
+        showlegend=True,
+        title=f"Performance Radar - {player_data.fullname}"
+    )
+    
+    # Career progression chart (synthetic data)
+    years = list(range(2015, 2025))
+    rng = np.random.default_rng(int(player_data.id))
+    
+    if stats['runs'] > 500:  # Only for players with significant batting
+        yearly_runs = []
+        base_runs = stats['runs'] // len(years)
+        for i, year in enumerate(years):
+            variation = rng.uniform(0.7, 1.3)
+            career_progression = 1 + (i * 0.1) if i < 6 else 1.5 - ((i-6) * 0.1)
+            runs_year = int(base_runs * variation * career_progression)
+            yearly_runs.append(max(runs_year, 0))
+        
+        fig_progression = px.line(
+            x=years,
+            y=yearly_runs,
+            title=f"Career Runs Progression - {player_data.fullname}",
+            labels={'x': 'Year', 'y': 'Runs Scored'},
+            markers=True
+        )
+        fig_progression.update_traces(line_color='rgb(31, 119, 180)', line_width=3)
+        
+        return fig_radar, fig_progression
+    
+    return fig_radar, None
+
+@timed
+def display_player_details(player_data):
+    """Display detailed information for a player record."""
+    
+    st.markdown(f"""
+    <div class="player-card">
+        <h2>🏏 {player_data.fullname}</h2>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Generate synthetic stats for gameplay demonstration
+    stats = get_player_stats(player_data)
+    
+    # Player basic info
+    col1, col2, col3 = st.columns(3)
+    
+    with col1:
+        st.markdown("### 📋 Basic Information")
+        st.write(f"**Full Name:** {player_data.fullname}")
+        st.write(f"**First Name:** {player_data.firstname}")
+        st.write(f"**Last Name:** {player_data.lastname}")
+        st.write(f"**Gender:** {'Male' if player_data.gender == 'm' else 'Female'}")
+    
+    with col2:
+        st.markdown("### 🌍 Location")
+        st.write(f"**Country:** {player_data.country_name}")
+        st.write(f"**Continent:** {player_data.continent_name}")
+        
+        st.markdown("### 📅 Age Information")
+        st.write(f"**Date of Birth:** {player_data.dateofbirth}")
+        if player_data.age > 0:
+            st.write(f"**Current Age:** {player_data.age:.1f} years")
+        else:
+            st.write("**Current Age:** Not available")
+    
+    with col3:
+        st.markdown("### 🏏 Playing Style")
+        st.write(f"**Batting Style:** {player_data.battingstyle}")
+        st.write(f"**Bowling Style:** {player_data.bowlingstyle}")
+        st.write(f"**Position:** {player_data.position}")
+        
+        st.markdown("### 🔗 Additional Info")
+        st.write(f"**Player ID:** {player_data.id}")
+        if pd.notna(player_data.image_path) and player_data.image_path:
+            st.write(f"**Image Available:** Yes")
+        else:
+            st.write(f"**Image Available:** No")
+    
+    # Career Statistics Section
+    st.markdown("---")
+    st.markdown("### 📊 Career Statistics")
+    st.warning("⚠️ **Important:** All performance statistics shown below are synthetically generated for demonstration purposes only. These are not real player statistics.")
+    st.markdown("*Note: These are synthetic statistics for demonstration purposes*")
+    
+    # Stats metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    with col1:
+        st.metric("Matches Played", stats['matches'])
+        st.metric("Total Runs", f"{stats['runs']:,}")
+    
+    with col2:
+        st.metric("Batting Average", stats['batting_avg'])
+        st.metric("Strike Rate", stats['strike_rate'])
+    
+    with col3:
+        st.metric("Wickets Taken", stats['wickets'])
+        st.metric("Bowling Average", stats['bowling_avg'] if stats['wickets'] > 0 else "N/A")
+    
+    with col4:
+        st.metric("Catches", stats['catches'])
+        if stats['stumpings'] > 0:
+            st.metric("Stumpings", stats['stumpings'])
+        else:
+            st.metric("Economy Rate", stats['economy_rate'] if stats['wickets'] > 0 else "N/A")
+    
+    # Additional achievements
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### 🏆 Batting Achievements")
+        st.write(f"**Centuries:** {stats['centuries']}")
+        st.write(f"**Fifties:** {stats['fifties']}")
+        st.write(f"**Best Performance:** {stats['runs']//10} runs")
+    
+    with col2:
+        st.markdown("#### 🎯 Bowling Achievements")
+        st.write(f"**Five-wicket hauls:** {stats['five_wickets']}")
+        best_bowling_runs = np.random.default_rng(int(player_data.id)).integers(10, 50)
+        st.write(f"**Best Bowling:** {stats['wickets']//10}-{best_bowling_runs}")
+        st.write(f"**Economy Rate:** {stats['economy_rate']}")
+    
+    # Performance Charts
+    st.markdown("---")
+    st.markdown("### 📈 Performance Analysis")
+    
+    fig_radar, fig_progression = create_player_performance_charts(player_data, stats)
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.plotly_chart(fig_radar, use_container_width=True)
+    
+    with col2:
+        if fig_progression:
+            st.plotly_chart(fig_progression, use_container_width=True)
+        else:
+            st.info("Career progression chart not available for this player type.")
+    
+    # Batting Stroke Analysis
+    st.markdown("---")
+    st.markdown("### 🏏 Batting Stroke Analysis")
+    st.markdown("*Analysis of most frequently played shots by the player*")
+    
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        # Cricket field-style polar chart
+        fig_strokes_polar = create_batting_strokes_chart(player_data, stats)
+        st.plotly_chart(fig_strokes_polar, use_container_width=True)
+    
+    with col2:
+        # Horizontal bar chart for stroke preferences
+        fig_strokes_bar = create_stroke_preference_bar_chart(player_data, stats)
+        st.plotly_chart(fig_strokes_bar, use_container_width=True)
+    
+    # Top 3 favorite strokes
+    top_strokes = dict(sorted(stats['batting_strokes'].items(), key=lambda x: x[1], reverse=True)[:3])
+    
+    st.markdown("#### 🎯 Player's Signature Shots")
+    cols = st.columns(3)
+    
+    for i, (stroke, percentage) in enumerate(top_strokes.items()):
+        with cols[i]:
+            st.metric(
+                label=f"#{i+1} Favorite Shot",
+                value=stroke,
+                delta=f"{percentage}% usage"
+            )
+    
+    # Comparison with similar players
+    st.markdown("---")
+    st.markdown("### 🔍 Player Comparison")
+    
+    # Compare with the nearest players by style, position, continent, age and stats
+    df = load_data()
+    nearest, _ = load_similarity_index(current_version()).nearest(player_data.id, k=SIMILAR_PLAYERS)
+    similar_players = df.iloc[nearest]
+    
+    if not similar_players.empty:
+        comparison_data = []
+        comparison_data.append({
+            'Player': player_data.fullname,
+            'Batting Avg': stats['batting_avg'],
+            'Strike Rate': stats['strike_rate'],
+            'Wickets': stats['wickets'],
+            'Country': player_data.country_name,
+            'Type': 'Selected Player'
+        })
+        
+        similar_stats = get_stats_batch(similar_players)
+        comparison_df = pd.concat([
+            pd.DataFrame(comparison_data),
+            pd.DataFrame({
+                'Player': similar_players['fullname'],
+                'Batting Avg': similar_stats['batting_avg'],
+                'Strike Rate': similar_stats['strike_rate'],
+                'Wickets': similar_stats['wickets'],
+                'Country': similar_players['country_name'],
+                'Type': 'Similar Player'
+            })
+        ], ignore_index=True)
+        
+        fig_comparison = px.scatter(
+            comparison_df,
+            x='Batting Avg',
+            y='Strike Rate',
+            size='Wickets',
+            color='Type',
+            hover_name='Player',
+            hover_data=['Country'],
+            title=f"Comparison with the {len(similar_players)} Most Similar Players",
+            color_discrete_map={'Selected Player': 'red', 'Similar Player': 'blue'}
+        )
+        
+        st.plotly_chart(fig_comparison, use_container_width=True)
+    else:
+        st.info("No similar players found for comparison.")
@@ -0,0 +1,159 @@
+"""
+Player Search page: find players by name, country or filters and show their details.
+"""
+
+import numpy as np
+import streamlit as st
+
+from dashboard.data import (
+    RESULT_COLUMNS, current_version, load_country_player_ids, load_filter_index, load_name_index,
+    load_player_directory
+)
+from dashboard.player_details import display_player_details
+
+# Number of closest matches shown by the fuzzy player search
+FUZZY_RESULTS = 10
+
+# Number of best name matches offered in the player selectbox
+NAME_RESULTS = 100
+
+# Page sizes of the Advanced Filters results table
+RESULT_PAGE_SIZES = [25, 50, 100, 250]
+
+def player_label(player):
+    """Selectbox label of a player record; country and id tell apart players who share a name."""
+    return f"{player.fullname} ({player.country_name}, #{player.id})"
+
+def select_player(player_ids):
+    """Player selectbox keyed by player id and labelled by name, country and id.
+    
+    Returns the chosen player's record, or None if nothing is selected.
+    """
+    directory = load_player_directory(current_version())
+    player_id = st.selectbox(
+        "Select a player:",
+        player_ids,
+        format_func=lambda player_id: player_label(directory.get(player_id))
+    )
+    return None if player_id is None else directory.get(player_id)
+
+def render(df, summary):
+    """Draw the Player Search page."""
+    st.markdown("## 🔍 Player Search & Details")
+    
+    # Search options
+    search_type = st.radio("Search by:", ["Player Name", "Country", "Advanced Filters"])
+    
+    if search_type == "Player Name":
+        # Search by player name
+        search_term = st.text_input("🔍 Enter player name:", placeholder="e.g., Virat Kohli")
+        fuzzy = st.checkbox("Fuzzy match (tolerates typos and spelling variants)")
+        
+        if search_term:
+            # Filter players through the prebuilt name index, best matches first
+            name_index = load_name_index(current_version())
+            if fuzzy:
+                positions = name_index.fuzzy_search(search_term, limit=FUZZY_RESULTS)
+            else:
+                positions = name_index.search(search_term)
+            
+            if len(positions) > 0:
+                if len(positions) > NAME_RESULTS:
+                    st.write(f"Found {len(positions)} player(s), showing the best {NAME_RESULTS}")
+                else:
+                    st.write(f"Found {len(positions)} player(s)")
+                
+                # Select player
+                player_data = select_player(df['id'].to_numpy()[positions[:NAME_RESULTS]].tolist())
+                
+                if player_data is not None:
+                    display_player_details(player_data)
+            else:
+                st.warning("No players found with that name.")
+    
+    elif search_type == "Country":
+        # Search by country
+        selected_country = st.selectbox(
+            "🌍 Select a country:",
+            sorted(df['country_name'].unique())
+        )
+        
+        country_ids = load_country_player_ids(current_version()).get(selected_country, np.zeros(0, dtype=np.int64))
+        st.write(f"Players from {selected_country}: {len(country_ids)}")
+        
+        if len(country_ids) > 0:
+            # Show top players from country
+            player_data = select_player(country_ids.tolist())
+            
+            if player_data is not None:
+                display_player_details(player_data)
+    
+    elif search_type == "Advanced Filters":
+        st.markdown("### 🎯 Advanced Filters")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            filter_countries = st.multiselect(
+                "Countries:",
+                sorted(df['country_name'].unique())
+            )
+        
+        with col2:
+            filter_gender = st.selectbox(
+                "Gender:",
+                ["All", "Male", "Female"]
+            )
+        
+        with col3:
+            filter_batting = st.selectbox(
+                "Batting Style:",
+                ["All"] + sorted(df['battingstyle'].unique().tolist())
+            )
+        
+        # Age range filter
+        if df['age'].max() > 0:
+            age_range = st.slider(
+                "Age Range:",
+                min_value=int(df[df['age'] > 0]['age'].min()),
+                max_value=int(df[df['age'] > 0]['age'].max()),
+                value=(20, 40)
+            )
+        
+        # Apply filters as bitmap intersections; rows are only materialized for display
+        filter_values = {'country_name': filter_countries}
+        if filter_gender != "All":
+            filter_values['gender'] = ['m' if filter_gender == "Male" else 'f']
+        if filter_batting != "All":
+            filter_values['battingstyle'] = [filter_batting]
+        filter_ranges = {'age': age_range} if df['age'].max() > 0 else {}
+        filter_index = load_filter_index(current_version())
+        selection = filter_index.select(filter_values, filter_ranges)
+        match_count = selection.count
+        
+        st.write(f"Found {match_count} players matching your criteria")
+        
+        if match_count > 0:
+            # Sort the matched row ids and materialize only the visible page
+            col1, col2, col3 = st.columns(3)
+            
+            with col1:
+                sort_column = st.selectbox("Sort by:", RESULT_COLUMNS)
+            
+            with col2:
+                sort_order = st.selectbox("Order:", ["Ascending", "Descending"])
+            
+            with col3:
+                page_size = st.selectbox("Rows per page:", RESULT_PAGE_SIZES)
+            
+            page_count = (match_count + page_size - 1) // page_size
+            page = st.number_input(f"Page (1-{page_count}):", min_value=1, max_value=page_count, value=1, step=1)
+            
+            sorted_ids = filter_index.sorted_row_ids(selection, sort_column, descending=sort_order == "Descending")
+            page_ids = sorted_ids[(page - 1) * page_size:page * page_size]
+            st.dataframe(df.iloc[page_ids][RESULT_COLUMNS], use_container_width=True, hide_index=True)
+            
+            player_data = select_player(df['id'].to_numpy()[page_ids].tolist())
+            
+            if player_data is not None:
+                display_player_details(player_data)
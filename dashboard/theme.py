@@ -0,0 +1,353 @@
+"""
+Dashboard theme: the session's theme choice, the page CSS and chart styling.
+
+The CSS of each theme is built once per process and only emitted on reruns.
+"""
+
+import functools
+
+import streamlit as st
+
+def is_dark_theme():
+    """Whether charts use the dark theme; outside a Streamlit session, always dark."""
+    return st.session_state.get('dark_theme', True)
+
+@functools.lru_cache(maxsize=None)
+def theme_css(dark_theme=False):
+    """The page CSS of a theme, built once per process."""
+    if dark_theme:
+        # Dark theme CSS
+        return """
+        <style>
+            /* Global dark theme */
+            .stApp {
+                background-color: #0e1117 !important;
+                color: #fafafa !important;
+            }
+            
+            .main .block-container {
+                background-color: #0e1117 !important;
+                color: #fafafa !important;
+            }
+            
+            section[data-testid="stSidebar"] {
+                background-color: #262730 !important;
+                color: #fafafa !important;
+            }
+            
+            /* Headers and titles */
+            .main-header {
+                font-size: 3rem;
+                color: #58a6ff !important;
+                text-align: center;
+                margin-bottom: 2rem;
+                font-weight: bold;
+            }
+            
+            /* Cards and containers */
+            .metric-card, .player-card {
+                background-color: #21262d !important;
+                padding: 1.5rem;
+                border-radius: 0.8rem;
+                border: 1px solid #30363d;
+                color: #fafafa !important;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.3);
+                margin-bottom: 1rem;
+            }
+            
+            /* Universal text styling - FORCE ALL TEXT TO BE LIGHT */
+            *, *::before, *::after,
+            .stMarkdown, .stMarkdown p, .stMarkdown div, .stMarkdown span, 
+            .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4, .stMarkdown h5, .stMarkdown h6,
+            div[data-testid="stText"], div[data-testid="stText"] p, div[data-testid="stText"] span,
+            .stText, .stText p, .stText span, .element-container div, .element-container p, .element-container span,
+            [data-testid="stHeading"], [data-testid="stHeading"] h1, [data-testid="stHeading"] h2, [data-testid="stHeading"] h3,
+            p, span, div, h1, h2, h3, h4, h5, h6, label, li, td, th, strong, em, a {
+                color: #fafafa !important;
+            }
+            
+            /* Container backgrounds */
+            .main .block-container *, section[data-testid="stSidebar"] *,
+            .stContainer, .stColumn, .stTabs, .stExpander {
+                background-color: transparent !important;
+                color: #fafafa !important;
+            }
+            
+            /* Form elements - comprehensive dark styling */
+            .stSelectbox > div > div > div, .stTextInput > div > div > input,
+            .stSelectbox label, .stTextInput label, .stRadio label, .stMultiSelect label, .stSlider label,
+            .stNumberInput label, .stDateInput label, .stTimeInput label, .stTextArea label,
+            input, select, textarea, option {
+                color: #fafafa !important;
+                background-color: #21262d !important;
+                border-color: #30363d !important;
+            }
+            
+            /* Metric containers - enhanced dark theme */
+            [data-testid="metric-container"] {
+                background-color: #21262d !important;
+                border: 1px solid #30363d !important;
+                color: #fafafa !important;
+                border-radius: 0.5rem !important;
+            }
+            
+            [data-testid="metric-container"] * {
+                color: #fafafa !important;
+            }
+            
+            /* Tables and dataframes - comprehensive dark styling */
+            .dataframe, .dataframe th, .dataframe td, .dataframe thead, .dataframe tbody,
+            table, table th, table td, thead, tbody, .stTable, .stDataFrame {
+                background-color: #21262d !important;
+                color: #fafafa !important;
+                border-color: #30363d !important;
+            }
+            
+            /* Tabs styling */
+            .stTabs [data-baseweb="tab-list"] {
+                background-color: #21262d !important;
+            }
+            
+            .stTabs [data-baseweb="tab"] {
+                background-color: #21262d !important;
+                color: #fafafa !important;
+            }
+            
+            .stTabs [aria-selected="true"] {
+                background-color: #238636 !important;
+                color: #ffffff !important;
+            }
+            
+            /* Expander styling */
+            .streamlit-expanderHeader {
+                background-color: #21262d !important;
+                color: #fafafa !important;
+            }
+            
+            .streamlit-expanderContent {
+                background-color: #0e1117 !important;
+                color: #fafafa !important;
+            }
+            
+            /* Buttons - enhanced styling */
+            .stButton > button {
+                color: #ffffff !important;
+                background-color: #238636 !important;
+                border: none !important;
+                font-weight: bold !important;
+                border-radius: 0.5rem !important;
+            }
+            
+            .stButton > button:hover {
+                background-color: #2ea043 !important;
+            }
+            
+            /* Chart containers - comprehensive */
+            .js-plotly-plot, .plotly-graph-div, .plotly {
+                background-color: #0e1117 !important;
+            }
+            
+            /* Force plotly text to be light */
+            .plotly .gtitle, .plotly .xtitle, .plotly .ytitle,
+            .plotly text, .plotly .legendtext {
+                fill: #fafafa !important;
+                color: #fafafa !important;
+            }
+            
+            /* Additional comprehensive styling */
+            .stSelectbox > div > div, .stMultiSelect > div > div,
+            .stRadio > div > div, .stSlider > div > div,
+            [data-baseweb="select"] *, [data-baseweb="popover"] *,
+            .css-1d391kg, .css-1cpxqw2, .css-1v3fvcr, .css-10trblm, .css-16idsys {
+                color: #fafafa !important;
+                background-color: #21262d !important;
+            }
+            
+            /* Sidebar elements */
+            .css-1d391kg p, .css-1cpxqw2 p, .css-1v3fvcr p {
+                color: #fafafa !important;
+            }
+            
+            /* Info boxes and alerts */
+            .stInfo, .stSuccess, .stWarning, .stError {
+                background-color: #21262d !important;
+                color: #fafafa !important;
+                border-color: #30363d !important;
+            }
+        </style>
+        """
+    else:
+        # Light theme CSS
+        return """
+        <style>
+            .stApp {
+                background-color: #ffffff !important;
+                color: #262730 !important;
+            }
+            
+            .main .block-container {
+                background-color: #ffffff !important;
+                color: #262730 !important;
+            }
+            
+            section[data-testid="stSidebar"] {
+                background-color: #f0f2f6 !important;
+                color: #262730 !important;
+            }
+            
+            .main-header {
+                font-size: 3rem;
+                color: #1f77b4 !important;
+                text-align: center;
+                margin-bottom: 2rem;
+                font-weight: bold;
+            }
+            
+            .metric-card, .player-card {
+                background-color: #ffffff !important;
+                padding: 1.5rem;
+                border-radius: 0.8rem;
+                border: 1px solid #e1e5e9;
+                color: #262730 !important;
+                box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+                margin-bottom: 1rem;
+            }
+            
+            /* All text elements - dark text on light background */
+            .stMarkdown, .stMarkdown p, .stMarkdown div, .stMarkdown span,
+            .stMarkdown h1, .stMarkdown h2, .stMarkdown h3, .stMarkdown h4, .stMarkdown h5, .stMarkdown h6,
+            div[data-testid="stText"], div[data-testid="stText"] p, div[data-testid="stText"] span,
+            .stText, .stText p, .stText span, .element-container div, .element-container p, .element-container span,
+            [data-testid="stHeading"], [data-testid="stHeading"] h1, [data-testid="stHeading"] h2, [data-testid="stHeading"] h3 {
+                color: #262730 !important;
+            }
+            
+            /* Force text color for all containers */
+            .main .block-container *, section[data-testid="stSidebar"] * {
+                color: #262730 !important;
+            }
+            
+            /* Override any conflicting styles */
+            p, span, div, h1, h2, h3, h4, h5, h6, label {
+                color: #262730 !important;
+            }
+            
+            /* Form elements - light theme */
+            .stSelectbox > div > div > div, .stTextInput > div > div > input,
+            .stSelectbox label, .stTextInput label, .stRadio label, .stMultiSelect label, .stSlider label {
+                color: #262730 !important;
+                background-color: #ffffff !important;
+            }
+            
+            /* Metric containers - light theme */
+            [data-testid="metric-container"] {
+                background-color: #f8f9fa !important;
+                border: 1px solid #dee2e6 !important;
+                color: #262730 !important;
+            }
+            
+            [data-testid="metric-container"] * {
+                color: #262730 !important;
+            }
+            
+            /* Dataframes - light theme */
+            .dataframe {
+                background-color: #ffffff !important;
+                color: #262730 !important;
+            }
+            
+            .dataframe th {
+                background-color: #f8f9fa !important;
+                color: #262730 !important;
+            }
+            
+            .dataframe td {
+                color: #262730 !important;
+            }
+            
+            /* Buttons */
+            .stButton > button {
+                color: #ffffff !important;
+                background-color: #1f77b4 !important;
+                border: none !important;
+                font-weight: bold !important;
+            }
+            
+            /* Chart containers */
+            .js-plotly-plot {
+                background-color: #ffffff !important;
+            }
+            
+            /* Additional text visibility fixes */
+            .stSelectbox > div > div, .stMultiSelect > div > div,
+            .stRadio > div > div, .stSlider > div > div,
+            [data-baseweb="select"] *, [data-baseweb="popover"] * {
+                color: #262730 !important;
+            }
+            
+            /* Force visibility for any remaining text */
+            .css-1d391kg, .css-1cpxqw2, .css-1v3fvcr {
+                color: #262730 !important;
+            }
+        </style>
+        """
+
+def apply_theme_css(dark_theme=False):
+    """Apply theme-specific CSS based on user preference."""
+    st.markdown(theme_css(dark_theme), unsafe_allow_html=True)
+
+def display_chart(fig):
+    """Display chart with dark theme applied."""
+    if fig is not None:
+        fig = apply_dark_theme_to_chart(fig)
+        st.plotly_chart(fig, use_container_width=True)
+
+def apply_dark_theme_to_chart(fig):
+    """Apply dark theme styling to plotly charts."""
+    fig.update_layout(
+        template="plotly_dark",
+        paper_bgcolor='#0e1117',
+        plot_bgcolor='#0e1117',
+        font=dict(color='#fafafa'),
+        title_font=dict(color='#fafafa'),
+        legend=dict(
+            bgcolor='rgba(0,0,0,0)',
+            bordercolor='#30363d',
+            font=dict(color='#fafafa')
+        ),
+        xaxis=dict(
+            gridcolor='#30363d',
+            zerolinecolor='#30363d',
+            color='#fafafa'
+        ),
+        yaxis=dict(
+            gridcolor='#30363d',
+            zerolinecolor='#30363d',
+            color='#fafafa'
+        )
+    )
+    return fig
+
+def apply_chart_styling(fig, title_color=None):
+    """Apply theme-aware styling to charts."""
+    if title_color is None:
+        title_color = '#fafafa' if is_dark_theme() else '#262730'
+    
+    text_color = '#fafafa' if is_dark_theme() else '#262730'
+    bg_color = '#0e1117' if is_dark_theme() else '#ffffff'
+    
+    fig.update_layout(
+        title=dict(font=dict(color=title_color, size=16)),
+        xaxis=dict(
+            title=dict(font=dict(color=text_color)),
+            tickfont=dict(color=text_color)
+        ),
+        yaxis=dict(
+            title=dict(font=dict(color=text_color)),
+            tickfont=dict(color=text_color)
+        ),
+        plot_bgcolor=bg_color,
+        paper_bgcolor=bg_color,
+        font=dict(color=text_color)
+    )
+    return fig
@@ -3,75 +3,157 @@ Cricket Players Data Analysis - Main Runner
 Executes the complete analysis pipeline
 """
 
+import argparse
 import os
 import sys
 import time
+import tracemalloc
 from datetime import datetime
 
-def run_script(script_name, description):
-    """Run a Python script and handle errors."""
-    print(f"\n{'='*50}")
-    print(f"🏏 {description}")
-    print(f"{'='*50}")
-    
-    start_time = time.time()
-    
-    try:
-        # Run script using subprocess to avoid import issues
-        import subprocess
-        result = subprocess.run([sys.executable, f"scripts/{script_name}.py"], 
-                              capture_output=True, text=True, cwd=os.getcwd())
-        
-        if result.returncode == 0:
-            if result.stdout:
-                print(result.stdout)
-        else:
-            print(f"Error output: {result.stderr}")
-            raise Exception(f"Script failed with return code {result.returncode}")
-        
-        end_time = time.time()
-        print(f"\n✅ Completed in {end_time - start_time:.2f} seconds")
-        return True
-        
-    except Exception as e:
-        print(f"\n❌ Error in {script_name}: {str(e)}")
-        return False
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'scripts'))
+
+import config
+from build_cache import BuildCache
+from pipeline import CACHED, COMPLETED, FAILED, MODES, SKIPPED, Stage, run_pipeline
+
+CHARTS = ['players_per_country.png', 'batting_styles.png', 'gender_distribution.png']
+ADVANCED_CHARTS = ['age_distribution.png', 'continent_gender_analysis.png', 'top_countries_detailed.png']
+
+CLEANED_DATA = [config.CLEANED_DATA_PATH, config.CLEANED_PARQUET_PATH]
+
+SUMMARY_DATA = CLEANED_DATA + [config.SUMMARY_PATH]
+
+# Pipeline graph: every stage after cleaning only reads the cleaned roster and,
+# once it is built, the summary tables shared by the analysis, chart and report
+# stages, so those stages run concurrently in parallel mode.
+# Stages with outputs are skipped when their inputs, config values and code
+# are unchanged since their last successful run (see build_cache.py).
+PIPELINE_STAGES = [
+    Stage("clean_data", "Data Cleaning & Preprocessing", "clean_data",
+          inputs=[config.DATA_PATH],
+          outputs=CLEANED_DATA,
+          sources=["data_store", "key_dedup"],
+          provides_data=True),
+    Stage("roster_summary", "Summary Tables", "build_roster_summary",
+          depends_on=["clean_data"],
+          inputs=CLEANED_DATA,
+          outputs=[config.SUMMARY_PATH],
+          sources=["data_store"]),
+    Stage("stats_table", "Synthetic Stats Table", "build_stats_table",
+          depends_on=["clean_data"],
+          inputs=CLEANED_DATA,
+          outputs=[config.STATS_TABLE_PATH],
+          sources=["data_store", "synthetic_stats"]),
+    Stage("analysis", "Statistical Analysis", "run_analysis",
+          depends_on=["clean_data", "roster_summary"],
+          inputs=SUMMARY_DATA,
+          sources=["data_store", "roster_summary"]),
+    Stage("visualization", "Basic Visualizations", "create_visualizations",
+          depends_on=["clean_data", "roster_summary"],
+          inputs=SUMMARY_DATA,
+          outputs=[os.path.join(config.OUTPUT_DIR, name) for name in CHARTS],
+          config_keys=["DPI"],
+          sources=["data_store", "render_pool", "roster_summary"]),
+    Stage("advanced_analytics", "Advanced Analytics", "advanced_analytics",
+          depends_on=["clean_data", "roster_summary"],
+          inputs=SUMMARY_DATA,
+          outputs=[os.path.join(config.OUTPUT_DIR, 'advanced', name) for name in ADVANCED_CHARTS],
+          config_keys=["DPI", "MIN_AGE", "MAX_AGE", "AGE_BINS"],
+          sources=["data_store", "render_pool", "roster_summary", "age_bins"]),
+    Stage("generate_report", "Report Generation", "generate_summary_report",
+          depends_on=["clean_data", "roster_summary"],
+          inputs=SUMMARY_DATA,
+          outputs=[os.path.join(config.REPORTS_DIR, 'summary_report.md')],
+          sources=["data_store", "roster_summary"])
+]
+
+def print_stage_timings(results, memory_label, wall_time):
+    """Print status, time and peak memory for every stage, in pipeline order."""
+    print(f"\n{'Stage':<24}{'Status':>11}{'Time (s)':>10}{memory_label:>20}")
+    print(f"{'-'*65}")
+    for stage in PIPELINE_STAGES:
+        result = results[stage.name]
+        status = result.status
+        if status == COMPLETED:
+            # Stages without outputs have nothing to cache and always run
+            status = "rebuilt" if stage.outputs else "ran"
+        peak_text = f"{result.peak / 1024**2:.1f}" if result.peak is not None else "n/a"
+        print(f"{result.name:<24}{status:>11}{result.elapsed:>10.2f}{peak_text:>20}")
+    print(f"{'-'*65}")
+    print(f"{'Sum of stages':<35}{sum(result.elapsed for result in results.values()):>10.2f}")
+    print(f"{'Wall time':<35}{wall_time:>10.2f}")
+
+def parse_args():
+    """Parse command line options."""
+    parser = argparse.ArgumentParser(description="Run the cricket players analysis pipeline.")
+    parser.add_argument(
+        "--mode",
+        choices=MODES,
+        default="parallel",
+        help="parallel: run independent stages concurrently on a process pool (default); "
+             "in-process: import stages once and share one DataFrame; "
+             "subprocess: run every stage in its own interpreter, one at a time"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="parallel mode: maximum number of worker processes (default: one per CPU)"
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="rebuild every stage even if its inputs, config values and code are unchanged"
+    )
+    parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="in-process mode: report each stage's own peak allocations via tracemalloc "
+             "(slower) instead of the process peak RSS"
+    )
+    return parser.parse_args()
 
 def main():
     """Run the complete cricket players analysis pipeline."""
+    args = parse_args()
     
     print(f"""
 🏏 CRICKET PLAYERS DATA ANALYSIS PIPELINE
 ==========================================
 Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
+Mode: {args.mode}
 ==========================================
     """)
     
-    # Pipeline steps
-    pipeline_steps = [
-        ("clean_data", "Data Cleaning & Preprocessing"),
-        ("analysis", "Statistical Analysis"),
-        ("visualization", "Basic Visualizations"),
-        ("advanced_analytics", "Advanced Analytics"),
-        ("generate_report", "Report Generation")
-    ]
+    if args.mode == "in-process" and args.trace_memory:
+        tracemalloc.start()
+    if tracemalloc.is_tracing():
+        memory_label = "Peak traced (MB)"
+    elif args.mode == "parallel":
+        memory_label = "Worker RSS (MB)"
+    else:
+        memory_label = "Peak RSS (MB)"
     
-    success_count = 0
-    total_steps = len(pipeline_steps)
+    start_time = time.time()
+    results = run_pipeline(PIPELINE_STAGES, mode=args.mode, max_workers=args.workers,
+                           cache=BuildCache(), force=args.force)
+    wall_time = time.time() - start_time
+    
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
     
-    for script_name, description in pipeline_steps:
-        success = run_script(script_name, description)
-        if success:
-            success_count += 1
-        else:
-            print(f"\n⚠️ Pipeline stopped due to error in {script_name}")
-            break
+    total_steps = len(PIPELINE_STAGES)
+    success_count = sum(result.status in (COMPLETED, CACHED) for result in results.values())
+    cached_count = sum(result.status == CACHED for result in results.values())
+    failed = [result.name for result in results.values() if result.status == FAILED]
+    skipped = [result.name for result in results.values() if result.status == SKIPPED]
     
     # Final summary
     print(f"\n{'='*60}")
     print(f"🏆 PIPELINE SUMMARY")
     print(f"{'='*60}")
-    print(f"✅ Completed: {success_count}/{total_steps} steps")
+    print_stage_timings(results, memory_label, wall_time)
+    print(f"\n✅ Completed: {success_count}/{total_steps} steps ({cached_count} cached)")
     print(f"⏱️ Finished at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     if success_count == total_steps:
@@ -80,16 +162,24 @@ Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 📁 Generated Files:
    📊 Visualizations: visualizations/*.png
-   📈 Advanced Charts: visualizations/advanced/*.png  
+   📈 Advanced Charts: visualizations/advanced/*.png
    📄 Report: reports/summary_report.md
    🔧 Cleaned Data: data/cleaned_all_players.csv
+   🎲 Synthetic Stats: data/synthetic_stats.parquet
+   🧮 Summary Tables: data/roster_summary.json
 
 🚀 Your cricket players analysis is complete!
         """)
     else:
-        print(f"\n⚠️ Pipeline completed with {total_steps - success_count} errors")
+        print(f"\n⚠️ Pipeline completed with {len(failed)} errors")
+        if failed:
+            print(f"❌ Failed: {', '.join(failed)}")
+        if skipped:
+            print(f"⏭️ Skipped: {', '.join(skipped)}")
     
     print(f"{'='*60}")
+    
+    return 0 if success_count == total_steps else 1
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
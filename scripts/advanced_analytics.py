@@ -1,99 +1,124 @@
-import pandas as pd
 import matplotlib.pyplot as plt
-import seaborn as sns
 import numpy as np
 from datetime import datetime
 import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from data_store import load_players
+from age_bins import age_bin_edges, age_histogram
+from render_pool import RenderTask, render_charts
+from roster_summary import load_summary
 
 # Configure matplotlib
 import matplotlib
 matplotlib.use('Agg')
 
-def advanced_analytics():
-    """Perform advanced analytics on the cricket players dataset."""
+def plot_age_distribution(counts, edges):
+    """Histogram of player ages from pre-computed bin counts."""
+    fig = plt.figure(figsize=(12, 6))
+    plt.hist(edges[:-1], bins=edges, weights=counts, color='skyblue', alpha=0.7, edgecolor='black')
+    plt.title('Age Distribution of Cricket Players', fontsize=14)
+    plt.xlabel('Age (years)')
+    plt.ylabel('Number of Players')
+    plt.grid(True, alpha=0.3)
+    plt.tight_layout()
+    return fig
+
+def plot_continent_gender(continent_gender):
+    """Stacked bar chart of players per continent, split by gender."""
+    # DataFrame.plot draws on a figure of its own
+    ax = continent_gender.plot(kind='bar', stacked=True, color=['lightcoral', 'lightblue'])
+    plt.title('Player Distribution by Continent and Gender', fontsize=14)
+    plt.xlabel('Continent')
+    plt.ylabel('Number of Players')
+    plt.legend(['Female', 'Male'])
+    plt.xticks(rotation=45, ha='right')
+    plt.tight_layout()
+    return ax.figure
+
+def plot_top_countries(top_countries):
+    """Bar chart of the top countries with the player count above each bar."""
+    fig = plt.figure(figsize=(14, 8))
+    colors = plt.cm.Set3(np.linspace(0, 1, len(top_countries)))
+    bars = plt.bar(range(len(top_countries)), top_countries.values, color=colors)
+    plt.title('Top 10 Countries by Player Count (Detailed)', fontsize=16)
+    plt.xlabel('Country', fontsize=12)
+    plt.ylabel('Number of Players', fontsize=12)
+    plt.xticks(range(len(top_countries)), top_countries.index, rotation=45, ha='right')
+    
+    # Add value labels on bars
+    for bar, value in zip(bars, top_countries.values):
+        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 20, 
+                str(value), ha='center', va='bottom', fontweight='bold')
     
-    df = pd.read_csv('data/cleaned_all_players.csv')
+    plt.tight_layout()
+    return fig
+
+def advanced_analytics(df=None, workers=None):
+    """Perform advanced analytics on the cricket players dataset.
+
+    The charts are rendered in parallel by render_pool once the console
+    analysis is done; workers overrides config.RENDER_WORKERS.
+    """
+    
+    if df is None:
+        df = load_players()
+    summary = load_summary(df)
+    ages = None
     os.makedirs('visualizations/advanced', exist_ok=True)
     
     print("=== ADVANCED ANALYTICS ===")
     
+    # Each task only carries the aggregated data it draws
+    tasks = []
+    
     # 1. Age Analysis (if birth dates are valid)
     try:
-        # Clean date format and calculate ages
-        df['dateofbirth_clean'] = pd.to_datetime(df['dateofbirth'], format='%d-%m-%Y', errors='coerce')
+        # Calculate ages from the pre-parsed birth dates
         current_date = datetime.now()
-        df['age'] = (current_date - df['dateofbirth_clean']).dt.days / 365.25
+        ages = (current_date - df['dateofbirth_clean']).dt.days / 365.25
         
         # Filter reasonable ages (10-50 years)
-        valid_ages = df[(df['age'] >= 10) & (df['age'] <= 50)]['age']
+        valid_ages = ages[(ages >= config.MIN_AGE) & (ages <= config.MAX_AGE)]
         
         if len(valid_ages) > 0:
-            plt.figure(figsize=(12, 6))
-            plt.hist(valid_ages, bins=30, color='skyblue', alpha=0.7, edgecolor='black')
-            plt.title('Age Distribution of Cricket Players', fontsize=14)
-            plt.xlabel('Age (years)')
-            plt.ylabel('Number of Players')
-            plt.grid(True, alpha=0.3)
-            plt.tight_layout()
-            plt.savefig('visualizations/advanced/age_distribution.png', dpi=300, bbox_inches='tight')
-            plt.close()
+            edges = age_bin_edges(config.MIN_AGE, config.MAX_AGE, config.AGE_BINS)
+            counts = age_histogram(valid_ages, edges)
+            tasks.append(RenderTask('visualizations/advanced/age_distribution.png', plot_age_distribution,
+                                    {'counts': counts, 'edges': edges}))
             print(f"Age analysis: Mean age = {valid_ages.mean():.1f} years")
-            print("Saved: visualizations/advanced/age_distribution.png")
     except Exception as e:
         print(f"Age analysis skipped: {e}")
     
     # 2. Continent vs Gender Analysis
-    plt.figure(figsize=(12, 8))
-    continent_gender = pd.crosstab(df['continent_name'], df['gender'])
-    continent_gender.plot(kind='bar', stacked=True, color=['lightcoral', 'lightblue'])
-    plt.title('Player Distribution by Continent and Gender', fontsize=14)
-    plt.xlabel('Continent')
-    plt.ylabel('Number of Players')
-    plt.legend(['Female', 'Male'])
-    plt.xticks(rotation=45, ha='right')
-    plt.tight_layout()
-    plt.savefig('visualizations/advanced/continent_gender_analysis.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Saved: visualizations/advanced/continent_gender_analysis.png")
+    continent_gender = summary.crosstab('continent_name', 'gender')
+    tasks.append(RenderTask('visualizations/advanced/continent_gender_analysis.png', plot_continent_gender,
+                            {'continent_gender': continent_gender}))
     
     # 3. Top Countries Detailed Analysis
-    top_10_countries = df['country_name'].value_counts().head(10)
-    
-    plt.figure(figsize=(14, 8))
-    colors = plt.cm.Set3(np.linspace(0, 1, len(top_10_countries)))
-    bars = plt.bar(range(len(top_10_countries)), top_10_countries.values, color=colors)
-    plt.title('Top 10 Countries by Player Count (Detailed)', fontsize=16)
-    plt.xlabel('Country', fontsize=12)
-    plt.ylabel('Number of Players', fontsize=12)
-    plt.xticks(range(len(top_10_countries)), top_10_countries.index, rotation=45, ha='right')
-    
-    # Add value labels on bars
-    for bar, value in zip(bars, top_10_countries.values):
-        plt.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 20, 
-                str(value), ha='center', va='bottom', fontweight='bold')
-    
-    plt.tight_layout()
-    plt.savefig('visualizations/advanced/top_countries_detailed.png', dpi=300, bbox_inches='tight')
-    plt.close()
-    print("Saved: visualizations/advanced/top_countries_detailed.png")
+    top_10_countries = summary.counts('country_name').head(10)
+    tasks.append(RenderTask('visualizations/advanced/top_countries_detailed.png', plot_top_countries,
+                            {'top_countries': top_10_countries}))
     
     # 4. Batting vs Bowling Style Matrix
-    style_matrix = pd.crosstab(df['battingstyle'].fillna('Unknown'), 
-                              df['bowlingstyle'].fillna('Unknown'), 
-                              margins=True)
+    style_matrix = summary.crosstab('battingstyle', 'bowlingstyle', missing='Unknown', margins=True)
     
     print("\n=== BATTING vs BOWLING STYLE MATRIX ===")
     print(style_matrix)
     
     # 5. Country Diversity Index
     print(f"\n=== DIVERSITY METRICS ===")
-    total_players = len(df)
-    country_diversity = 1 - sum((df['country_name'].value_counts() / total_players) ** 2)
+    total_players = summary.rows
+    country_diversity = 1 - sum((summary.counts('country_name') / total_players) ** 2)
     print(f"Country Diversity Index: {country_diversity:.3f} (0=no diversity, 1=max diversity)")
     
     # 6. Data Completeness Analysis
     print(f"\n=== DATA COMPLETENESS ===")
-    completeness = (df.notna().sum() / len(df) * 100).round(1)
+    columns = df if ages is None else df.assign(age=ages)
+    completeness = (columns.notna().sum() / len(df) * 100).round(1)
     for col, pct in completeness.items():
         if pct > 90:
             status = "GOOD"
@@ -103,6 +128,9 @@ def advanced_analytics():
             status = "POOR"
         print(f"{col}: {pct}% ({status})")
     
+    print("\n=== CHART RENDERING ===")
+    render_charts(tasks, workers)
+    
     print("\n=== ADVANCED ANALYTICS COMPLETE ===")
 
 if __name__ == "__main__":
@@ -0,0 +1,43 @@
+"""
+Server-side binning of player ages.
+
+Age charts are drawn from bin counts and per-group quartiles computed here
+instead of from every player's age, so a chart carries O(bins) or O(groups)
+values whatever the roster size. Bins use fixed edges, which keeps charts of
+different subsets and data versions comparable.
+"""
+
+import numpy as np
+import pandas as pd
+
+def age_bin_edges(low, high, bins):
+    """Fixed, equal-width bin edges from low to high."""
+    return np.linspace(low, high, bins + 1)
+
+def age_histogram(ages, edges):
+    """Players per bin; ages outside the edges are not counted."""
+    counts, _ = np.histogram(np.asarray(ages, dtype=float), bins=edges)
+    return counts
+
+def age_quartiles(ages, groups):
+    """Box plot statistics of the ages in each group.
+    
+    Returns one row per group with q1, median, q3 and mean, plus lowerfence
+    and upperfence: the most extreme ages within 1.5 IQR of the quartiles,
+    where Plotly draws the whiskers. Quartiles use linear interpolation, as
+    Plotly's own box plots do.
+    """
+    ages = pd.Series(np.asarray(ages, dtype=float), index=pd.RangeIndex(len(ages)))
+    groups = pd.Series(np.asarray(groups, dtype=object), index=ages.index)
+    grouped = ages.groupby(groups)
+    stats = grouped.quantile([0.25, 0.5, 0.75]).unstack()
+    stats.columns = ['q1', 'median', 'q3']
+    stats['mean'] = grouped.mean()
+    
+    iqr = stats['q3'] - stats['q1']
+    low = (stats['q1'] - 1.5 * iqr).reindex(groups).to_numpy()
+    high = (stats['q3'] + 1.5 * iqr).reindex(groups).to_numpy()
+    inside = (ages.to_numpy() >= low) & (ages.to_numpy() <= high)
+    stats['lowerfence'] = ages[inside].groupby(groups[inside]).min()
+    stats['upperfence'] = ages[inside].groupby(groups[inside]).max()
+    return stats
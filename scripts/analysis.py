@@ -1,40 +1,49 @@
-import pandas as pd
-
-# Load your data into a DataFrame
-df = pd.read_csv('data/all_players.csv')
-
-print("=== PLAYER DATA ANALYSIS ===")
-print(f"Total players in dataset: {len(df):,}")
-print(f"Total countries represented: {df['country_name'].nunique()}")
-print(f"Date range: {df['dateofbirth'].min()} to {df['dateofbirth'].max()}")
-
-print("\n=== TOP 10 COUNTRIES BY PLAYER COUNT ===")
-country_counts = df['country_name'].value_counts().head(10)
-print(country_counts)
-
-print("\n=== GENDER DISTRIBUTION ===")
-gender_dist = df['gender'].value_counts()
-print(gender_dist)
-print(f"Percentage female players: {(gender_dist.get('f', 0) / len(df) * 100):.1f}%")
-
-print("\n=== BATTING STYLES DISTRIBUTION ===")
-batting_styles = df['battingstyle'].value_counts()
-print(batting_styles)
-
-print("\n=== BOWLING STYLES DISTRIBUTION ===")
-bowling_styles = df['bowlingstyle'].value_counts()
-print(bowling_styles)
-
-print("\n=== PLAYERS BY CONTINENT ===")
-continent_counts = df['continent_name'].value_counts()
-print(continent_counts)
-
-print("\n=== SAMPLE PLAYERS FROM TOP COUNTRIES ===")
-top_5_countries = country_counts.head(5).index.tolist()
-for country in top_5_countries:
-    sample_players = df[df['country_name'] == country]['fullname'].head(3).tolist()
-    print(f"{country}: {', '.join(sample_players)}")
-
-print("\n=== ANALYSIS COMPLETE ===")
-print("Note: This dataset contains player profile information.")
-print("Performance statistics (runs, wickets) are not available in this dataset.")
+from data_store import load_players
+from roster_summary import load_summary
+
+def run_analysis(df=None):
+    """Print summary statistics for the cleaned players dataset."""
+    # Load your data into a DataFrame
+    if df is None:
+        df = load_players()
+    summary = load_summary(df)
+    
+    print("=== PLAYER DATA ANALYSIS ===")
+    print(f"Total players in dataset: {summary.rows:,}")
+    print(f"Total countries represented: {summary.nunique('country_name')}")
+    birth_dates = df['dateofbirth'].dropna()
+    print(f"Date range: {birth_dates.min()} to {birth_dates.max()}")
+    
+    print("\n=== TOP 10 COUNTRIES BY PLAYER COUNT ===")
+    country_counts = summary.counts('country_name').head(10)
+    print(country_counts)
+    
+    print("\n=== GENDER DISTRIBUTION ===")
+    gender_dist = summary.counts('gender')
+    print(gender_dist)
+    print(f"Percentage female players: {(gender_dist.get('f', 0) / summary.rows * 100):.1f}%")
+    
+    print("\n=== BATTING STYLES DISTRIBUTION ===")
+    batting_styles = summary.counts('battingstyle')
+    print(batting_styles)
+    
+    print("\n=== BOWLING STYLES DISTRIBUTION ===")
+    bowling_styles = summary.counts('bowlingstyle')
+    print(bowling_styles)
+    
+    print("\n=== PLAYERS BY CONTINENT ===")
+    continent_counts = summary.counts('continent_name')
+    print(continent_counts)
+    
+    print("\n=== SAMPLE PLAYERS FROM TOP COUNTRIES ===")
+    top_5_countries = country_counts.head(5).index.tolist()
+    for country in top_5_countries:
+        sample_players = df[df['country_name'] == country]['fullname'].head(3).tolist()
+        print(f"{country}: {', '.join(sample_players)}")
+    
+    print("\n=== ANALYSIS COMPLETE ===")
+    print("Note: This dataset contains player profile information.")
+    print("Performance statistics (runs, wickets) are not available in this dataset.")
+
+if __name__ == "__main__":
+    run_analysis()
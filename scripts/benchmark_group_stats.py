@@ -0,0 +1,106 @@
+"""
+Benchmark the dashboard's per-group statistics tables.
+
+Times the vectorized tables in group_stats against the groupby/lambda versions
+they replaced, on the roster repeated 1x, 10x and 100x, and checks that both
+versions build the same tables.
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_store import fill_missing, load_players
+from group_stats import comparison_statistics, country_statistics, position_statistics
+
+SCALES = [1, 10, 100]
+COMPARE_COUNTRIES = 3
+
+def dashboard_frame(df):
+    """The roster with the dashboard's age and style columns."""
+    df = df.copy()
+    df['age'] = ((datetime.now() - df['dateofbirth_clean']).dt.days / 365.25).round(1).fillna(0)
+    df['battingstyle'] = fill_missing(df['battingstyle'], 'Unknown')
+    df['bowlingstyle'] = fill_missing(df['bowlingstyle'], 'Unknown')
+    return df
+
+def lambda_country_statistics(df):
+    """The Country Statistics table as the dashboard computed it with lambdas."""
+    country_stats = df.groupby('country_name', observed=True).agg({
+        'fullname': 'count',
+        'age': lambda x: x[x > 0].mean() if len(x[x > 0]) > 0 else np.nan,
+        'gender': lambda x: (x == 'f').sum() / len(x) * 100
+    }).round(2)
+    country_stats.columns = ['Total Players', 'Average Age', 'Female %']
+    return country_stats.sort_values('Total Players', ascending=False)
+
+def lambda_position_statistics(df):
+    """The Position Statistics table as the dashboard computed it with lambdas."""
+    position_stats = df.groupby('position', observed=True).agg({
+        'fullname': 'count',
+        'age': lambda x: x[x > 0].mean() if len(x[x > 0]) > 0 else np.nan,
+        'country_name': lambda x: x.nunique()
+    }).round(2)
+    position_stats.columns = ['Total Players', 'Average Age', 'Countries Represented']
+    return position_stats.sort_values('Total Players', ascending=False)
+
+def lambda_comparison_statistics(df, countries):
+    """The Country Comparison table as the dashboard computed it with lambdas."""
+    comparison_data = df[df['country_name'].isin(countries)]
+    summary_stats = comparison_data.groupby('country_name', observed=True).agg({
+        'fullname': 'count',
+        'age': lambda x: x[x > 0].mean() if len(x[x > 0]) > 0 else np.nan,
+        'gender': lambda x: (x == 'f').sum(),
+        'battingstyle': lambda x: x.mode().iloc[0] if len(x.mode()) > 0 else 'Unknown'
+    }).round(2)
+    summary_stats.columns = ['Total Players', 'Average Age', 'Female Players', 'Most Common Batting Style']
+    return summary_stats
+
+def assert_same_table(expected, actual, name):
+    """Fail if two versions of a table differ; row order among ties may differ."""
+    try:
+        pd.testing.assert_frame_equal(expected.sort_index(), actual.sort_index(), check_dtype=False,
+                                      check_index_type=False, check_categorical=False)
+    except AssertionError as error:
+        raise AssertionError(f"{name}: vectorized table differs from the lambda version\n{error}") from None
+
+def best_time(function, *args, repeat=3):
+    """Fastest of several runs, in seconds."""
+    times = []
+    for _ in range(repeat):
+        start_time = time.perf_counter()
+        function(*args)
+        times.append(time.perf_counter() - start_time)
+    return min(times)
+
+def benchmark_group_stats(df=None):
+    """Print lambda and vectorized timings for every table at every scale."""
+    if df is None:
+        df = load_players()
+    base = dashboard_frame(df)
+    countries = base['country_name'].value_counts().head(COMPARE_COUNTRIES).index.tolist()
+    tables = [
+        ("Country Statistics", lambda_country_statistics, country_statistics, ()),
+        ("Position Statistics", lambda_position_statistics, position_statistics, ()),
+        ("Country Comparison", lambda_comparison_statistics, comparison_statistics, (countries,))
+    ]
+
+    print("=== GROUP STATISTICS BENCHMARK ===")
+    print(f"{'Table':<22}{'Rows':>12}{'Lambda (ms)':>14}{'Vectorized (ms)':>18}{'Speedup':>10}")
+    for scale in SCALES:
+        frame = pd.concat([base] * scale, ignore_index=True)
+        for name, slow, fast, args in tables:
+            assert_same_table(slow(frame, *args), fast(frame, *args), name)
+            slow_time = best_time(slow, frame, *args)
+            fast_time = best_time(fast, frame, *args)
+            print(f"{name:<22}{len(frame):>12,}{slow_time * 1000:>14.1f}{fast_time * 1000:>18.1f}"
+                  f"{slow_time / fast_time:>9.1f}x")
+
+if __name__ == "__main__":
+    benchmark_group_stats()
@@ -0,0 +1,74 @@
+"""
+Benchmark fuzzy player lookup: trigram index against a brute-force scan.
+
+Builds misspelled queries from real roster names (one character dropped and
+two swapped), then times NameIndex.fuzzy_search against ranking every name
+by edit distance, and reports how often the index finds the intended player.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_store import load_players
+from name_index import NameIndex, fuzzy_key, levenshtein
+
+QUERY_COUNT = 20
+TOP_K = 10
+
+def misspell(name, rng):
+    """Drop one character and swap two neighbouring ones."""
+    if len(name) < 4:
+        return name
+    position = rng.integers(1, len(name) - 1)
+    name = name[:position] + name[position + 1:]
+    position = rng.integers(0, len(name) - 1)
+    return name[:position] + name[position + 1] + name[position] + name[position + 2:]
+
+def brute_force_search(keys, query, limit=TOP_K):
+    """Rank every name by edit distance to the query."""
+    query = fuzzy_key(query)
+    distances = [levenshtein(query, key) for key in keys]
+    return np.argsort(distances, kind='stable')[:limit]
+
+def benchmark_name_search(df=None):
+    """Time index and brute-force fuzzy lookups for misspelled roster names."""
+    if df is None:
+        df = load_players()
+    names = df['fullname'].tolist()
+    rng = np.random.default_rng(0)
+    targets = rng.choice(len(names), size=min(QUERY_COUNT, len(names)), replace=False)
+    queries = [misspell(names[target], rng) for target in targets]
+
+    start_time = time.perf_counter()
+    index = NameIndex(names)
+    index.fuzzy_search(queries[0])  # Builds the fuzzy trigram index
+    build_time = time.perf_counter() - start_time
+
+    keys = [fuzzy_key(name) for name in names]
+    index_times, scan_times = [], []
+    index_hits = scan_hits = 0
+    for target, query in zip(targets, queries):
+        start_time = time.perf_counter()
+        found = index.fuzzy_search(query, limit=TOP_K)
+        index_times.append(time.perf_counter() - start_time)
+        index_hits += target in found
+
+        start_time = time.perf_counter()
+        found = brute_force_search(keys, query)
+        scan_times.append(time.perf_counter() - start_time)
+        scan_hits += target in found
+
+    print(f"=== FUZZY NAME SEARCH BENCHMARK ({len(names):,} names, {len(queries)} queries) ===")
+    print(f"Index build: {build_time * 1000:.1f} ms")
+    print(f"{'Method':<16}{'Mean (ms)':>12}{'Max (ms)':>12}{f'Hit@{TOP_K}':>10}")
+    for method, times, hits in (("trigram index", index_times, index_hits), ("brute force", scan_times, scan_hits)):
+        print(f"{method:<16}{np.mean(times) * 1000:>12.2f}{np.max(times) * 1000:>12.2f}{hits:>7}/{len(queries)}")
+    print(f"Speedup: {np.mean(scan_times) / np.mean(index_times):.0f}x")
+
+if __name__ == "__main__":
+    benchmark_name_search()
@@ -0,0 +1,105 @@
+"""
+Content-hash build cache for the analysis pipeline.
+
+A stage's fingerprint covers the contents of its input files, the config values
+it reads and the source code it runs. When the fingerprint matches the one
+recorded after the stage's last successful run and all of its outputs still
+exist, the pipeline skips the stage instead of regenerating identical files.
+"""
+
+import hashlib
+import importlib.util
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from data_store import replace_atomically
+
+_CHUNK_SIZE = 1024 * 1024
+
+def module_path(name):
+    """Return the source file of an importable module without importing it."""
+    spec = importlib.util.find_spec(name)
+    return spec.origin if spec is not None else None
+
+class BuildCache:
+    """Stage fingerprints and file hashes persisted between pipeline runs."""
+    
+    def __init__(self, path=None):
+        self.path = path or config.BUILD_CACHE_PATH
+        self.stages = {}
+        self.files = {}
+        if os.path.exists(self.path):
+            try:
+                with open(self.path, encoding='utf-8') as f:
+                    data = json.load(f)
+                self.stages = data.get('stages', {})
+                self.files = data.get('files', {})
+            except (OSError, ValueError):
+                pass  # An unreadable cache only means a full rebuild
+    
+    def file_hash(self, path):
+        """Return the sha256 of a file's contents, or None if it does not exist.
+
+        The recorded hash is reused while the file's size and mtime are unchanged,
+        so large inputs are only read again after they have been rewritten.
+        """
+        if path is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            return None
+        
+        entry = self.files.get(path)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+        
+        digest = hashlib.sha256()
+        with open(path, 'rb') as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b''):
+                digest.update(chunk)
+        self.files[path] = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': digest.hexdigest()}
+        return digest.hexdigest()
+    
+    def fingerprint(self, stage):
+        """Hash everything that determines a stage's outputs."""
+        payload = {
+            'function': stage.function,
+            'inputs': {path: self.file_hash(path) for path in stage.inputs},
+            'outputs': sorted(stage.outputs),
+            'config': {key: repr(getattr(config, key, None)) for key in stage.config_keys},
+            'sources': {name: self.file_hash(module_path(name)) for name in stage.sources}
+        }
+        return hashlib.sha256(json.dumps(payload, sort_keys=True).encode('utf-8')).hexdigest()
+    
+    def is_current(self, stage, fingerprint):
+        """True if the stage's outputs exist and were built from the same fingerprint."""
+        return (
+            bool(stage.outputs) and
+            self.stages.get(stage.name) == fingerprint and
+            all(os.path.exists(path) for path in stage.outputs)
+        )
+    
+    def record(self, stage, fingerprint):
+        """Remember the fingerprint of a successful run and save the cache."""
+        self.stages[stage.name] = fingerprint
+        self.save()
+    
+    def invalidate(self, stage):
+        """Forget a stage's fingerprint so its next run rebuilds it."""
+        if self.stages.pop(stage.name, None) is not None:
+            self.save()
+    
+    def save(self):
+        """Write the cache file atomically."""
+        data = {'stages': self.stages, 'files': self.files}
+        
+        def write(tmp_path):
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True)
+        
+        replace_atomically(self.path, write)
@@ -1,30 +1,148 @@
-import pandas as pd
+import argparse
+import os
+import sys
 
-# Load your data into a DataFrame
-df = pd.read_csv('data/all_players.csv')
+import numpy as np
 
-print(f"Original data shape: {df.shape}")
-print(f"Columns: {df.columns.tolist()}")
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Standardize column names
-df.columns = [col.strip().lower().replace(' ', '_') for col in df.columns]
+import config
+from data_store import HAS_PARQUET, PlayersWriter, read_raw_players, save_players
+from key_dedup import KeyDeduplicator, key_hashes, sorted_contains
 
-# Remove rows with missing essential information (using actual column names)
-initial_rows = len(df)
-df = df.dropna(subset=['fullname', 'country_name'])
-print(f"Removed {initial_rows - len(df)} rows with missing name or country")
+ESSENTIAL_COLUMNS = ['fullname', 'country_name']
+DUPLICATE_KEY = ['fullname', 'country_name']
 
-# Example: Fill missing numeric fields with appropriate values
-num_cols = df.select_dtypes('number').columns
-df[num_cols] = df[num_cols].fillna(0)
+def normalize_columns(columns):
+    """Standardize column names."""
+    return [col.strip().lower().replace(' ', '_') for col in columns]
 
-# Remove duplicate players (based on fullname and country)
-initial_rows = len(df)
-df = df.drop_duplicates(subset=['fullname', 'country_name'])
-print(f"Removed {initial_rows - len(df)} duplicate players")
+def print_saved():
+    """Print where the cleaned roster was written."""
+    print("Cleaned data saved to 'data/cleaned_all_players.csv'")
+    if HAS_PARQUET:
+        print("Typed columnar copy saved to 'data/cleaned_all_players.parquet'")
 
-print(f"Final cleaned data shape: {df.shape}")
+def clean_data(chunk_size=None):
+    """Clean the raw players data and save it for the later pipeline stages.
+    
+    With a chunk size (default: config.CLEAN_CHUNK_SIZE, 0 loads the whole
+    file) the roster is streamed instead; see clean_data_chunked.
+    
+    Returns the cleaned roster with its storage dtypes applied, or None in
+    chunked mode, where later stages load it from disk.
+    """
+    if chunk_size is None:
+        chunk_size = config.CLEAN_CHUNK_SIZE
+    if chunk_size:
+        clean_data_chunked(chunk_size)
+        return None
+    
+    # Load your data into a DataFrame
+    df = read_raw_players()
+    
+    print(f"Original data shape: {df.shape}")
+    print(f"Columns: {df.columns.tolist()}")
+    
+    # Standardize column names
+    df.columns = normalize_columns(df.columns)
+    
+    # Remove rows with missing essential information (using actual column names)
+    initial_rows = len(df)
+    df = df.dropna(subset=ESSENTIAL_COLUMNS)
+    print(f"Removed {initial_rows - len(df)} rows with missing name or country")
+    
+    # Example: Fill missing numeric fields with appropriate values
+    num_cols = df.select_dtypes('number').columns
+    df[num_cols] = df[num_cols].fillna(0)
+    
+    # Remove duplicate players (based on fullname and country)
+    initial_rows = len(df)
+    df = df.drop_duplicates(subset=DUPLICATE_KEY)
+    print(f"Removed {initial_rows - len(df)} duplicate players")
+    
+    print(f"Final cleaned data shape: {df.shape}")
+    
+    # Save cleaned data for further use
+    cleaned = save_players(df)
+    print_saved()
+    return cleaned
 
-# Save cleaned data for further use
-df.to_csv('data/cleaned_all_players.csv', index=False)
-print("Cleaned data saved to 'data/cleaned_all_players.csv'")
+def _resolve_dtype(kinds):
+    """The dtype pandas infers for a whole column from the dtype kinds of its chunks."""
+    if kinds <= {'i'}:
+        return 'int64'
+    if kinds <= {'i', 'f'}:
+        return 'float64'
+    if kinds == {'b'}:
+        return 'bool'
+    return 'object'
+
+def _read_chunks(chunk_size, dtype=None):
+    """Stream the raw roster with normalized column names and row numbers as index."""
+    start = 0
+    with read_raw_players(chunksize=chunk_size, dtype=dtype) as reader:
+        for chunk in reader:
+            raw_columns = chunk.columns.tolist()
+            chunk.columns = normalize_columns(raw_columns)
+            chunk.index = np.arange(start, start + len(chunk))
+            start += len(chunk)
+            yield raw_columns, chunk
+
+def clean_data_chunked(chunk_size):
+    """Clean the raw roster in chunks of chunk_size rows.
+    
+    The raw file is read twice. The first pass drops rows with missing essential
+    columns, finds duplicates with a KeyDeduplicator and records each column's
+    dtype across all chunks. The second pass reads with those dtypes, so numeric
+    fills and CSV formatting match the in-memory path, and writes the rows that
+    survive as it goes. Peak memory is about one chunk plus 8 bytes per unique
+    key (capped by config.CLEAN_DEDUP_MAX_KEYS) and per duplicate row.
+    
+    Returns the number of rows written.
+    """
+    dedup = KeyDeduplicator()
+    dtype_kinds = {}
+    raw_columns = []
+    total_rows = 0
+    missing_rows = 0
+    
+    for raw_columns, chunk in _read_chunks(chunk_size):
+        for raw_column, column in zip(raw_columns, chunk.columns):
+            dtype_kinds.setdefault(raw_column, set()).add(chunk[column].dtype.kind)
+        total_rows += len(chunk)
+        valid = chunk.dropna(subset=ESSENTIAL_COLUMNS)
+        missing_rows += len(chunk) - len(valid)
+        dedup.add(key_hashes(valid, DUPLICATE_KEY), valid.index)
+    
+    print(f"Original data shape: {(total_rows, len(raw_columns))}")
+    print(f"Columns: {raw_columns}")
+    print(f"Removed {missing_rows} rows with missing name or country")
+    
+    if dedup.spilled:
+        print("Duplicate keys exceeded the in-memory limit and are resolved on disk")
+    duplicates = dedup.finish()
+    dtypes = {column: _resolve_dtype(kinds) for column, kinds in dtype_kinds.items()}
+    
+    with PlayersWriter() as writer:
+        for _, chunk in _read_chunks(chunk_size, dtype=dtypes):
+            chunk = chunk.dropna(subset=ESSENTIAL_COLUMNS)
+            chunk = chunk[~sorted_contains(duplicates, chunk.index.to_numpy())].copy()
+            num_cols = chunk.select_dtypes('number').columns
+            chunk[num_cols] = chunk[num_cols].fillna(0)
+            writer.write(chunk)
+    
+    print(f"Removed {len(duplicates)} duplicate players")
+    print(f"Final cleaned data shape: {(writer.rows, len(raw_columns))}")
+    print_saved()
+    return writer.rows
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Clean the raw players data.")
+    parser.add_argument(
+        "--chunk-size",
+        type=int,
+        default=None,
+        help="stream the raw file in chunks of this many rows (default: config.CLEAN_CHUNK_SIZE, 0 = load it whole)"
+    )
+    clean_data(parser.parse_args().chunk_size)
@@ -0,0 +1,241 @@
+"""
+Shared data access for the cricket players dataset.
+
+The cleaned roster is stored as typed Parquet next to the cleaned CSV, with
+categorical dtypes for the low-cardinality columns and a pre-parsed date of
+birth. Every script and the dashboard load the roster through load_players(),
+which falls back to the CSV when pyarrow is missing or the Parquet copy is
+out of date.
+"""
+
+import os
+import sys
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+try:
+    import pyarrow  # noqa: F401
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
+CATEGORICAL_COLUMNS = ['country_name', 'continent_name', 'gender', 'position', 'battingstyle', 'bowlingstyle']
+DATE_FORMAT = '%d-%m-%Y'
+
+# Columns added by apply_dtypes that are not part of the CSV schema
+DERIVED_COLUMNS = ['dateofbirth_clean']
+
+def csv_fallback_path(path):
+    """Return the CSV path used in place of a Parquet file."""
+    return os.path.splitext(path)[0] + '.csv'
+
+def replace_atomically(path, write):
+    """Write a file through a temporary sibling so readers never see a partial file."""
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    write(tmp_path)
+    os.replace(tmp_path, path)
+
+def write_table(df, path):
+    """Write a frame as Parquet, or as CSV when pyarrow is unavailable.
+
+    Returns the path that was actually written.
+    """
+    if HAS_PARQUET:
+        replace_atomically(path, lambda tmp: df.to_parquet(tmp, index=False, engine='pyarrow'))
+        return path
+    csv_path = csv_fallback_path(path)
+    replace_atomically(csv_path, lambda tmp: df.to_csv(tmp, index=False))
+    return csv_path
+
+def read_table(path, **csv_kwargs):
+    """Read a table written by write_table, or return None if it does not exist."""
+    if HAS_PARQUET and os.path.exists(path):
+        return pd.read_parquet(path)
+    csv_path = csv_fallback_path(path)
+    if os.path.exists(csv_path):
+        return pd.read_csv(csv_path, **csv_kwargs)
+    return None
+
+def add_derived_columns(df):
+    """Add the parsed date of birth to a roster frame."""
+    if 'dateofbirth' in df.columns and 'dateofbirth_clean' not in df.columns:
+        df['dateofbirth_clean'] = pd.to_datetime(df['dateofbirth'], format=DATE_FORMAT, errors='coerce')
+    return df
+
+def apply_dtypes(df):
+    """Convert roster columns to their storage dtypes and add the parsed date of birth."""
+    for column in CATEGORICAL_COLUMNS:
+        if column in df.columns and not isinstance(df[column].dtype, pd.CategoricalDtype):
+            df[column] = df[column].astype('category')
+    return add_derived_columns(df)
+
+def fill_missing(series, value):
+    """Fill missing values, adding the fill value as a category when needed."""
+    if isinstance(series.dtype, pd.CategoricalDtype) and value not in series.cat.categories:
+        series = series.cat.add_categories([value])
+    return series.fillna(value)
+
+def _is_text(series):
+    """True for object and string columns, including pandas 3's default str dtype."""
+    return pd.api.types.is_object_dtype(series) or pd.api.types.is_string_dtype(series)
+
+def compact_frame(df, max_category_ratio=0.5):
+    """Return a copy of df in its smallest practical dtypes.
+
+    String columns with at most max_category_ratio distinct values per row
+    become categorical, and integer and float columns are downcast to the
+    narrowest type that holds their values.
+    """
+    columns = {}
+    for column in df.columns:
+        series = df[column]
+        if _is_text(series) and series.nunique() <= max_category_ratio * len(series):
+            series = series.astype('category')
+        elif pd.api.types.is_integer_dtype(series.dtype):
+            series = pd.to_numeric(series, downcast='integer')
+        elif pd.api.types.is_float_dtype(series.dtype):
+            series = pd.to_numeric(series, downcast='float')
+        columns[column] = series
+    return pd.DataFrame(columns, index=df.index)
+
+def read_raw_players(path=None, **kwargs):
+    """Read the raw players CSV."""
+    return pd.read_csv(path or config.DATA_PATH, **kwargs)
+
+def save_players(df, csv_path=None, parquet_path=None):
+    """Save the cleaned roster as CSV plus a typed Parquet copy.
+
+    Returns the typed frame, identical to what load_players() will read back.
+    """
+    csv_path = csv_path or config.CLEANED_DATA_PATH
+    parquet_path = parquet_path or config.CLEANED_PARQUET_PATH
+    
+    csv_columns = [column for column in df.columns if column not in DERIVED_COLUMNS]
+    replace_atomically(csv_path, lambda tmp: df[csv_columns].to_csv(tmp, index=False))
+    typed = apply_dtypes(df[csv_columns].reset_index(drop=True))
+    if HAS_PARQUET:
+        replace_atomically(parquet_path, lambda tmp: typed.to_parquet(tmp, index=False, engine='pyarrow'))
+    return typed
+
+def data_version(csv_path=None, parquet_path=None, stats_path=None):
+    """Identify the published data by the size and mtime of its files.
+
+    Covers the cleaned roster and the synthetic stats table built from it, so
+    it changes whenever clean_data rewrites the roster or stats_table
+    republishes the table; derived results stored with this version are stale
+    once it differs.
+    """
+    parts = []
+    paths = (
+        csv_path or config.CLEANED_DATA_PATH,
+        parquet_path or config.CLEANED_PARQUET_PATH,
+        stats_path or config.STATS_TABLE_PATH
+    )
+    for path in paths:
+        try:
+            stat = os.stat(path)
+            parts.append(f"{stat.st_size}:{stat.st_mtime_ns}")
+        except FileNotFoundError:
+            parts.append("-")
+    return "/".join(parts)
+
+class PlayersWriter:
+    """Write the cleaned roster one chunk at a time.
+
+    Produces the same files as save_players: the cleaned CSV and, with pyarrow,
+    the Parquet copy. The categorical columns are stored as plain strings,
+    because every chunk has its own categories; load_players converts them
+    back. Both files are written to temporary siblings and only replace the
+    existing ones when close() is called, the CSV first so the Parquet copy
+    stays the newer file.
+    """
+    
+    def __init__(self, csv_path=None, parquet_path=None):
+        self.csv_path = csv_path or config.CLEANED_DATA_PATH
+        self.parquet_path = (parquet_path or config.CLEANED_PARQUET_PATH) if HAS_PARQUET else None
+        self.rows = 0
+        self._csv_file = None
+        self._parquet_writer = None
+        self._schema = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+    
+    def write(self, df):
+        """Append a chunk of cleaned rows to both files."""
+        csv_columns = [column for column in df.columns if column not in DERIVED_COLUMNS]
+        if self._csv_file is None:
+            for path in (self.csv_path, self.parquet_path):
+                if path and os.path.dirname(path):
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+            self._csv_file = open(f"{self.csv_path}.tmp", 'w', encoding='utf-8', newline='')
+            df[csv_columns].to_csv(self._csv_file, index=False)
+        else:
+            df[csv_columns].to_csv(self._csv_file, index=False, header=False)
+        
+        if self.parquet_path:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            
+            frame = add_derived_columns(df[csv_columns].reset_index(drop=True))
+            if self._schema is None:
+                self._schema = pa.schema([
+                    (column, pa.string() if _is_text(frame[column]) else pa.from_numpy_dtype(frame[column].dtype))
+                    for column in frame.columns
+                ])
+                self._parquet_writer = pq.ParquetWriter(f"{self.parquet_path}.tmp", self._schema)
+            self._parquet_writer.write_table(pa.Table.from_pandas(frame, schema=self._schema, preserve_index=False))
+        self.rows += len(df)
+    
+    def close(self):
+        """Finish both files and move them into place."""
+        if self._csv_file is None:
+            return
+        self._csv_file.close()
+        os.replace(f"{self.csv_path}.tmp", self.csv_path)
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            os.replace(f"{self.parquet_path}.tmp", self.parquet_path)
+        self._csv_file = self._parquet_writer = None
+    
+    def abort(self):
+        """Discard the partially written files."""
+        if self._csv_file is not None:
+            self._csv_file.close()
+            os.remove(f"{self.csv_path}.tmp")
+        if self._parquet_writer is not None:
+            self._parquet_writer.close()
+            os.remove(f"{self.parquet_path}.tmp")
+        self._csv_file = self._parquet_writer = None
+
+def load_players(csv_path=None, parquet_path=None):
+    """Load the cleaned roster with categorical dtypes and a parsed date of birth.
+
+    The Parquet copy is used when it exists and is at least as new as the CSV;
+    otherwise the CSV is parsed with the same dtypes.
+    """
+    csv_path = csv_path or config.CLEANED_DATA_PATH
+    parquet_path = parquet_path or config.CLEANED_PARQUET_PATH
+    
+    parquet_current = (
+        HAS_PARQUET and os.path.exists(parquet_path) and
+        (not os.path.exists(csv_path) or os.path.getmtime(parquet_path) >= os.path.getmtime(csv_path))
+    )
+    if parquet_current:
+        df = pd.read_parquet(parquet_path)
+    else:
+        df = pd.read_csv(csv_path, dtype={column: 'category' for column in CATEGORICAL_COLUMNS})
+    return apply_dtypes(df)
@@ -0,0 +1,64 @@
+"""
+Bounded LRU cache of serialized Plotly figures.
+
+Figures are stored as JSON under a key the caller derives from everything
+that shapes them (chart name, data version, theme and chart parameters), so a
+hit skips both the aggregation and the figure construction. The least
+recently used entry is evicted once the cache is full. Hits and misses are
+counted for the dashboard's debug panel.
+"""
+
+import threading
+from collections import OrderedDict
+
+import plotly.io as pio
+
+class FigureCache:
+    """Thread-safe LRU cache of figure JSON keyed by hashable tuples."""
+    
+    def __init__(self, max_entries=32):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    def get(self, key, build):
+        """Return the cached figure for key, calling build() to create it on a miss.
+        
+        build may return None (nothing to draw); that result is cached too.
+        """
+        with self._lock:
+            hit = key in self._entries
+            if hit:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                serialized = self._entries[key]
+            else:
+                self.misses += 1
+        if hit:
+            return None if serialized is None else pio.from_json(serialized)
+        
+        fig = build()
+        serialized = None if fig is None else fig.to_json()
+        with self._lock:
+            self._entries[key] = serialized
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return fig
+    
+    def stats(self):
+        """Hit and miss counts, current size and capacity."""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses,
+                    'entries': len(self._entries), 'max_entries': self.max_entries}
+    
+    def clear(self):
+        """Drop every entry and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
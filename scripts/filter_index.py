@@ -0,0 +1,114 @@
+"""
+Bitmap filter index for the dashboard's Advanced Filters.
+
+Every value of the categorical filter columns gets a packed bitmap of the rows
+holding it, and the range columns are kept as row ids sorted by value. A
+filter combination is answered by OR-ing the bitmaps of the values selected in
+each column and AND-ing the columns together, without touching the frame; the
+match count is a popcount over the packed bytes, and row ids are only
+materialized when the caller asks for them. Matches can be ordered by any
+column through a per-column rank array, so a page of results is found without
+sorting or copying the frame.
+"""
+
+import numpy as np
+import pandas as pd
+
+FILTER_COLUMNS = ['country_name', 'gender', 'battingstyle', 'bowlingstyle', 'position']
+RANGE_COLUMNS = ['age']
+
+# Number of set bits in every byte value
+_POPCOUNT = np.array([bin(value).count('1') for value in range(256)], dtype=np.uint8)
+
+class Selection:
+    """Rows matching a filter combination, as a packed bitmap."""
+    
+    def __init__(self, bits, rows):
+        self.bits = bits
+        self.rows = rows
+    
+    @property
+    def count(self):
+        """Number of matching rows, counted without unpacking the bitmap."""
+        return int(_POPCOUNT[self.bits].sum(dtype=np.int64))
+    
+    def row_ids(self):
+        """Positions of the matching rows, in frame order."""
+        return np.flatnonzero(np.unpackbits(self.bits, count=self.rows))
+
+class FilterIndex:
+    """Per-value bitmaps and sorted range indexes over a roster frame."""
+    
+    def __init__(self, df, columns=FILTER_COLUMNS, range_columns=RANGE_COLUMNS, sort_columns=()):
+        self.rows = len(df)
+        self._bitmaps = {}
+        for column in columns:
+            values = df[column]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                codes = values.cat.codes.to_numpy()
+                labels = values.cat.categories
+            else:
+                codes, labels = pd.factorize(values)
+            self._bitmaps[column] = {
+                label: np.packbits(codes == code) for code, label in enumerate(labels)
+            }
+        
+        self._ranges = {}
+        for column in range_columns:
+            values = df[column].to_numpy(dtype=float)
+            order = np.argsort(values, kind='stable')
+            self._ranges[column] = (values[order], order)
+        
+        # Position of every row when the frame is sorted by each sort column
+        self._ranks = {}
+        for column in sort_columns:
+            order = df[column].reset_index(drop=True).sort_values(kind='stable', na_position='last').index.to_numpy()
+            rank = np.empty(self.rows, dtype=np.int64)
+            rank[order] = np.arange(self.rows)
+            self._ranks[column] = rank
+    
+    def _empty(self):
+        return np.zeros((self.rows + 7) // 8, dtype=np.uint8)
+    
+    def _full(self):
+        return np.packbits(np.ones(self.rows, dtype=bool))
+    
+    def values_bits(self, column, values):
+        """Bitmap of the rows whose column holds any of the values."""
+        bitmaps = self._bitmaps[column]
+        bits = self._empty()
+        for value in values:
+            if value in bitmaps:
+                bits |= bitmaps[value]
+        return bits
+    
+    def range_bits(self, column, low, high):
+        """Bitmap of the rows whose column lies in [low, high]."""
+        sorted_values, order = self._ranges[column]
+        start = np.searchsorted(sorted_values, low, side='left')
+        stop = np.searchsorted(sorted_values, high, side='right')
+        mask = np.zeros(self.rows, dtype=bool)
+        mask[order[start:stop]] = True
+        return np.packbits(mask)
+    
+    def select(self, values=None, ranges=None):
+        """Rows matching every filter.
+        
+        values maps a column to the values it may take; columns that are not
+        given or map to an empty list are not filtered. ranges maps a column to
+        an inclusive (low, high) pair.
+        """
+        bits = self._full()
+        for column, selected in (values or {}).items():
+            if len(selected) > 0:
+                bits &= self.values_bits(column, selected)
+        for column, (low, high) in (ranges or {}).items():
+            bits &= self.range_bits(column, low, high)
+        return Selection(bits, self.rows)
+    
+    def sorted_row_ids(self, selection, column, descending=False):
+        """Row ids of a selection ordered by one of the index's sort columns."""
+        row_ids = selection.row_ids()
+        rank = self._ranks[column][row_ids]
+        order = np.argsort(-rank if descending else rank)
+        return row_ids[order]
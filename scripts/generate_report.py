@@ -1,12 +1,19 @@
-import pandas as pd
 from datetime import datetime
 import os
 
-def generate_summary_report():
+from data_store import load_players
+from roster_summary import load_summary
+
+def generate_summary_report(df=None):
     """Generate a comprehensive markdown report of the analysis."""
     
     # Load cleaned data
-    df = pd.read_csv('data/cleaned_all_players.csv')
+    if df is None:
+        df = load_players()
+    summary = load_summary(df)
+    gender_counts = summary.counts('gender')
+    male_count = int(gender_counts.get('m', 0))
+    female_count = int(gender_counts.get('f', 0))
     
     # Prepare report content
     report_content = f"""# Cricket Players Data Analysis Report
@@ -14,10 +21,10 @@ def generate_summary_report():
 **Generated on:** {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
 
 ## Dataset Overview
-- **Total Players:** {len(df):,}
-- **Countries Represented:** {df['country_name'].nunique()}
-- **Continents:** {df['continent_name'].nunique()}
-- **Data Quality:** {len(df)} unique players (removed duplicates)
+- **Total Players:** {summary.rows:,}
+- **Countries Represented:** {summary.nunique('country_name')}
+- **Continents:** {summary.nunique('continent_name')}
+- **Data Quality:** {summary.rows} unique players (removed duplicates)
 
 ## Key Statistics
 
@@ -25,25 +32,25 @@ def generate_summary_report():
 """
     
     # Add top countries
-    country_counts = df['country_name'].value_counts().head(10)
+    country_counts = summary.counts('country_name').head(10)
     for i, (country, count) in enumerate(country_counts.items(), 1):
         report_content += f"{i}. **{country}**: {count:,} players\n"
     
     report_content += f"""
 ### Demographics
-- **Male Players:** {df[df['gender'] == 'm'].shape[0]:,} ({df[df['gender'] == 'm'].shape[0]/len(df)*100:.1f}%)
-- **Female Players:** {df[df['gender'] == 'f'].shape[0]:,} ({df[df['gender'] == 'f'].shape[0]/len(df)*100:.1f}%)
+- **Male Players:** {male_count:,} ({male_count/summary.rows*100:.1f}%)
+- **Female Players:** {female_count:,} ({female_count/summary.rows*100:.1f}%)
 
 ### Playing Styles
 """
     
     # Add batting styles
-    batting_styles = df['battingstyle'].value_counts()
+    batting_styles = summary.counts('battingstyle')
     for style, count in batting_styles.items():
         report_content += f"- **{style.title()}**: {count:,} players\n"
     
     report_content += "\n### Continental Distribution\n"
-    continent_counts = df['continent_name'].value_counts()
+    continent_counts = summary.counts('continent_name')
     for continent, count in continent_counts.items():
         report_content += f"- **{continent}**: {count:,} players\n"
     
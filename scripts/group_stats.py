@@ -0,0 +1,87 @@
+"""
+Per-group statistics tables shown on the dashboard.
+
+Every table is built from built-in groupby reductions over precomputed
+columns instead of Python lambdas: the average of positive ages is a mean over
+ages masked to NaN, the female share is the mean of a boolean column, and the
+most common batting style and the number of countries are an argmax and a
+nonzero count over a bincount of category codes.
+Expects the dashboard's roster frame, which has an age column with 0 for
+unknown ages.
+"""
+
+import numpy as np
+import pandas as pd
+
+def _group_frame(df, key):
+    """Columns the tables aggregate, grouped by key."""
+    work = pd.DataFrame({
+        'fullname': df['fullname'],
+        'age': df['age'].where(df['age'] > 0),
+        'female': df['gender'] == 'f'
+    })
+    return work.groupby(df[key], observed=True)
+
+def _codes(series):
+    """Category codes and labels of a column."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories
+    return pd.factorize(series, sort=True)
+
+def _pair_counts(df, key, column):
+    """Rows per (group of key, value of column) pair, with the group and value labels."""
+    group_codes, groups = _codes(df[key])
+    value_codes, values = _codes(df[column])
+    valid = (group_codes >= 0) & (value_codes >= 0)
+    counts = np.bincount(
+        group_codes[valid].astype(np.int64) * len(values) + value_codes[valid],
+        minlength=len(groups) * len(values)
+    ).reshape(len(groups), len(values))
+    return counts, groups, values
+
+def group_mode(df, key, column, default='Unknown'):
+    """Most common value of column within each group of key.
+
+    Ties go to the first value in category order, like Series.mode().iloc[0].
+    Groups with no values get default.
+    """
+    counts, groups, values = _pair_counts(df, key, column)
+    modes = np.where(counts.max(axis=1) > 0, np.asarray(values, dtype=object)[counts.argmax(axis=1)], default)
+    return pd.Series(modes, index=pd.Index(groups, name=key))
+
+def group_nunique(df, key, column):
+    """Number of distinct non-missing values of column within each group of key."""
+    counts, groups, _ = _pair_counts(df, key, column)
+    return pd.Series(np.count_nonzero(counts, axis=1), index=pd.Index(groups, name=key))
+
+def country_statistics(df):
+    """Players, average age and share of female players per country, largest first."""
+    grouped = _group_frame(df, 'country_name')
+    stats = pd.DataFrame({
+        'Total Players': grouped['fullname'].count(),
+        'Average Age': grouped['age'].mean(),
+        'Female %': grouped['female'].mean() * 100
+    }).round(2)
+    return stats.sort_values('Total Players', ascending=False, kind='stable')
+
+def position_statistics(df):
+    """Players, average age and number of countries per position, largest first."""
+    grouped = _group_frame(df, 'position')
+    stats = pd.DataFrame({
+        'Total Players': grouped['fullname'].count(),
+        'Average Age': grouped['age'].mean(),
+    }).round(2)
+    stats['Countries Represented'] = group_nunique(df, 'position', 'country_name').reindex(stats.index)
+    return stats.sort_values('Total Players', ascending=False, kind='stable')
+
+def comparison_statistics(df, countries):
+    """Players, average age, female players and most common batting style of the given countries."""
+    subset = df[df['country_name'].isin(countries)]
+    grouped = _group_frame(subset, 'country_name')
+    stats = pd.DataFrame({
+        'Total Players': grouped['fullname'].count(),
+        'Average Age': grouped['age'].mean(),
+        'Female Players': grouped['female'].sum()
+    }).round(2)
+    stats['Most Common Batting Style'] = group_mode(subset, 'country_name', 'battingstyle').reindex(stats.index)
+    return stats
@@ -0,0 +1,128 @@
+"""
+Duplicate detection for rosters streamed in chunks.
+
+Rows are matched on a 64-bit hash of their key columns. Keys seen so far are
+kept in memory as sorted numpy runs, 8 bytes per key. Once there are more keys
+than the configured limit they spill to on-disk hash partitions and duplicates
+are resolved one partition at a time at the end, so memory stays bounded by a
+single partition however large the roster is.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+# Spilled keys were first seen before any partitioned row, so they sort first
+_SEEN_BEFORE = -1
+_MAX_RUNS = 8
+
+def key_hashes(df, columns):
+    """64-bit hash of each row's key columns, compared as strings."""
+    return pd.util.hash_pandas_object(df[columns].astype(str), index=False).to_numpy()
+
+def _first_occurrences(hashes):
+    """Mask of the rows whose hash does not appear earlier in the array."""
+    mask = np.zeros(len(hashes), dtype=bool)
+    mask[np.unique(hashes, return_index=True)[1]] = True
+    return mask
+
+def sorted_contains(sorted_values, values):
+    """Mask of the values present in a sorted array."""
+    if len(sorted_values) == 0:
+        return np.zeros(len(values), dtype=bool)
+    positions = np.minimum(np.searchsorted(sorted_values, values), len(sorted_values) - 1)
+    return sorted_values[positions] == values
+
+class KeyDeduplicator:
+    """Find the rows whose key was already seen earlier in the stream.
+    
+    Feed it the key hashes of every chunk in order with add(); finish() returns
+    the sorted row numbers of all duplicates, which is what
+    DataFrame.drop_duplicates(keep='first') would drop.
+    """
+    
+    def __init__(self, max_keys=None, partitions=None):
+        self.max_keys = config.CLEAN_DEDUP_MAX_KEYS if max_keys is None else max_keys
+        self.partitions = partitions or config.CLEAN_DEDUP_PARTITIONS
+        self.key_count = 0
+        self._runs = []
+        self._dropped = []
+        self._spill_dir = None
+    
+    @property
+    def spilled(self):
+        """True once keys are kept in on-disk partitions instead of memory."""
+        return self._spill_dir is not None
+    
+    def add(self, hashes, rows):
+        """Record a chunk's key hashes and their row numbers."""
+        hashes = np.asarray(hashes, dtype=np.uint64)
+        rows = np.asarray(rows, dtype=np.int64)
+        if self.spilled:
+            self._append_partitions(hashes, rows)
+            return
+        
+        keep = _first_occurrences(hashes)
+        for run in self._runs:
+            keep &= ~sorted_contains(run, hashes)
+        self._dropped.append(rows[~keep])
+        
+        self._runs.append(np.sort(hashes[keep]))
+        self.key_count += int(keep.sum())
+        if len(self._runs) > _MAX_RUNS:
+            self._runs = [np.sort(np.concatenate(self._runs))]
+        if self.key_count > self.max_keys:
+            self._spill()
+    
+    def _spill(self):
+        """Move the in-memory keys to on-disk partitions."""
+        self._spill_dir = tempfile.mkdtemp(prefix='dedup-')
+        for run in self._runs:
+            self._append_partitions(run, np.full(len(run), _SEEN_BEFORE, dtype=np.int64))
+        self._runs = []
+    
+    def _partition_paths(self, partition):
+        base = os.path.join(self._spill_dir, f"part-{partition:04d}")
+        return f"{base}.hashes", f"{base}.rows"
+    
+    def _append_partitions(self, hashes, rows):
+        assignments = hashes % np.uint64(self.partitions)
+        for partition in np.unique(assignments):
+            mask = assignments == partition
+            hashes_path, rows_path = self._partition_paths(int(partition))
+            with open(hashes_path, 'ab') as f:
+                hashes[mask].tofile(f)
+            with open(rows_path, 'ab') as f:
+                rows[mask].tofile(f)
+    
+    def finish(self):
+        """Return the sorted row numbers of every duplicate and remove the spill files."""
+        dropped = list(self._dropped)
+        if self.spilled:
+            try:
+                for partition in range(self.partitions):
+                    hashes_path, rows_path = self._partition_paths(partition)
+                    if not os.path.exists(hashes_path):
+                        continue
+                    hashes = np.fromfile(hashes_path, dtype=np.uint64)
+                    rows = np.fromfile(rows_path, dtype=np.int64)
+                    # Within each key, the earliest row comes first and is kept
+                    order = np.lexsort((rows, hashes))
+                    hashes, rows = hashes[order], rows[order]
+                    repeat = np.zeros(len(hashes), dtype=bool)
+                    repeat[1:] = hashes[1:] == hashes[:-1]
+                    dropped.append(rows[repeat])
+            finally:
+                shutil.rmtree(self._spill_dir, ignore_errors=True)
+                self._spill_dir = None
+        if not dropped:
+            return np.zeros(0, dtype=np.int64)
+        return np.sort(np.concatenate(dropped))
@@ -1,5 +1,5 @@
-import pandas as pd
-df = pd.read_csv('data/cleaned_all_players.csv')
+from data_store import load_players
+df = load_players()
 
 print(df.head())
-print(df.info())
+print(df.info(memory_usage='deep'))
@@ -0,0 +1,187 @@
+"""
+Case-insensitive and typo-tolerant player name search.
+
+NameIndex keeps a posting list of row positions for every 1-, 2- and 3-gram of
+the lowercased full names, along with where each gram first occurs in the name.
+A query is answered by intersecting the posting lists of its n-grams and, for
+queries longer than three characters, checking the surviving candidates with a
+plain substring test. The result set is exactly the rows whose full name
+contains the query, ignoring case, with exact matches and matches at the start
+of a name or word ranked first.
+
+Ranking works on integer keys computed in one vectorized pass: the match
+class and first match offset come from the posting lists, and names are
+ordered by a rank precomputed at build time. Only the best limit results are
+then sorted, so a one-letter query that matches most of the roster costs a
+few array operations rather than a Python sort over every match.
+
+Fuzzy search uses a second trigram index over accent-folded names. Every name
+sharing a trigram with the query is scored by trigram similarity in one
+vectorized pass, and the best few are ordered by edit distance, so a typo or a
+transliteration variant still finds the player without scanning every name.
+"""
+
+import re
+import unicodedata
+from collections import defaultdict
+from functools import reduce
+
+import numpy as np
+
+GRAM_SIZE = 3
+FUZZY_SHORTLIST = 50
+
+def normalize_name(name):
+    """Lowercase form of a name used for matching; missing names match nothing."""
+    return name.lower() if isinstance(name, str) else ''
+
+def fuzzy_key(name):
+    """Accent-folded, lowercase name with punctuation and extra spaces removed."""
+    if not isinstance(name, str):
+        return ''
+    decomposed = unicodedata.normalize('NFKD', name)
+    folded = ''.join(char for char in decomposed if not unicodedata.combining(char)).lower()
+    return ' '.join(re.sub(r'[\W_]+', ' ', folded).split())
+
+def _grams(text, size):
+    """Distinct substrings of a given length."""
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+def _fuzzy_grams(key):
+    """Trigrams of a fuzzy key, padded so the first and last letters form trigrams of their own."""
+    return _grams(f"  {key} ", GRAM_SIZE) if key else set()
+
+def levenshtein(a, b):
+    """Edit distance between two strings (insertions, deletions and substitutions)."""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+class NameIndex:
+    """N-gram index over a column of full names, addressed by row position."""
+    
+    def __init__(self, names):
+        self.names = [normalize_name(name) for name in names]
+        self._raw_names = list(names)
+        self._fuzzy = None
+        postings = defaultdict(list)
+        offsets = defaultdict(list)
+        word_starts = defaultdict(list)
+        for position, name in enumerate(self.names):
+            for size in range(1, GRAM_SIZE + 1):
+                for gram in _grams(name, size):
+                    postings[gram].append(position)
+                    offsets[gram].append(name.find(gram))
+            # Trigrams that start a word after the first, for " query" tests of three letters
+            for gram in {name[i + 1:i + 1 + GRAM_SIZE] for i, char in enumerate(name) if char == ' '}:
+                if len(gram) == GRAM_SIZE:
+                    word_starts[gram].append(position)
+        self._postings = {gram: np.asarray(rows, dtype=np.int64) for gram, rows in postings.items()}
+        self._offsets = {gram: np.asarray(first, dtype=np.int64) for gram, first in offsets.items()}
+        self._word_starts = {gram: np.asarray(rows, dtype=np.int64) for gram, rows in word_starts.items()}
+        self._lengths = np.fromiter((len(name) for name in self.names), dtype=np.int64, count=len(self.names))
+        # Alphabetical rank of every name, ties broken by row position
+        self._name_ranks = np.empty(len(self.names), dtype=np.int64)
+        self._name_ranks[sorted(range(len(self.names)), key=self.names.__getitem__)] = np.arange(len(self.names))
+    
+    def __len__(self):
+        return len(self.names)
+    
+    def _matches(self, query):
+        """Row positions containing query, with the offset of the first match and word-start flags."""
+        if len(query) <= GRAM_SIZE:
+            # The query is a gram itself: its posting list is the answer
+            candidates = self._postings.get(query)
+            if candidates is None:
+                return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+            word_rows = self._postings.get(f" {query}") if len(query) < GRAM_SIZE else self._word_starts.get(query)
+            at_word = np.zeros(len(candidates), dtype=bool) if word_rows is None else np.isin(candidates, word_rows)
+            return candidates, self._offsets[query], at_word
+        
+        lists = [self._postings.get(gram) for gram in _grams(query, GRAM_SIZE)]
+        if any(rows is None for rows in lists):
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64), np.zeros(0, dtype=bool)
+        # Intersect the shortest posting lists first
+        lists.sort(key=len)
+        candidates = reduce(lambda left, right: np.intersect1d(left, right, assume_unique=True), lists)
+        offsets = np.fromiter((self.names[position].find(query) for position in candidates.tolist()),
+                              dtype=np.int64, count=len(candidates))
+        found = offsets >= 0
+        candidates, offsets = candidates[found], offsets[found]
+        at_word = np.fromiter((f" {query}" in self.names[position] for position in candidates.tolist()),
+                              dtype=bool, count=len(candidates))
+        return candidates, offsets, at_word
+    
+    def search(self, query, limit=None):
+        """Row positions of the names containing query, ignoring case, best matches first.
+        
+        Exact matches come first, then names starting with the query, then
+        names with a word starting with it, then the rest; within each, the
+        earliest match and then the name in alphabetical order.
+        """
+        query = normalize_name(query)
+        if not query:
+            return np.arange(len(self.names))[:limit]
+        
+        candidates, offsets, at_word = self._matches(query)
+        if len(candidates) == 0:
+            return candidates
+        match = np.where(
+            offsets == 0,
+            np.where(self._lengths[candidates] == len(query), 0, 1),
+            np.where(at_word, 2, 3)
+        )
+        rows = len(self.names)
+        keys = (match * (self._lengths.max() + 1) + offsets) * rows + self._name_ranks[candidates]
+        if limit is not None and limit < len(keys):
+            best = np.argpartition(keys, limit - 1)[:limit]
+            return candidates[best[np.argsort(keys[best])]]
+        return candidates[np.argsort(keys)]
+    
+    def _fuzzy_index(self):
+        """Trigram postings over the fuzzy keys, built on the first fuzzy query."""
+        if self._fuzzy is None:
+            keys = [fuzzy_key(name) for name in self._raw_names]
+            postings = defaultdict(list)
+            gram_counts = np.zeros(len(keys), dtype=np.int64)
+            for position, key in enumerate(keys):
+                grams = _fuzzy_grams(key)
+                gram_counts[position] = len(grams)
+                for gram in grams:
+                    postings[gram].append(position)
+            postings = {gram: np.asarray(rows, dtype=np.int64) for gram, rows in postings.items()}
+            self._fuzzy = (keys, postings, gram_counts)
+        return self._fuzzy
+    
+    def fuzzy_search(self, query, limit=10):
+        """Row positions of the names most similar to query, best first.
+        
+        Names are scored by trigram (Jaccard) similarity to the query; the top
+        FUZZY_SHORTLIST are then ordered by similarity and edit distance.
+        Names sharing no trigram with the query are never returned.
+        """
+        keys, postings, gram_counts = self._fuzzy_index()
+        query = fuzzy_key(query)
+        grams = _fuzzy_grams(query)
+        lists = [postings[gram] for gram in grams if gram in postings]
+        if not lists:
+            return np.zeros(0, dtype=np.int64)
+        
+        shared = np.bincount(np.concatenate(lists), minlength=len(keys))
+        similarity = shared / (len(grams) + gram_counts - shared)
+        candidates = np.flatnonzero(shared)
+        if len(candidates) > FUZZY_SHORTLIST:
+            best = np.argpartition(-similarity[candidates], FUZZY_SHORTLIST - 1)[:FUZZY_SHORTLIST]
+            candidates = candidates[best]
+        
+        ranked = sorted(
+            candidates.tolist(),
+            key=lambda position: (-similarity[position], levenshtein(query, keys[position]), keys[position])
+        )
+        return np.asarray(ranked[:limit], dtype=np.int64)
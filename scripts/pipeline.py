@@ -0,0 +1,321 @@
+"""
+Dependency-graph scheduler for the analysis pipeline.
+
+Stages declare the stages they depend on and the files they read and write.
+In parallel mode every stage whose dependencies have finished is dispatched to
+a process pool, so independent stages run concurrently, and a failing stage
+only skips the stages that depend on it. With a build cache, stages whose
+inputs, config values and code are unchanged since their last successful run
+are not run again.
+"""
+
+import contextlib
+import importlib
+import io
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+import traceback
+import tracemalloc
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+COMPLETED = 'completed'
+CACHED = 'cached'
+FAILED = 'failed'
+SKIPPED = 'skipped'
+
+MODES = ['parallel', 'in-process', 'subprocess']
+
+StageResult = namedtuple('StageResult', ['name', 'status', 'elapsed', 'peak', 'output', 'value'])
+
+class Stage:
+    """A pipeline stage: a function in one of the scripts plus its place in the graph."""
+    
+    def __init__(self, name, description, function, depends_on=(), inputs=(), outputs=(),
+                 config_keys=(), sources=(), provides_data=False):
+        self.name = name
+        self.description = description
+        self.function = function
+        self.depends_on = tuple(depends_on)
+        self.inputs = tuple(inputs)
+        self.outputs = tuple(outputs)
+        # Config values and modules (besides the stage's own script) that shape the outputs
+        self.config_keys = tuple(config_keys)
+        self.sources = (name,) + tuple(sources)
+        # The in-process runner shares this stage's return value with its dependents
+        self.provides_data = provides_data
+    
+    def __repr__(self):
+        return f"Stage({self.name!r})"
+
+def topological_order(stages):
+    """Order stages so each comes after its dependencies.
+
+    Raises ValueError for unknown dependencies or dependency cycles.
+    """
+    by_name = {stage.name: stage for stage in stages}
+    for stage in stages:
+        for dependency in stage.depends_on:
+            if dependency not in by_name:
+                raise ValueError(f"Stage '{stage.name}' depends on unknown stage '{dependency}'")
+    
+    order = []
+    state = {}
+    
+    def visit(stage, path):
+        if state.get(stage.name) == 'done':
+            return
+        if state.get(stage.name) == 'visiting':
+            raise ValueError(f"Dependency cycle: {' -> '.join(path + [stage.name])}")
+        state[stage.name] = 'visiting'
+        for dependency in stage.depends_on:
+            visit(by_name[dependency], path + [stage.name])
+        state[stage.name] = 'done'
+        order.append(stage)
+    
+    for stage in stages:
+        visit(stage, [])
+    return order
+
+def _maxrss_bytes(maxrss):
+    # ru_maxrss is reported in bytes on macOS and in kilobytes elsewhere
+    return maxrss if sys.platform == "darwin" else maxrss * 1024
+
+def peak_rss_bytes():
+    """Return the high-water mark of this process's resident memory, if available."""
+    if resource is None:
+        return None
+    return _maxrss_bytes(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss)
+
+def wait_with_peak(process):
+    """Wait for a child process and return its exit code and peak RSS in bytes.
+
+    os.wait4 reports the resource usage of that one child, unlike
+    getrusage(RUSAGE_CHILDREN), which is a high-water mark over every child
+    waited for so far. Where wait4 is unavailable (Windows) the peak is None.
+    """
+    if not hasattr(os, 'wait4'):
+        return process.wait(), None
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    return process.returncode, _maxrss_bytes(usage.ru_maxrss)
+
+def stage_peak_memory():
+    """Peak memory for the stage that just ran.
+
+    With tracemalloc active this is the stage's own peak of traced allocations;
+    otherwise it is the process's peak RSS so far.
+    """
+    if tracemalloc.is_tracing():
+        return tracemalloc.get_traced_memory()[1]
+    return peak_rss_bytes()
+
+def load_stage_function(stage):
+    """Import a stage's script module and return its stage function."""
+    return getattr(importlib.import_module(stage.name), stage.function)
+
+def print_stage_header(description):
+    """Print the banner shown before each pipeline stage."""
+    print(f"\n{'='*50}")
+    print(f"🏏 {description}")
+    print(f"{'='*50}")
+
+def print_stage_status(result):
+    """Print the line shown after each pipeline stage."""
+    if result.status == COMPLETED:
+        print(f"\n✅ Completed in {result.elapsed:.2f} seconds")
+    else:
+        print(f"\n❌ Error in {result.name}")
+
+def run_stage_in_process(stage, df=None):
+    """Run a stage in this interpreter, letting its output stream to the console."""
+    if tracemalloc.is_tracing():
+        tracemalloc.reset_peak()
+    start_time = time.time()
+    
+    try:
+        stage_function = load_stage_function(stage)
+        value = stage_function() if df is None else stage_function(df)
+        return StageResult(stage.name, COMPLETED, time.time() - start_time, stage_peak_memory(), None, value)
+    except Exception:
+        traceback.print_exc()
+        return StageResult(stage.name, FAILED, time.time() - start_time, stage_peak_memory(), None, None)
+
+def run_stage_subprocess(stage):
+    """Run a stage's script in a separate interpreter and capture its output.
+
+    The output goes to temporary files rather than pipes so the child can be
+    reaped with wait_with_peak, which also gives the stage's peak memory.
+    """
+    start_time = time.time()
+    with tempfile.TemporaryFile('w+') as stdout, tempfile.TemporaryFile('w+') as stderr:
+        process = subprocess.Popen([sys.executable, f"scripts/{stage.name}.py"],
+                                   stdout=stdout, stderr=stderr, text=True, cwd=os.getcwd())
+        returncode, peak = wait_with_peak(process)
+        stdout.seek(0)
+        stderr.seek(0)
+        stdout_text, stderr_text = stdout.read(), stderr.read()
+    
+    if returncode == 0:
+        return StageResult(stage.name, COMPLETED, time.time() - start_time, peak, stdout_text, None)
+    output = f"{stdout_text}Error output: {stderr_text}Script failed with return code {returncode}"
+    return StageResult(stage.name, FAILED, time.time() - start_time, peak, output, None)
+
+def run_stage_worker(stage):
+    """Process-pool entry point: run a stage with its output captured."""
+    buffer = io.StringIO()
+    start_time = time.time()
+    
+    with contextlib.redirect_stdout(buffer), contextlib.redirect_stderr(buffer):
+        try:
+            load_stage_function(stage)()
+            status = COMPLETED
+        except Exception:
+            traceback.print_exc()
+            status = FAILED
+    
+    return StageResult(stage.name, status, time.time() - start_time, peak_rss_bytes(), buffer.getvalue(), None)
+
+def _blocked_by(stage, results):
+    """Names of dependencies that neither completed nor were cached."""
+    return [dependency for dependency in stage.depends_on if results[dependency].status not in (COMPLETED, CACHED)]
+
+def _skip(stage, blockers):
+    """Record a stage that cannot run because a dependency did not complete."""
+    print(f"\n⏭️ Skipping {stage.name}: depends on {', '.join(blockers)}")
+    return StageResult(stage.name, SKIPPED, 0.0, None, None, None)
+
+def _check_cache(stage, cache, force):
+    """Fingerprint a stage that is ready to run.
+
+    Returns (fingerprint, result), where result is a cached StageResult when the
+    stage's outputs are already up to date and None when it has to run.
+    """
+    if cache is None:
+        return None, None
+    fingerprint = cache.fingerprint(stage)
+    if force or not cache.is_current(stage, fingerprint):
+        return fingerprint, None
+    
+    print_stage_header(stage.description)
+    print("\n♻️ Cached: inputs, config and code unchanged since the last successful run")
+    return fingerprint, StageResult(stage.name, CACHED, 0.0, None, None, None)
+
+def _update_cache(cache, stage, fingerprint, result):
+    """Record the fingerprint of a stage that completed, or forget it if it failed."""
+    if cache is None:
+        return
+    if result.status == COMPLETED:
+        cache.record(stage, fingerprint)
+    else:
+        cache.invalidate(stage)
+
+def _report(stage, result):
+    """Print a finished stage's captured output and status."""
+    print_stage_header(stage.description)
+    if result.output:
+        print(result.output.rstrip('\n'))
+    print_stage_status(result)
+
+def _run_sequential(order, mode, cache, force):
+    """Run stages one at a time in dependency order."""
+    results = {}
+    data = None
+    
+    for stage in order:
+        blockers = _blocked_by(stage, results)
+        if blockers:
+            results[stage.name] = _skip(stage, blockers)
+            continue
+        
+        fingerprint, cached = _check_cache(stage, cache, force)
+        if cached is not None:
+            results[stage.name] = cached
+            continue
+        
+        if mode == 'in-process':
+            print_stage_header(stage.description)
+            result = run_stage_in_process(stage, None if stage.provides_data else data)
+            print_stage_status(result)
+            if stage.provides_data and result.status == COMPLETED:
+                data = result.value
+        else:
+            result = run_stage_subprocess(stage)
+            _report(stage, result)
+        
+        _update_cache(cache, stage, fingerprint, result)
+        results[stage.name] = result
+    
+    return results
+
+def _run_parallel(order, max_workers, cache, force):
+    """Run stages on a process pool as soon as their dependencies complete."""
+    # Import every stage once up front so forked workers inherit the imports
+    for stage in order:
+        try:
+            load_stage_function(stage)
+        except Exception:
+            pass  # The worker reports the error when the stage runs
+    
+    context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+    results = {}
+    running = {}
+    fingerprints = {}
+    pending = list(order)
+    
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        while pending or running:
+            for stage in list(pending):
+                if any(dependency not in results for dependency in stage.depends_on):
+                    continue
+                pending.remove(stage)
+                blockers = _blocked_by(stage, results)
+                if blockers:
+                    results[stage.name] = _skip(stage, blockers)
+                    continue
+                fingerprints[stage.name], cached = _check_cache(stage, cache, force)
+                if cached is not None:
+                    results[stage.name] = cached
+                else:
+                    running[pool.submit(run_stage_worker, stage)] = stage
+            
+            if not running:
+                continue
+            
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = StageResult(stage.name, FAILED, 0.0, None, f"Worker error: {e}", None)
+                _report(stage, result)
+                _update_cache(cache, stage, fingerprints[stage.name], result)
+                results[stage.name] = result
+    
+    return results
+
+def run_pipeline(stages, mode='parallel', max_workers=None, cache=None, force=False):
+    """Run every stage in dependency order and return {stage name: StageResult}.
+
+    mode is 'parallel' (process pool), 'in-process' (one interpreter, the
+    provides_data stage's frame shared with later stages) or 'subprocess'
+    (one interpreter per stage, sequential). With a BuildCache, up-to-date
+    stages are reported as cached instead of being run; force runs them anyway
+    and refreshes their fingerprints.
+    """
+    if mode not in MODES:
+        raise ValueError(f"Unknown pipeline mode '{mode}'")
+    order = topological_order(stages)
+    if mode == 'parallel':
+        return _run_parallel(order, max_workers, cache, force)
+    return _run_sequential(order, mode, cache, force)
@@ -0,0 +1,56 @@
+"""
+Lightweight, immutable player records for the dashboard's detail views.
+
+A PlayerDirectory holds the roster's display columns as NumPy arrays and an
+id -> row position hash map built once at load time. Looking up a player is
+a dictionary probe plus one read per field, instead of a boolean scan over
+the frame and the construction of a pandas Series.
+"""
+
+from typing import NamedTuple
+
+class PlayerRecord(NamedTuple):
+    """One player's display fields."""
+    id: int
+    fullname: str
+    firstname: str
+    lastname: str
+    gender: str
+    country_name: str
+    continent_name: str
+    dateofbirth: str
+    age: float
+    battingstyle: str
+    bowlingstyle: str
+    position: str
+    image_path: str
+
+PLAYER_FIELDS = list(PlayerRecord._fields)
+
+class PlayerDirectory:
+    """Columnar store of player records with O(1) lookup by id or row position."""
+
+    def __init__(self, players):
+        self._columns = [players[field].to_numpy(dtype=object) for field in PLAYER_FIELDS]
+        self.ids = players['id'].to_numpy()
+        # Built back to front so a duplicated id resolves to its first row
+        self._positions = dict(zip(self.ids[::-1].tolist(), range(len(self.ids) - 1, -1, -1)))
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __contains__(self, player_id):
+        return player_id in self._positions
+
+    def position(self, player_id):
+        """Row position of player_id, or -1 if it is not in the directory."""
+        return self._positions.get(player_id, -1)
+
+    def record(self, position):
+        """The player record at a row position."""
+        return PlayerRecord._make(column[position] for column in self._columns)
+
+    def get(self, player_id, default=None):
+        """The record of player_id, or default if it is not in the directory."""
+        position = self._positions.get(player_id, -1)
+        return default if position < 0 else self.record(position)
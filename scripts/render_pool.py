@@ -0,0 +1,85 @@
+"""
+Process pool for rendering the pipeline's charts.
+
+Each chart is a RenderTask: a module-level plot function plus the small
+aggregated data it draws, never the full roster. Tasks are rendered in separate
+processes (matplotlib is not thread-safe) and saved with the configured DPI.
+"""
+
+import multiprocessing
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+# plot is called as plot(**data) and returns the figure to save at path
+RenderTask = namedtuple('RenderTask', ['path', 'plot', 'data'])
+
+def render_task(task):
+    """Draw and save one chart; returns the seconds it took."""
+    start_time = time.time()
+    fig = task.plot(**task.data)
+    try:
+        fig.savefig(task.path, dpi=config.DPI, bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return time.time() - start_time
+
+def render_workers(task_count, workers=None):
+    """Number of processes to render task_count charts with."""
+    if workers is None:
+        workers = config.RENDER_WORKERS
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, task_count))
+
+def render_charts(tasks, workers=None):
+    """Render every task and print one line per saved chart with its render time.
+
+    With a single worker the charts are rendered in this process. A failing
+    chart does not stop the others; a RuntimeError listing the failures is
+    raised once every chart has been attempted.
+
+    Returns {path: seconds} for the charts that were saved.
+    """
+    workers = render_workers(len(tasks), workers)
+    outcomes = []
+
+    if workers == 1:
+        for task in tasks:
+            try:
+                outcomes.append((task, render_task(task), None))
+            except Exception as e:
+                outcomes.append((task, None, e))
+    else:
+        context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            futures = [(task, pool.submit(render_task, task)) for task in tasks]
+            for task, future in futures:
+                try:
+                    outcomes.append((task, future.result(), None))
+                except Exception as e:
+                    outcomes.append((task, None, e))
+
+    timings = {}
+    failures = []
+    for task, elapsed, error in outcomes:
+        if error is None:
+            timings[task.path] = elapsed
+            print(f"Saved: {task.path} (rendered in {elapsed:.2f}s)")
+        else:
+            failures.append(f"{task.path}: {error}")
+            print(f"Failed: {task.path}: {error}")
+
+    if failures:
+        raise RuntimeError(f"{len(failures)} chart(s) failed to render: {'; '.join(failures)}")
+    return timings
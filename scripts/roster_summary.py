@@ -0,0 +1,218 @@
+"""
+Shared summary tables for the cleaned roster.
+
+The analysis, chart and report stages and the dashboard all show the same
+counts: players per country, continent, gender, position and playing style,
+plus a few crosstabs. RosterSummary computes all of them in one pass over the
+categorical codes with np.bincount. The roster_summary stage saves it as JSON
+tagged with a hash of the cleaned roster's contents, so later consumers reuse
+it instead of counting again until the cleaned roster changes.
+"""
+
+import json
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+from build_cache import BuildCache
+from data_store import load_players, replace_atomically
+
+COUNT_COLUMNS = ['country_name', 'continent_name', 'gender', 'position', 'battingstyle', 'bowlingstyle']
+CROSSTABS = [
+    ('continent_name', 'gender'),
+    ('continent_name', 'position'),
+    ('country_name', 'gender'),
+    ('battingstyle', 'bowlingstyle')
+]
+
+def _codes(series):
+    """Integer codes and labels of a column; missing values get the code len(labels)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy().astype(np.int64)
+        labels = series.cat.categories.tolist()
+    else:
+        codes, labels = pd.factorize(series, sort=True)
+        codes = codes.astype(np.int64)
+        labels = labels.tolist()
+    codes[codes < 0] = len(labels)
+    return codes, labels
+
+def _fold_missing(labels, counts, missing, axis):
+    """Apply the missing-value policy to one axis of a count array.
+    
+    The last slot along axis holds the players with no value. It is dropped
+    when missing is None; otherwise it is counted under the label missing,
+    which is added when the column has no such value yet.
+    """
+    counts = np.moveaxis(counts, axis, 0)
+    known, unknown = counts[:-1], counts[-1]
+    if missing is None:
+        folded = known
+    elif missing in labels:
+        folded = known.copy()
+        folded[labels.index(missing)] += unknown
+    else:
+        labels = labels + [missing]
+        folded = counts
+    return labels, np.moveaxis(folded, 0, axis)
+
+class RosterSummary:
+    """Counts and crosstabs of the roster's categorical columns.
+    
+    Counts include a slot for missing values, so callers decide whether
+    missing values are dropped (the default, like value_counts) or shown
+    under a label such as 'Unknown'.
+    """
+    
+    def __init__(self, rows, labels, counts, crosstabs, version=None):
+        self.rows = rows
+        self.labels = labels
+        self._counts = counts
+        self._crosstabs = crosstabs
+        self.version = version
+    
+    @classmethod
+    def from_frame(cls, df, version=None):
+        """Compute every summary table from a roster frame."""
+        codes = {}
+        labels = {}
+        for column in COUNT_COLUMNS:
+            codes[column], labels[column] = _codes(df[column])
+        
+        counts = {
+            column: np.bincount(codes[column], minlength=len(labels[column]) + 1)
+            for column in COUNT_COLUMNS
+        }
+        crosstabs = {}
+        for row, column in CROSSTABS:
+            width = len(labels[column]) + 1
+            cells = np.bincount(codes[row] * width + codes[column], minlength=(len(labels[row]) + 1) * width)
+            crosstabs[(row, column)] = cells.reshape(len(labels[row]) + 1, width)
+        return cls(len(df), labels, counts, crosstabs, version)
+    
+    def counts(self, column, missing=None):
+        """Players per value of a column, largest first, like value_counts().
+        
+        Values without players are left out. With missing set, players with no
+        value are counted under that label.
+        """
+        labels, counts = _fold_missing(self.labels[column], self._counts[column][np.newaxis, :], missing, axis=1)
+        counts = counts[0]
+        order = np.argsort(-counts, kind='stable')
+        order = order[counts[order] > 0]
+        index = pd.Index([labels[i] for i in order], name=column)
+        return pd.Series(counts[order], index=index, name='count')
+    
+    def nunique(self, column):
+        """Number of distinct values of a column that have players."""
+        return int(np.count_nonzero(self._counts[column][:-1]))
+    
+    def crosstab(self, row, column, missing=None, margins=False):
+        """Players per pair of values, like pd.crosstab(df[row], df[column]).
+        
+        Rows and columns without players are left out. With missing set,
+        players with no value are counted under that label.
+        """
+        cells = self._crosstabs[(row, column)]
+        row_labels, cells = _fold_missing(self.labels[row], cells, missing, axis=0)
+        column_labels, cells = _fold_missing(self.labels[column], cells, missing, axis=1)
+        
+        keep_rows = cells.sum(axis=1) > 0
+        keep_columns = cells.sum(axis=0) > 0
+        table = pd.DataFrame(
+            cells[keep_rows][:, keep_columns],
+            index=pd.Index([label for label, keep in zip(row_labels, keep_rows) if keep], name=row),
+            columns=pd.Index([label for label, keep in zip(column_labels, keep_columns) if keep], name=column)
+        )
+        if margins:
+            table['All'] = table.sum(axis=1)
+            table.loc['All'] = table.sum(axis=0)
+        return table
+    
+    def to_dict(self):
+        """JSON-serializable form of the summary."""
+        return {
+            'version': self.version,
+            'rows': self.rows,
+            'labels': self.labels,
+            'counts': {column: counts.tolist() for column, counts in self._counts.items()},
+            'crosstabs': [
+                {'row': row, 'column': column, 'cells': cells.tolist()}
+                for (row, column), cells in self._crosstabs.items()
+            ]
+        }
+    
+    @classmethod
+    def from_dict(cls, data):
+        """Rebuild a summary from to_dict() output."""
+        counts = {column: np.asarray(values, dtype=np.int64) for column, values in data['counts'].items()}
+        crosstabs = {
+            (entry['row'], entry['column']): np.asarray(entry['cells'], dtype=np.int64)
+            for entry in data['crosstabs']
+        }
+        return cls(data['rows'], data['labels'], counts, crosstabs, data['version'])
+
+def read_summary(path=None):
+    """Read the saved summary, or return None if there is none."""
+    path = path or config.SUMMARY_PATH
+    try:
+        with open(path, encoding='utf-8') as f:
+            return RosterSummary.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError):
+        return None
+
+def write_summary(summary, path=None):
+    """Save a summary as JSON."""
+    data = summary.to_dict()
+    
+    def write(tmp_path):
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+    
+    replace_atomically(path or config.SUMMARY_PATH, write)
+
+def content_version():
+    """Identify the cleaned roster on disk by the content hashes of its files.
+    
+    Unlike data_store.data_version, rewriting the files with identical
+    contents keeps the version, just as it keeps the build cache's fingerprint
+    of the roster_summary stage. Hashes the build cache recorded for the
+    files' current size and mtime are reused instead of reading them again.
+    """
+    cache = BuildCache()
+    return "/".join(
+        cache.file_hash(path) or "-" for path in (config.CLEANED_DATA_PATH, config.CLEANED_PARQUET_PATH)
+    )
+
+def load_summary(df=None):
+    """Return the summary of the current cleaned roster.
+    
+    The saved summary is used while its content version matches the cleaned
+    roster on disk; otherwise it is computed from df (or the loaded roster).
+    """
+    version = content_version()
+    summary = read_summary()
+    if summary is not None and summary.version == version:
+        return summary
+    if df is None:
+        df = load_players()
+    return RosterSummary.from_frame(df, version)
+
+def build_roster_summary(df=None):
+    """Compute the summary of the cleaned roster and save it for the later stages."""
+    if df is None:
+        df = load_players()
+    summary = RosterSummary.from_frame(df, content_version())
+    write_summary(summary)
+    print(f"Summarized {summary.rows:,} players: "
+          f"{summary.nunique('country_name')} countries, {summary.nunique('continent_name')} continents")
+    print(f"Summary tables saved to '{config.SUMMARY_PATH}'")
+    return summary
+
+if __name__ == "__main__":
+    build_roster_summary()
@@ -0,0 +1,61 @@
+"""
+Nearest-neighbour search for similar players.
+
+Every player becomes a float32 feature vector: one-hot batting style, bowling
+style, position and continent, plus standardized age, synthetic career stats
+and stroke profile. Neighbours are found by an exact brute-force kernel, one
+matrix-vector product over the whole roster, which takes milliseconds at the
+roster's size and needs no extra dependency.
+"""
+
+import numpy as np
+import pandas as pd
+
+from synthetic_stats import STAT_COLUMNS, STROKE_COLUMNS
+
+CATEGORY_FEATURES = ['battingstyle', 'bowlingstyle', 'position', 'continent_name']
+NUMERIC_FEATURES = ['age']
+
+def build_features(players, stats):
+    """Feature matrix (float32, one row per player) from roster rows and their stats."""
+    parts = [
+        pd.get_dummies(players[column], prefix=column, dtype=np.float32).to_numpy()
+        for column in CATEGORY_FEATURES
+    ]
+    numeric = np.column_stack([
+        players[NUMERIC_FEATURES].to_numpy(dtype=np.float64),
+        stats[STAT_COLUMNS + list(STROKE_COLUMNS.values())].to_numpy(dtype=np.float64)
+    ])
+    numeric = np.nan_to_num(numeric)
+    spread = numeric.std(axis=0)
+    spread[spread == 0] = 1
+    parts.append((numeric - numeric.mean(axis=0)) / spread)
+    return np.hstack(parts).astype(np.float32)
+
+class SimilarPlayers:
+    """Exact k-nearest-neighbour index over player feature vectors."""
+    
+    def __init__(self, players, stats):
+        self.ids = pd.Index(players['id'].to_numpy())
+        self.features = build_features(players, stats)
+        self._norms = np.einsum('ij,ij->i', self.features, self.features)
+    
+    def nearest(self, player_id, k=5):
+        """Row positions and distances of the k players closest to player_id.
+        
+        Returns two empty arrays if the player is not in the index.
+        """
+        matches = self.ids.get_indexer_for([player_id])
+        if len(matches) == 0 or matches[0] < 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        position = matches[0]
+        
+        query = self.features[position]
+        distances = self._norms - 2 * (self.features @ query) + self._norms[position]
+        distances[position] = np.inf
+        k = min(k, len(distances) - 1)
+        if k <= 0:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.float32)
+        nearest = np.argpartition(distances, k - 1)[:k]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return nearest, np.sqrt(np.maximum(distances[nearest], 0))
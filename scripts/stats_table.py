@@ -0,0 +1,131 @@
+"""
+Persisted synthetic stats table.
+
+Materializes the synthetic statistics of every player into a columnar file next
+to the cleaned dataset so the dashboard can look players up by id instead of
+regenerating their numbers on every rerun. Rebuilds are incremental: only
+players whose id, position or batting style changed since the last build (or
+all players, when the generator itself changed) are regenerated.
+"""
+
+import functools
+import hashlib
+import inspect
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+import synthetic_stats
+from data_store import load_players, read_table, write_table
+from synthetic_stats import STAT_COLUMNS, STROKE_COLUMNS, generate_stats_batch, generate_synthetic_stats, stats_from_row
+
+TABLE_STAT_COLUMNS = ['id'] + STAT_COLUMNS + list(STROKE_COLUMNS.values())
+
+@functools.lru_cache(maxsize=None)
+def generator_version():
+    """Return a short hash of the stats generator source code."""
+    source = inspect.getsource(synthetic_stats)
+    return hashlib.sha256(source.encode('utf-8')).hexdigest()[:16]
+
+# Label the dashboard fills missing styles with; hashed like a missing value so
+# filled and raw rosters share the table's keys
+MISSING_LABEL = 'Unknown'
+
+def _normalize(value):
+    """Represent a missing generator input as an empty string."""
+    return '' if pd.isna(value) or value == MISSING_LABEL else str(value)
+
+def input_key(position, battingstyle):
+    """Hash the generator inputs of one player into an unsigned 64-bit key."""
+    text = _normalize(position) + '\x1f' + _normalize(battingstyle)
+    return int.from_bytes(hashlib.blake2b(text.encode('utf-8'), digest_size=8).digest(), 'little')
+
+def input_keys(players):
+    """Return input_key for every player, hashing each distinct input pair once."""
+    position_codes, positions = pd.factorize(players['position'].to_numpy(dtype=object), use_na_sentinel=False)
+    style_codes, styles = pd.factorize(players['battingstyle'].to_numpy(dtype=object), use_na_sentinel=False)
+    pair_codes, pairs = pd.factorize(position_codes * max(len(styles), 1) + style_codes)
+    keys = np.array(
+        [input_key(positions[pair // max(len(styles), 1)], styles[pair % max(len(styles), 1)]) for pair in pairs],
+        dtype=np.uint64
+    )
+    return keys[pair_codes]
+
+def read_stats_table():
+    """Read the persisted stats table, or return None if it has not been built."""
+    return read_table(config.STATS_TABLE_PATH, dtype={'input_key': 'uint64', 'generator_version': str})
+
+def build_stats_table(df=None, force=False):
+    """Build or incrementally refresh the synthetic stats table."""
+    if df is None:
+        df = load_players()
+    
+    version = generator_version()
+    players = df[['id', 'position', 'battingstyle']].drop_duplicates(subset='id').reset_index(drop=True)
+    keys = pd.Series(input_keys(players), index=players['id'])
+    
+    # Keep rows built by this generator version from unchanged inputs
+    existing = None if force else read_stats_table()
+    if existing is not None:
+        existing = existing.set_index('id')
+        current = existing[existing['generator_version'] == version]
+        current = current[current.index.isin(keys.index)]
+        current = current[current['input_key'].to_numpy() == keys.reindex(current.index).to_numpy()]
+        stale = players[~players['id'].isin(current.index)]
+    else:
+        current = None
+        stale = players
+    
+    fresh = generate_stats_batch(stale).set_index('id')
+    fresh['input_key'] = keys.reindex(fresh.index).to_numpy()
+    fresh['generator_version'] = version
+    reused = 0 if current is None else len(current)
+    
+    table = fresh if current is None else pd.concat([current, fresh])
+    table = table.reindex(players['id']).reset_index()
+    path = write_table(table, config.STATS_TABLE_PATH)
+    
+    print(f"Generator version: {version}")
+    print(f"Reused {reused} rows, regenerated {len(fresh)} rows")
+    print(f"Stats table saved to '{path}' ({len(table)} players)")
+    return table
+
+def lookup_stats(table, players):
+    """Return stats for the given players from an id-indexed table.
+
+    Players missing from the table, or whose inputs or generator version no
+    longer match it, are generated on the fly so the result is always current.
+    """
+    positions = table.index.get_indexer(players['id'].to_numpy())
+    found = positions >= 0
+    rows = table.iloc[positions[found]]
+    
+    valid = found.copy()
+    valid[found] = (
+        (rows['generator_version'].to_numpy() == generator_version()) &
+        (rows['input_key'].to_numpy() == input_keys(players[found]))
+    )
+    
+    stats = table.iloc[positions[valid]].reset_index()[TABLE_STAT_COLUMNS]
+    stats.index = players.index[valid]
+    if not valid.all():
+        stats = pd.concat([stats, generate_stats_batch(players[~valid])]).reindex(players.index)
+    return stats
+
+def lookup_player_stats(table, player_data):
+    """Return the stats dictionary of one player from an id-indexed table."""
+    player_id = int(player_data.id)
+    if player_id in table.index:
+        row = table.loc[player_id]
+        if (row['generator_version'] == generator_version() and
+                row['input_key'] == input_key(player_data.position, player_data.battingstyle)):
+            return stats_from_row(row)
+    return generate_synthetic_stats(player_data)
+
+if __name__ == "__main__":
+    build_stats_table()
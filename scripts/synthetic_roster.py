@@ -0,0 +1,273 @@
+"""
+Synthetic raw rosters for scale testing.
+
+Generates rosters with the schema of data/all_players.csv at any size. A
+RosterProfile records the real roster's marginal distributions: value
+frequencies per column, country and continent pairs, the spread of birth
+dates, missing-value rates and duplicate rate. Rows are then sampled from it
+chunk by chunk. Chunks are generated in parallel processes, each from its own
+seeded random stream, so the output does not depend on the number of workers.
+Each worker also formats its own chunk, writing it to a part file next to the
+output; the parent only appends the finished parts in order. For CSV that is
+a byte copy, so formatting the rows is spread across the workers too; Parquet
+parts still have to be encoded by the parent, which writes the single file. With a bounded number of chunks in
+flight, a 10M-row roster is produced in roughly constant memory.
+
+Every generated full name carries the player's id as a numbered suffix, so
+duplicates (same full name and country) only appear where they are injected
+at the requested rate.
+"""
+
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from data_store import DATE_FORMAT, HAS_PARQUET, read_raw_players
+
+ROSTER_COLUMNS = [
+    'id', 'fullname', 'firstname', 'lastname', 'dateofbirth', 'gender', 'battingstyle',
+    'bowlingstyle', 'position', 'country_name', 'continent_name', 'image_path'
+]
+SAMPLED_COLUMNS = ['firstname', 'lastname', 'gender', 'battingstyle', 'bowlingstyle', 'position', 'image_path']
+DUPLICATE_KEY = ['fullname', 'country_name']
+
+CHUNK_SIZE = 250_000
+BIRTH_DATE_JITTER_DAYS = 15
+
+def _frequencies(values):
+    """Distinct non-missing values and their relative frequencies."""
+    counts = pd.Series(values).value_counts()
+    return counts.index.to_numpy(dtype=object), (counts / counts.sum()).to_numpy()
+
+class RosterProfile:
+    """Marginal distributions of a raw roster, to sample synthetic rows from."""
+
+    def __init__(self, df):
+        self.rows = len(df)
+        self.values = {column: _frequencies(df[column]) for column in SAMPLED_COLUMNS}
+        places = df[['country_name', 'continent_name']].dropna()
+        pairs = places['country_name'] + '\x1f' + places['continent_name']
+        labels, self.place_weights = _frequencies(pairs)
+        self.places = np.array([label.split('\x1f') for label in labels], dtype=object).reshape(-1, 2)
+
+        birth_dates = pd.to_datetime(df['dateofbirth'], format=DATE_FORMAT, errors='coerce').dropna()
+        self.birth_days = birth_dates.to_numpy(dtype='datetime64[D]').astype(np.int64)
+
+        self.missing_rates = {column: float(df[column].isna().mean()) for column in ROSTER_COLUMNS if column != 'id'}
+        self.duplicate_rate = float(df.duplicated(subset=DUPLICATE_KEY).mean()) if len(df) else 0.0
+
+    @classmethod
+    def from_csv(cls, path=None):
+        """Profile of a raw roster CSV (default: config.DATA_PATH)."""
+        return cls(read_raw_players(path))
+
+    def sample(self, column, size, rng):
+        """Values of a sampled column, drawn with the profile's frequencies."""
+        values, weights = self.values[column]
+        if len(values) == 0:
+            return np.full(size, None, dtype=object)
+        return values[rng.choice(len(values), size=size, p=weights)]
+
+def generate_chunk(profile, first_id, rows, seed, chunk_index, duplicate_rate=None, missing_rate=None):
+    """Generate rows synthetic players with ids from first_id onwards.
+
+    duplicate_rate is the share of rows that repeat an earlier player of the
+    same chunk under a new id; missing_rate, if given, replaces the profile's
+    missing-value rate of every column but id. Both default to the profile's.
+    """
+    rng = np.random.default_rng([seed, chunk_index])
+    ids = np.arange(first_id, first_id + rows, dtype=np.int64)
+    columns = {column: profile.sample(column, rows, rng) for column in SAMPLED_COLUMNS}
+    places = profile.places[rng.choice(len(profile.places), size=rows, p=profile.place_weights)]
+    columns['country_name'] = places[:, 0]
+    columns['continent_name'] = places[:, 1]
+    columns['fullname'] = (
+        pd.Series(columns['firstname']) + ' ' + pd.Series(columns['lastname']) + ' ' + pd.Series(ids).astype(str)
+    ).to_numpy(dtype=object)
+
+    days = profile.birth_days[rng.integers(0, len(profile.birth_days), size=rows)]
+    days = days + rng.integers(-BIRTH_DATE_JITTER_DAYS, BIRTH_DATE_JITTER_DAYS + 1, size=rows)
+    columns['dateofbirth'] = pd.Series(days.astype('datetime64[D]')).dt.strftime(DATE_FORMAT).to_numpy(dtype=object)
+
+    chunk = pd.DataFrame(columns)
+    chunk.insert(0, 'id', ids)
+    chunk = chunk[ROSTER_COLUMNS]
+
+    # Repeat earlier players of this chunk under new ids
+    if duplicate_rate is None:
+        duplicate_rate = profile.duplicate_rate
+    repeats = np.flatnonzero(rng.random(rows) < duplicate_rate)
+    repeats = repeats[repeats > 0]
+    if len(repeats):
+        originals = (rng.random(len(repeats)) * repeats).astype(np.int64)
+        values = chunk.drop(columns='id').to_numpy(dtype=object)
+        values[repeats] = values[originals]
+        chunk[ROSTER_COLUMNS[1:]] = values
+
+    for column in ROSTER_COLUMNS[1:]:
+        rate = profile.missing_rates[column] if missing_rate is None else missing_rate
+        missing = rng.random(rows) < rate
+        if missing.any():
+            chunk[column] = chunk[column].mask(missing)
+    return chunk
+
+def _parquet_schema():
+    """Arrow schema of a roster file: integer ids, every other column text."""
+    import pyarrow as pa
+    
+    return pa.schema([('id', pa.int64())] + [(column, pa.string()) for column in ROSTER_COLUMNS[1:]])
+
+def write_part(chunk, path):
+    """Write one chunk as a part file: headerless CSV, or uncompressed Arrow IPC for Parquet output."""
+    if path.endswith('.arrow'):
+        import pyarrow as pa
+        import pyarrow.feather as feather
+        
+        table = pa.Table.from_pandas(chunk, schema=_parquet_schema(), preserve_index=False)
+        feather.write_feather(table, path, compression='uncompressed')
+    else:
+        chunk.to_csv(path, index=False, header=False)
+
+_worker_profile = None
+
+def _init_worker(profile):
+    global _worker_profile
+    _worker_profile = profile
+
+def _generate_part_task(part_path, args):
+    write_part(generate_chunk(_worker_profile, *args), part_path)
+    return part_path
+
+class RosterSink:
+    """Append roster chunks or part files to a CSV or Parquet file, replacing it on close()."""
+    
+    def __init__(self, path):
+        self.path = path
+        self.parquet = path.endswith('.parquet')
+        if self.parquet and not HAS_PARQUET:
+            raise ValueError("Writing Parquet requires pyarrow")
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._tmp_path = f"{path}.tmp"
+        self._file = None
+        self._writer = None
+    
+    def part_path(self, index):
+        """Path of the part file for chunk index, next to the output.
+
+        Parquet cannot be concatenated byte for byte, so its parts are Arrow IPC
+        files that the parent maps and encodes without parsing them again.
+        """
+        base, extension = os.path.splitext(self.path)
+        return f"{base}.part{index:05d}{'.arrow' if self.parquet else extension}"
+    
+    def _open(self):
+        """Open the temporary output; CSV output starts with its header row."""
+        if self.parquet:
+            import pyarrow.parquet as pq
+            
+            if self._writer is None:
+                self._writer = pq.ParquetWriter(self._tmp_path, _parquet_schema())
+        elif self._file is None:
+            self._file = open(self._tmp_path, 'w', encoding='utf-8', newline='')
+            self._file.write(','.join(ROSTER_COLUMNS) + '\n')
+    
+    def write(self, chunk):
+        self._open()
+        if self.parquet:
+            import pyarrow as pa
+            
+            self._writer.write_table(pa.Table.from_pandas(chunk, schema=self._writer.schema, preserve_index=False))
+        else:
+            chunk.to_csv(self._file, index=False, header=False)
+    
+    def append_part(self, part_path):
+        """Append a part file written by write_part, then delete it."""
+        self._open()
+        if self.parquet:
+            import pyarrow.feather as feather
+            
+            self._writer.write_table(feather.read_table(part_path, memory_map=True))
+        else:
+            with open(part_path, encoding='utf-8', newline='') as part:
+                shutil.copyfileobj(part, self._file, 1024 * 1024)
+        os.remove(part_path)
+    
+    def close(self):
+        self._open()
+        for handle in (self._writer, self._file):
+            if handle is not None:
+                handle.close()
+        os.replace(self._tmp_path, self.path)
+
+def write_synthetic_roster(path, rows, profile=None, chunk_size=CHUNK_SIZE, workers=None, seed=0,
+                           duplicate_rate=None, missing_rate=None):
+    """Generate a synthetic roster of rows players into path (.csv or .parquet).
+
+    With more than one worker, chunks are generated in a process pool; each
+    worker writes its chunk to a part file, and at most two parts per worker
+    wait to be appended at a time. Returns the number of rows written.
+    """
+    if profile is None:
+        profile = RosterProfile.from_csv()
+    if workers is None or workers <= 0:
+        workers = os.cpu_count() or 1
+    tasks = [
+        (first_id + 1, min(chunk_size, rows - first_id), seed, index, duplicate_rate, missing_rate)
+        for index, first_id in enumerate(range(0, rows, chunk_size))
+    ]
+    sink = RosterSink(path)
+    if workers == 1 or len(tasks) <= 1:
+        for task in tasks:
+            sink.write(generate_chunk(profile, *task))
+    else:
+        context = multiprocessing.get_context('fork') if sys.platform.startswith('linux') else None
+        try:
+            with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                                     initializer=_init_worker, initargs=(profile,)) as pool:
+                pending = deque()
+                for index, task in enumerate(tasks):
+                    if len(pending) >= 2 * workers:
+                        sink.append_part(pending.popleft().result())
+                    pending.append(pool.submit(_generate_part_task, sink.part_path(index), task))
+                while pending:
+                    sink.append_part(pending.popleft().result())
+        finally:
+            # Parts left behind by a failed run are never appended
+            for index in range(len(tasks)):
+                if os.path.exists(sink.part_path(index)):
+                    os.remove(sink.part_path(index))
+    sink.close()
+    return rows
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic raw roster shaped like data/all_players.csv")
+    parser.add_argument('output', help="output file, .csv or .parquet")
+    parser.add_argument('--rows', type=int, default=1_000_000, help="players to generate (default: 1,000,000)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help=f"rows per chunk (default: {CHUNK_SIZE:,})")
+    parser.add_argument('--workers', type=int, default=0, help="generator processes (default: one per CPU)")
+    parser.add_argument('--seed', type=int, default=0, help="random seed (default: 0)")
+    parser.add_argument('--duplicate-rate', type=float, help="share of duplicated players (default: as in the real roster)")
+    parser.add_argument('--missing-rate', type=float, help="share of missing values per column (default: as in the real roster)")
+    parser.add_argument('--source', help="roster to profile (default: the configured raw roster)")
+    args = parser.parse_args()
+
+    start_time = time.time()
+    profile = RosterProfile.from_csv(args.source)
+    write_synthetic_roster(args.output, args.rows, profile, chunk_size=args.chunk_size, workers=args.workers,
+                           seed=args.seed, duplicate_rate=args.duplicate_rate, missing_rate=args.missing_rate)
+    print(f"Generated {args.rows:,} players from a {profile.rows:,}-row profile into {args.output} "
+          f"in {time.time() - start_time:.1f}s")
+
+if __name__ == "__main__":
+    main()
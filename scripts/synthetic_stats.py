@@ -0,0 +1,189 @@
+"""
+Synthetic gameplay statistics for demonstration purposes.
+
+Every player gets a deterministic random stream keyed by their id, and each
+quantity reads from a fixed slot of that stream. A player's numbers therefore
+never depend on which other players are generated alongside them, so the
+single-player and batch APIs return identical values.
+"""
+
+import numpy as np
+import pandas as pd
+
+BATTING_STROKES = [
+    'Straight Drive', 'Cover Drive', 'Off Drive', 'On Drive',
+    'Pull', 'Hook', 'Cut', 'Square Cut', 'Late Cut',
+    'Leg Glide', 'Glance', 'Sweep'
+]
+
+# Base usage range (low inclusive, high exclusive) for each stroke
+STROKE_RANGES = {
+    'Straight Drive': (15, 25),
+    'Cover Drive': (10, 20),
+    'Off Drive': (8, 18),
+    'On Drive': (8, 18),
+    'Pull': (5, 15),
+    'Hook': (3, 12),
+    'Cut': (8, 18),
+    'Square Cut': (5, 15),
+    'Late Cut': (3, 12),
+    'Leg Glide': (8, 18),
+    'Glance': (10, 20),
+    'Sweep': (2, 10)
+}
+
+STROKE_COLUMNS = {stroke: 'stroke_' + stroke.lower().replace(' ', '_') for stroke in BATTING_STROKES}
+
+STAT_COLUMNS = [
+    'matches', 'runs', 'batting_avg', 'strike_rate', 'centuries', 'fifties',
+    'wickets', 'bowling_avg', 'economy_rate', 'five_wickets', 'catches', 'stumpings'
+]
+
+FLOAT_STAT_COLUMNS = ['batting_avg', 'strike_rate', 'bowling_avg', 'economy_rate']
+
+# Stream slot used by each random quantity
+_SLOT_NAMES = [
+    'matches', 'runs', 'strike_rate', 'centuries', 'fifties', 'wickets',
+    'bowling_avg', 'economy_rate', 'five_wickets', 'catches', 'stumpings'
+] + BATTING_STROKES
+_SLOTS = {name: i for i, name in enumerate(_SLOT_NAMES)}
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+
+def _mix64(x):
+    """SplitMix64 finalizer applied element-wise to a uint64 array."""
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+def _player_uniforms(ids):
+    """Return an (n_players, n_slots) array of uniforms in [0, 1) keyed by player id."""
+    keys = _mix64(np.asarray(ids, dtype=np.int64).astype(np.uint64) * _GOLDEN)
+    counters = np.arange(1, len(_SLOT_NAMES) + 1, dtype=np.uint64) * _GOLDEN
+    bits = _mix64(keys[:, None] + counters[None, :])
+    return (bits >> np.uint64(11)).astype(np.float64) * (1.0 / 9007199254740992.0)
+
+def _randint(u, low, high):
+    """Map uniforms to integers in [low, high), like np.random.randint."""
+    return low + np.floor(u * (high - low)).astype(np.int64)
+
+def _uniform(u, low, high):
+    """Map uniforms to floats in [low, high), like np.random.uniform."""
+    return low + u * (high - low)
+
+def _contains(values, *words):
+    """Case-insensitive test for any of the words; missing values never match.
+
+    Only the distinct values are tested, so the cost scales with the number of
+    categories rather than the number of players.
+    """
+    codes, uniques = pd.factorize(np.asarray(values, dtype=object))
+    hits = np.array([any(word in str(value).lower() for word in words) for value in uniques] + [False])
+    return hits[codes]
+
+def _compute_columns(ids, positions, batting_styles):
+    """Compute every statistic column for the given players as NumPy arrays."""
+    ids = np.asarray(ids, dtype=np.int64)
+    u = _player_uniforms(ids)
+    slot = lambda name: u[:, _SLOTS[name]]
+    
+    is_batter = _contains(positions, 'batsman', 'allrounder')
+    is_bowler = _contains(positions, 'bowler', 'allrounder')
+    is_keeper = _contains(positions, 'wicketkeeper')
+    is_left = _contains(batting_styles, 'left')
+    
+    # Base stats depending on position
+    matches = np.where(is_batter, _randint(slot('matches'), 50, 300), _randint(slot('matches'), 30, 200))
+    runs = np.where(is_batter, _randint(slot('runs'), 1000, 8000), _randint(slot('runs'), 100, 2000))
+    batting_avg = runs / np.maximum(matches * np.where(is_batter, 0.8, 0.4), 1)
+    strike_rate = np.where(is_batter, _uniform(slot('strike_rate'), 70, 140), _uniform(slot('strike_rate'), 60, 120))
+    centuries = np.where(is_batter, _randint(slot('centuries'), 0, np.maximum(1, runs // 2000)), 0)
+    fifties = np.where(
+        is_batter,
+        _randint(slot('fifties'), centuries, np.maximum(centuries + 1, runs // 800)),
+        _randint(slot('fifties'), 0, 3)
+    )
+    
+    wickets = np.where(is_bowler, _randint(slot('wickets'), 20, 400), _randint(slot('wickets'), 0, 20))
+    bowling_avg = np.where(
+        is_bowler,
+        _uniform(slot('bowling_avg'), 15, 35),
+        np.where(wickets > 0, _uniform(slot('bowling_avg'), 30, 50), 0.0)
+    )
+    economy_rate = np.where(is_bowler, _uniform(slot('economy_rate'), 3.5, 6.5), _uniform(slot('economy_rate'), 4, 8))
+    five_wickets = np.where(is_bowler, _randint(slot('five_wickets'), 0, np.maximum(1, wickets // 50)), 0)
+    
+    catches = np.where(
+        is_keeper,
+        _randint(slot('catches'), np.maximum(1, matches // 2), matches + 1),
+        _randint(slot('catches'), 0, np.maximum(1, matches // 3) + 1)
+    )
+    stumpings = np.where(is_keeper, _randint(slot('stumpings'), 0, np.maximum(1, matches // 10) + 1), 0)
+    
+    # Batting stroke preferences, adjusted for batting hand and aggression
+    strokes = {stroke: _randint(slot(stroke), low, high) for stroke, (low, high) in STROKE_RANGES.items()}
+    strokes['On Drive'] = strokes['On Drive'] + np.where(is_left, 5, 0)
+    strokes['Leg Glide'] = strokes['Leg Glide'] + np.where(is_left, 5, 0)
+    strokes['Pull'] = strokes['Pull'] + np.where(is_left, 3, 0)
+    strokes['Cover Drive'] = strokes['Cover Drive'] + np.where(is_left, 0, 5)
+    strokes['Off Drive'] = strokes['Off Drive'] + np.where(is_left, 0, 3)
+    strokes['Cut'] = strokes['Cut'] + np.where(is_left, 0, 3)
+    
+    aggressive = strike_rate > 120
+    strokes['Pull'] = strokes['Pull'] + np.where(aggressive, 8, 0)
+    strokes['Hook'] = strokes['Hook'] + np.where(aggressive, 5, 0)
+    strokes['Cut'] = strokes['Cut'] + np.where(aggressive, 5, 0)
+    
+    columns = {
+        'id': ids,
+        'matches': matches,
+        'runs': runs,
+        'batting_avg': np.round(batting_avg, 2),
+        'strike_rate': np.round(strike_rate, 2),
+        'centuries': centuries,
+        'fifties': fifties,
+        'wickets': wickets,
+        'bowling_avg': np.round(bowling_avg, 2),
+        'economy_rate': np.round(economy_rate, 2),
+        'five_wickets': five_wickets,
+        'catches': catches,
+        'stumpings': stumpings
+    }
+    for stroke in BATTING_STROKES:
+        columns[STROKE_COLUMNS[stroke]] = strokes[stroke]
+    return columns
+
+def generate_stats_batch(players=None, ids=None, positions=None, batting_styles=None):
+    """Generate synthetic statistics for many players in one vectorized pass.
+
+    Accepts either a DataFrame with id, position and battingstyle columns or the
+    three equivalent arrays. Returns one row per player (aligned to the input
+    index when a DataFrame is given) with an id column, the scalar statistics
+    and one stroke_* column per batting stroke.
+    """
+    index = None
+    if players is not None:
+        index = players.index
+        ids = players['id'].to_numpy()
+        positions = players['position'].to_numpy()
+        batting_styles = players['battingstyle'].to_numpy()
+    
+    return pd.DataFrame(_compute_columns(ids, positions, batting_styles), index=index)
+
+def stats_from_row(row):
+    """Convert one row of a batch stats frame into the per-player stats dictionary."""
+    stats = {}
+    for column in STAT_COLUMNS:
+        value = row[column]
+        stats[column] = float(value) if column in FLOAT_STAT_COLUMNS else int(value)
+    stats['batting_strokes'] = {stroke: int(row[STROKE_COLUMNS[stroke]]) for stroke in BATTING_STROKES}
+    return stats
+
+def generate_synthetic_stats(player_data):
+    """Generate synthetic gameplay statistics for demonstration.
+
+    player_data is any object with id, position and battingstyle attributes,
+    such as a PlayerRecord or a roster row.
+    """
+    columns = _compute_columns([int(player_data.id)], [player_data.position], [player_data.battingstyle])
+    return stats_from_row({name: values[0] for name, values in columns.items()})
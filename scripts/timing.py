@@ -0,0 +1,114 @@
+"""
+Span timings for the dashboard's reruns.
+
+Functions wrapped with @timed and blocks wrapped in span() record how long
+they took, nested under whatever span was open when they started. Each
+Streamlit session reruns its script on its own thread, so spans are collected
+per thread between start_run() and finish_run().
+
+Timing is enabled by config.APP_TIMING or the CRICKET_TIMING environment
+variable, read once at import. When disabled, @timed returns the function
+unchanged and span() returns a shared no-op context manager, so the
+instrumentation costs nothing.
+"""
+
+import contextlib
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import config
+
+ENABLED = config.APP_TIMING or os.environ.get('CRICKET_TIMING', '') not in ('', '0')
+
+_NO_SPAN = contextlib.nullcontext()
+_local = threading.local()
+_log_lock = threading.Lock()
+
+class _Span:
+    """An open span; records itself on the current run when it closes."""
+
+    __slots__ = ('name', 'start', 'depth')
+
+    def __init__(self, name):
+        self.name = name
+
+    def __enter__(self):
+        self.depth = getattr(_local, 'depth', 0)
+        _local.depth = self.depth + 1
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        _local.depth = self.depth
+        spans = getattr(_local, 'spans', None)
+        if spans is not None:
+            spans.append({
+                'name': self.name,
+                'depth': self.depth,
+                'start_ms': (self.start - _local.run_start) * 1000,
+                'duration_ms': (end - self.start) * 1000
+            })
+        return False
+
+def span(name):
+    """Context manager timing the enclosed block as a span called name."""
+    return _Span(name) if ENABLED else _NO_SPAN
+
+def timed(function=None, name=None):
+    """Decorator timing every call of a function as a span.
+
+    Usable bare (@timed) or with a span name (@timed(name='load')); the span
+    is named after the function by default.
+    """
+    if function is None:
+        return functools.partial(timed, name=name)
+    if not ENABLED:
+        return function
+    label = name or function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        with _Span(label):
+            return function(*args, **kwargs)
+    return wrapper
+
+def start_run():
+    """Start collecting the spans of a new rerun on this thread."""
+    if ENABLED:
+        _local.spans = []
+        _local.depth = 0
+        _local.run_start = time.perf_counter()
+
+def finish_run(page, log_path=None):
+    """Stop collecting and append the rerun to the JSONL log.
+
+    Returns the logged record (time, page, total_ms and the spans in start
+    order), or None when timing is disabled or no run was started.
+    """
+    spans = getattr(_local, 'spans', None)
+    if not ENABLED or spans is None:
+        return None
+    _local.spans = None
+    spans.sort(key=lambda entry: entry['start_ms'])
+
+    log_path = log_path or config.TIMING_LOG_PATH
+    if os.path.dirname(log_path):
+        os.makedirs(os.path.dirname(log_path), exist_ok=True)
+    record = {
+        'time': datetime.now().isoformat(timespec='milliseconds'),
+        'page': page,
+        'total_ms': (time.perf_counter() - _local.run_start) * 1000,
+        'spans': spans
+    }
+    line = json.dumps(record, ensure_ascii=False) + '\n'
+    with _log_lock, open(log_path, 'a', encoding='utf-8') as f:
+        f.write(line)
+    return record
@@ -0,0 +1,45 @@
+"""
+Shared setup for the tests: the scripts and the dashboard are imported the
+way app.py imports them, and every test runs in a workspace whose data/
+folder holds the cleaned sample roster of tests/fixtures/sample_players.csv
+and its stats table, built once per session.
+"""
+
+import os
+import shutil
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'scripts'))
+
+import config
+
+SAMPLE_ROSTER = os.path.join(ROOT, 'tests', 'fixtures', 'sample_players.csv')
+
+@pytest.fixture(scope='session')
+def workspace(tmp_path_factory):
+    """A folder with the sample roster cleaned into its data/ folder."""
+    from clean_data import clean_data
+    from stats_table import build_stats_table
+    
+    path = tmp_path_factory.mktemp('workspace')
+    raw_path = path / config.DATA_PATH
+    raw_path.parent.mkdir(parents=True)
+    shutil.copyfile(SAMPLE_ROSTER, raw_path)
+    previous_directory = os.getcwd()
+    os.chdir(path)
+    try:
+        clean_data()
+        build_stats_table()
+    finally:
+        os.chdir(previous_directory)
+    return path
+
+@pytest.fixture(autouse=True)
+def in_workspace(workspace, monkeypatch):
+    """Run each test from the workspace, where the configured data paths point."""
+    monkeypatch.chdir(workspace)
+    return workspace
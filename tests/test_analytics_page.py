@@ -0,0 +1,27 @@
+"""
+Headless renders of the Analytics page with Streamlit's AppTest.
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+
+APP_PATH = os.path.join(ROOT, 'app.py')
+TIMEOUT_SECONDS = 120
+
+def open_analysis(analysis):
+    """Run the app, open the Analytics page and pick one analysis."""
+    app = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT_SECONDS)
+    app.run()
+    app.sidebar.selectbox[0].select("📊 Analytics").run()
+    analyses = next(box for box in app.main.selectbox if box.label == "Select Analysis:")
+    analyses.select(analysis).run()
+    return app
+
+def test_age_analysis_renders():
+    app = open_analysis("Age Analysis")
+    assert not app.exception, [error.value for error in app.exception]
+    assert any("Age Analysis" in markdown.value for markdown in app.markdown)
+    assert len(app.get('plotly_chart')) == 1
@@ -0,0 +1,18 @@
+"""
+Dtype handling of the roster frames.
+"""
+
+import pandas as pd
+
+from data_store import compact_frame
+
+def test_compact_frame_categorizes_text_columns():
+    df = pd.DataFrame({
+        'country_name': pd.Series(['India', 'England'] * 50, dtype=object),
+        'position': pd.Series(['Batsman', 'Bowler'] * 50, dtype='string'),
+        'fullname': [f"Player {number}" for number in range(100)]
+    })
+    compact = compact_frame(df)
+    assert isinstance(compact['country_name'].dtype, pd.CategoricalDtype)
+    assert isinstance(compact['position'].dtype, pd.CategoricalDtype)
+    assert not isinstance(compact['fullname'].dtype, pd.CategoricalDtype)
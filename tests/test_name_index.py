@@ -0,0 +1,41 @@
+"""
+Ranking of NameIndex.search against a plain substring scan.
+"""
+
+import numpy as np
+
+from data_store import load_players
+from name_index import NameIndex
+
+def scan(names, query):
+    """Rows containing query, ranked by match class, first match offset, name and row."""
+    def key(position):
+        name = names[position]
+        if name == query:
+            match = 0
+        elif name.startswith(query):
+            match = 1
+        elif f" {query}" in name:
+            match = 2
+        else:
+            match = 3
+        return (match, name.find(query), name, position)
+    return sorted((position for position, name in enumerate(names) if query in name), key=key)
+
+def test_search_matches_scan():
+    index = NameIndex(load_players()['fullname'])
+    rng = np.random.default_rng(0)
+    samples = rng.choice(len(index), size=40, replace=False)
+    queries = ['a', 'sh', 'sha', ' a', 'e s', 'zzzz', 'kumar']
+    queries += [index.names[position][start:start + size]
+                for position, start, size in zip(samples, rng.integers(0, 5, 40), rng.integers(1, 8, 40))]
+    for query in queries:
+        expected = scan(index.names, query)
+        assert index.search(query).tolist() == expected, query
+        assert index.search(query, limit=5).tolist() == expected[:5], query
+
+def test_search_is_case_insensitive():
+    index = NameIndex(['Virat Kohli', 'Kohli Virat', 'Rohit Sharma', None])
+    assert index.search('KOHLI').tolist() == [1, 0]
+    assert index.search('vir', limit=1).tolist() == [0]
+    assert index.search('xyz').tolist() == []
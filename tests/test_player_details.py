@@ -0,0 +1,25 @@
+"""
+Player detail charts.
+"""
+
+import numpy as np
+
+from dashboard.data import build_roster
+from dashboard.player_details import create_player_performance_charts
+from player_records import PlayerDirectory
+from synthetic_stats import generate_synthetic_stats
+
+def test_performance_charts_leave_global_rng_alone():
+    directory = PlayerDirectory(build_roster()[0])
+    player = next(directory.record(position) for position in range(len(directory))
+                  if generate_synthetic_stats(directory.record(position))['runs'] > 500)
+    stats = generate_synthetic_stats(player)
+    
+    np.random.seed(0)
+    before = np.random.get_state()[1].copy()
+    _, first = create_player_performance_charts(player, stats)
+    assert (np.random.get_state()[1] == before).all()
+    
+    # The career progression is still the same for the same player
+    _, second = create_player_performance_charts(player, stats)
+    assert list(first.data[0].y) == list(second.data[0].y)
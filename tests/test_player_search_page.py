@@ -0,0 +1,28 @@
+"""
+Headless renders of the Player Search page with Streamlit's AppTest.
+"""
+
+import os
+
+from streamlit.testing.v1 import AppTest
+
+from conftest import ROOT
+from data_store import load_players
+
+APP_PATH = os.path.join(ROOT, 'app.py')
+TIMEOUT_SECONDS = 120
+
+def test_players_sharing_a_name_get_distinct_options():
+    df = load_players()
+    shared = df['fullname'][df['fullname'].duplicated()].dropna().iloc[0]
+    
+    app = AppTest.from_file(APP_PATH, default_timeout=TIMEOUT_SECONDS)
+    app.run()
+    app.sidebar.selectbox[0].select("👤 Player Search").run()
+    app.text_input[0].input(shared).run()
+    assert not app.exception, [error.value for error in app.exception]
+    
+    players = next(box for box in app.main.selectbox if box.label == "Select a player:")
+    exact = [label for label in players.options if label.startswith(f"{shared} (")]
+    assert len(exact) >= 2
+    assert len(set(exact)) == len(exact)
@@ -0,0 +1,32 @@
+"""
+Reuse of the saved roster summary.
+"""
+
+import os
+import shutil
+
+import config
+import roster_summary
+
+def fail_load(*args, **kwargs):
+    raise AssertionError("the summary was recomputed instead of read from disk")
+
+def test_summary_survives_identical_rewrite(tmp_path, monkeypatch):
+    for key in ('CLEANED_DATA_PATH', 'CLEANED_PARQUET_PATH'):
+        path = str(tmp_path / os.path.basename(getattr(config, key)))
+        shutil.copyfile(getattr(config, key), path)
+        monkeypatch.setattr(config, key, path)
+    monkeypatch.setattr(config, 'SUMMARY_PATH', str(tmp_path / 'roster_summary.json'))
+    monkeypatch.setattr(config, 'BUILD_CACHE_PATH', str(tmp_path / 'build_cache.json'))
+    saved = roster_summary.build_roster_summary()
+    
+    # Rewrite the cleaned roster with identical contents but a new mtime
+    for path in (config.CLEANED_DATA_PATH, config.CLEANED_PARQUET_PATH):
+        shutil.copyfile(path, f"{path}.tmp")
+        os.replace(f"{path}.tmp", path)
+        os.utime(path, ns=(0, os.stat(path).st_mtime_ns + 10**9))
+    
+    monkeypatch.setattr(roster_summary, 'load_players', fail_load)
+    summary = roster_summary.load_summary()
+    assert summary.version == saved.version
+    assert summary.rows == saved.rows
@@ -0,0 +1,40 @@
+"""
+Stats table lookups for the dashboard's roster.
+"""
+
+import config
+import stats_table
+from dashboard.data import build_roster
+from data_store import data_version
+from player_records import PlayerDirectory
+
+def fail_generation(*args, **kwargs):
+    raise AssertionError("stats were regenerated instead of read from the table")
+
+def test_missing_batting_style_hits_table(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'STATS_TABLE_PATH', str(tmp_path / 'synthetic_stats.parquet'))
+    stats_table.build_stats_table()
+    table = stats_table.read_stats_table().set_index('id')
+    
+    # The dashboard shows missing batting styles as 'Unknown'
+    df, _ = build_roster()
+    raw = stats_table.load_players().set_index('id')['battingstyle']
+    missing = df[df['id'].map(raw).isna().to_numpy()]
+    assert len(missing) > 0
+    assert (missing['battingstyle'] == stats_table.MISSING_LABEL).all()
+    
+    monkeypatch.setattr(stats_table, 'generate_stats_batch', fail_generation)
+    monkeypatch.setattr(stats_table, 'generate_synthetic_stats', fail_generation)
+    stats = stats_table.lookup_stats(table, missing)
+    expected = table.loc[missing['id'], 'runs'].to_numpy()
+    assert (stats['runs'].to_numpy() == expected).all()
+    
+    player = PlayerDirectory(missing).record(0)
+    assert stats_table.lookup_player_stats(table, player)['runs'] == table.loc[player.id, 'runs']
+
+def test_republished_table_changes_data_version(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, 'STATS_TABLE_PATH', str(tmp_path / 'synthetic_stats.parquet'))
+    stats_table.build_stats_table()
+    before = data_version()
+    stats_table.build_stats_table(force=True)
+    assert data_version() != before